@@ -21,15 +21,307 @@ import pexpect
 import sys
 import threading
 import os
+import select
+import subprocess
+import Queue
+import time
+import signal
+import errno
+import gzip
+
+KILL_DEADLINE=5         # seconds a canceled process group gets to terminate before SIGKILL is sent
+ERROR_READER_TIMEOUT=1  # seconds to wait for the stderr reader of a closed pipe process
+
+TRACE_FILENAME="collectNWDataGUI.trc"
+TRACE_BUFFER_SIZE=65536         # bytes of trace data collected before they are written
+TRACE_FLUSH_INTERVAL=2          # seconds after which buffered trace data is written anyway
+TRACE_MAX_SIZE=20*1024*1024     # bytes of a trace file on disk (compressed if gzip is used) before the file is rotated
+TRACE_BACKUPS=3                 # rotated trace files kept as <name>.1 ... <name>.n
+TRACE_COMPRESS=False            # write trace files gzip compressed (<name>.gz, <name>.1.gz ... <name>.n.gz)
+
+#    SIGTERM to the process group of pid and SIGKILL to whatever is left of it after deadline seconds.
+#    isalive is called to reap the group leader
+
+def terminateProcessGroup(pid,isalive,deadline=KILL_DEADLINE):
+    try:
+        os.killpg(pid,signal.SIGTERM)
+    except OSError:
+        return
+    end=time.time()+deadline
+    while time.time() < end:
+        isalive()
+        try:
+            os.killpg(pid,0)
+        except OSError:         # group is empty
+            return
+        time.sleep(0.05)
+    try:
+        os.killpg(pid,signal.SIGKILL)
+    except OSError:
+        pass
+
+#    resource usage of a command. rusage is the one of the reaped child including all its reaped descendants
+
+def resourceUsage(rusage,wallTime,bytesRead):
+    usage={'wallTime': round(wallTime,3), 'bytesRead': bytesRead}
+    if rusage is not None:
+        usage['userTime']=round(rusage.ru_utime,3)
+        usage['systemTime']=round(rusage.ru_stime,3)
+        usage['maxRSS']=rusage.ru_maxrss                  # KB
+    return usage
+
+#    File object for the debug trace of the command output (pexpect logfile_read). pexpect calls flush()
+#    after every chunk, so data is kept in a bounded buffer and only written when the buffer is full or
+#    the flush interval passed. All commands append to the same trace file which is rotated when it
+#    reached maxSize bytes
+
+class TraceLog:
+
+    def __init__(self,fileName=TRACE_FILENAME,bufferSize=TRACE_BUFFER_SIZE,flushInterval=TRACE_FLUSH_INTERVAL,
+                 maxSize=TRACE_MAX_SIZE,backups=TRACE_BACKUPS,compress=TRACE_COMPRESS):
+        self._fileName=fileName
+        self._bufferSize=bufferSize
+        self._flushInterval=flushInterval
+        self._maxSize=maxSize
+        self._backups=backups
+        self._compress=compress
+        self._buffer=[]
+        self._buffered=0
+        self._lastFlush=time.time()
+        self._file=self._open()
+
+#    name of the trace file (index 0) or of a rotated one
+
+    def _name(self,index=0):
+        name=self._fileName if index == 0 else "%s.%d" % (self._fileName,index)
+        if self._compress:
+            name+=".gz"
+        return name
+
+    def _open(self):
+        name=self._name()
+        if self._compress:
+            return gzip.open(name,"ab")         # appends a new gzip member
+        return open(name,"ab")
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self._backups-1,0,-1):
+            if os.path.exists(self._name(i)):
+                os.rename(self._name(i),self._name(i+1))
+        if self._backups > 0:
+            os.rename(self._name(),self._name(1))
+        else:
+            os.remove(self._name())
+        self._file=self._open()
+
+    def write(self,data):
+        self._buffer.append(data)
+        self._buffered+=len(data)
+        if self._buffered >= self._bufferSize:
+            self.sync()
+
+    def flush(self):
+        if time.time()-self._lastFlush >= self._flushInterval:
+            self.sync()
+
+    def sync(self):
+        if self._buffer:
+            data=''.join(self._buffer)
+            self._buffer=[]
+            self._buffered=0
+            size=os.fstat(self._file.fileno()).st_size     # flushed by the previous sync
+            if self._compress:
+                full=size >= self._maxSize          # compressed size of data is unknown before it's written
+            else:
+                full=size+len(data) > self._maxSize
+            if full and size > 0:
+                self._rotate()
+            self._file.write(data)
+        self._file.flush()
+        self._lastFlush=time.time()
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file=None
+
+#    Popen.poll() (options=os.WNOHANG) or Popen.wait() which keeps the rusage of the child in child.rusage
+
+def reapChild(child,options=0):
+    if child.returncode is None:
+        (pid,status,rusage)=os.wait4(child.pid,options)
+        if pid == 0:
+            return None
+        child.rusage=rusage
+        child._handle_exitstatus(status)
+    return child.returncode
+
+class AsynchronousFileReader(threading.Thread):
+    def __init__(self, fd, queue):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self._fd = fd
+        self._queue = queue
+ 
+    def run(self):
+        for line in iter(self._fd.readline, ''):
+            self._queue.put(line)
+ 
+    def eof(self):
+        return not self.is_alive() and self._queue.empty() 
+
+#    Child connected with plain pipes instead of a pty. Offers the parts of pexpect.spawn used by
+#    CommandExecutor. stdout is read with select, stderr is collected by a reader thread
+
+class PipeProcess:
+
+    def __init__(self,commandLine):
+        self._child=subprocess.Popen(pexpect.split_command_line(commandLine),stdin=open(os.devnull),
+                                     stdout=subprocess.PIPE,stderr=subprocess.PIPE,close_fds=True,preexec_fn=os.setsid)
+        self.pid=self._child.pid
+        self._stdout=self._child.stdout.fileno()
+        self._buffer=''
+        self._eof=False
+        self._errors=[]
+        self._errorQueue=Queue.Queue()
+        self._errorReader=AsynchronousFileReader(self._child.stderr,self._errorQueue)
+        self._errorReader.start()
+        self.after=''
+        self.exitstatus=None
+        self.signalstatus=None
+        self.rusage=None
+        self.logfile_read=None
+        self.closed=False
+
+    @property
+    def before(self):
+        return self.errors()
+
+    def errors(self):
+        while True:
+            try:
+                self._errors.append(self._errorQueue.get_nowait())
+            except Queue.Empty:
+                break
+        return ''.join(self._errors)
+
+    def readErrors(self):
+        start=len(self._errors)
+        self.errors()
+        return self._errors[start:]
+
+    def fileno(self):
+        return self._stdout
+
+    def _reap(self,options):
+        if reapChild(self._child,options) is None:
+            return False
+        self.rusage=getattr(self._child,'rusage',None)
+        return True
+
+    def isalive(self):
+        if not self._reap(os.WNOHANG):
+            return True
+        self._setStatus()
+        return False
+
+    def _setStatus(self):
+        if self._child.returncode < 0:
+            self.exitstatus=None
+            self.signalstatus=-self._child.returncode
+        else:
+            self.exitstatus=self._child.returncode
+            self.signalstatus=None
+
+    def _read(self,size,timeout):
+        if self._eof:
+            raise pexpect.EOF('End Of File (EOF). Pipe closed.')
+        r,w,e=select.select([self._stdout],[],[],timeout)
+        if not r:
+            raise pexpect.TIMEOUT('Timeout exceeded in read_nonblocking().')
+        data=os.read(self._stdout,size)
+        if not data:
+            self._eof=True
+            raise pexpect.EOF('End Of File (EOF). Pipe closed.')
+        if self.logfile_read is not None:
+            self.logfile_read.write(data)
+            self.logfile_read.flush()
+        return data
+
+    def read_nonblocking(self,size=1,timeout=-1):
+        if self._buffer:
+            data=self._buffer[:size]
+            self._buffer=self._buffer[size:]
+            return data
+        if timeout == -1:
+            timeout=30
+        return self._read(size,timeout)
+
+    def readline(self,size=-1):
+        while '\n' not in self._buffer and not self._eof:
+            try:
+                self._buffer+=self._read(65536,None)
+            except pexpect.EOF:
+                break
+        end=self._buffer.find('\n')+1
+        if end == 0:
+            end=len(self._buffer)
+        if size >= 0:
+            end=min(end,size)
+        line=self._buffer[:end]
+        self._buffer=self._buffer[end:]
+        return line
+
+    def readlines(self):
+        lines=[]
+        while True:
+            line=self.readline()
+            if not line:
+                return lines
+            lines.append(line)
+
+#    the process group is terminated if the child or one of its descendants is still running after
+#    a grace period, with and without force (force is accepted for compatibility with pexpect.spawn)
+
+    def close(self,force=True):
+        if self.closed:
+            return
+        self._child.stdout.close()
+        if self.isalive():
+            time.sleep(0.1)         # give the child a chance to exit after closing its stdout
+        self._errorReader.join(0.1)
+        if self.isalive() or self._errorReader.is_alive():     # stderr still open in the group
+            terminateProcessGroup(self.pid,self.isalive)
+        self._reap(0)
+        self._errorReader.join(ERROR_READER_TIMEOUT)
+        self._setStatus()
+        self.closed=True
 
 class CommandExecutor:
 
-    def __init__(self,command,parameters="",password=None,async=False,debug=False):
+    def __init__(self,command,parameters="",password=None,async=False,debug=False,pipes=False,timeout=None,killDeadline=KILL_DEADLINE):
         self._command=command
         self._parameters=parameters
         self._password=password
         self._asyncronous=async
         self._debug=debug
+        self._pipes=pipes and not password      # the password prompt of su requires a pty
+        self._errors=''
+        self._status=None
+        self._process=None
+        self._timeout=timeout                   # wall clock seconds until the command is canceled
+        self._killDeadline=killDeadline
+        self._timer=None
+        self._killTimer=None
+        self._pid=None
+        self._isalive=None
+        self.timedOut=False
+        self._started=None
+        self._bytesRead=0
+        self._usage=None
+        self._trace=None
         self._commandToExecute='%s' % (self._command+" "+self._parameters)
         if password:
             self._commandToExecute='su -c "'+self._commandToExecute + '"'
@@ -39,6 +331,7 @@ class CommandExecutor:
             print self._commandToExecute
 
     def execute(self):
+        self._started=time.time()
         if self._asyncronous:
             return self._executeAsync()
         else:
@@ -47,25 +340,41 @@ class CommandExecutor:
     def _executeSync(self):    
         if self._debug:
             print "ExecSync: %s PWD passed: %s" % (self._commandToExecute, self._password != None)
-        if self._password:
+        if self._pipes or self._timeout is not None:        # pexpect.run offers no process handle for timer and rusage
+            self._executeAsync()
+            output=[]
+            while True:
+                try:
+                    output.append(self.read_nonblocking(65536,None))
+                except pexpect.EOF:
+                    break
+            self._output=''.join(output)
+            self._status=self.getStatus()
+            self._errors=self.errors()
+        elif self._password:
             (self._output,self._status)=pexpect.run (self._commandToExecute, events={'.*:': self._password+'\n'}, withexitstatus=1)
         else:
             (self._output,self._status)=pexpect.run (self._commandToExecute, withexitstatus=1)
+        if self._usage is None:
+            self._usage=resourceUsage(None,time.time()-self._started,len(self._output))
         
         return (self._output,self._status)
 
     def _executeAsync(self):        
         if self._debug:
             print "ExecAsync: %s PWD passed: %s" % (self._commandToExecute,self._password != None)
-        if self._password:
+        if self._pipes:
+            self._process = PipeProcess(self._commandToExecute)
+        else:
             self._process = pexpect.spawn(self._commandToExecute)
-            #self._process.logfile_read = sys.stdout
-            if self._debug:
-                self._process.logfile_read = open("collectNWDataGUI.trc","w")
+        #self._process.logfile_read = sys.stdout
+        if self._debug:
+            self._trace = TraceLog()
+            self._process.logfile_read = self._trace
+        if self._password:
             self._process.expect('.*:')
             self._process.sendline(self._password)
-        else:
-            self._process = pexpect.spawn(self._commandToExecute)
+        self._startTimer(self._process.pid,self._process.isalive)
         
         return ('Started',0)
 
@@ -77,49 +386,212 @@ class CommandExecutor:
 
     def isalive(self):
         return self._process.isalive()
+
+    def errors(self):
+        if self._pipes and self._process is not None:
+            return self._process.errors()
+        return self._errors             # stderr is merged into the output if a pty is used
+
+    def readErrors(self):
+        if self._pipes and self._process is not None:
+            return self._process.readErrors()
+        return []
     
     def read_nonblocking(self,size=1,timeout=0):
-        return self._process.read_nonblocking(size,timeout)
+        data=self._process.read_nonblocking(size,timeout)
+        self._bytesRead+=len(data)
+        return data
 
     def readline(self,size=-1):
-        return self._process.readline(size)
+        line=self._process.readline(size)
+        self._bytesRead+=len(line)
+        return line
 
     def readlines(self):
-        return self._process.readlines()
+        lines=self._process.readlines()
+        self._bytesRead+=sum(len(line) for line in lines)
+        return lines
     
     def getPid(self):
         return self._process.pid
 
-    def getStatus(self):
+    def fileno(self):
+        return self._process.fileno()
+
+#    exit status, and with usage=True a tuple of exit status and resource usage (see resourceUsage())
+
+    def getStatus(self,usage=False):
+        status=self._status if self._process is None else self._reapProcess()
+        if usage:
+            return (status,self._usage)
+        return status
+
+    def _reapProcess(self):
+        self._stopTimer()
         self._process.close()
+        self._closeTrace()
+        if self._usage is None:
+            self._usage=resourceUsage(self._process.rusage,time.time()-self._started,self._bytesRead)
         return self._process.exitstatus
     
     def close(self,force=False):
+        self._stopTimer()
         if self._process.isalive():
             if  self._asyncronous and force:
-                CommandExecutor('kill','%s' % (self._process.pid),password=self._password).execute()
+                self._cancel()
             else:
                 self._process.close(force)
+        if not self._process.isalive():
+            self._closeTrace()
 
-def run(command):
-    
-    command.execute()
-    
-    while command.isalive():
-        line=''
+    def _closeTrace(self):
+        if self._trace is not None:
+            self._trace.close()
+            self._trace=None
+
+#    children are session leaders (setsid by pexpect or PipeProcess) so the whole process group
+#    including all grandchildren is canceled
+
+    def _startTimer(self,pid,isalive):
+        self._pid=pid
+        self._isalive=isalive
+        if self._timeout is not None:
+            self._timer=threading.Timer(self._timeout,self._timedOut)
+            self._timer.daemon=True
+            self._timer.start()
+
+    def _stopTimer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer=None
+
+    def _timedOut(self):
+        if self._debug:
+            print "Timeout: %s after %s seconds" % (self._commandToExecute,self._timeout)
+        self.timedOut=True
+        self._cancel()
+
+#    cancel doesn't block the caller (e.g. the GTK main loop). Output is available until EOF as usual, the
+#    next signal is sent by a timer thread if the process group is still alive after the kill deadline
+
+    def _cancel(self):
+        if self._password:      # su and its children belong to root. The tty driver signals them on our behalf
+            self._process.sendintr()
+            self._escalate(self._signalAsRoot,[signal.SIGTERM,signal.SIGKILL])
+        else:
+            self._signalGroup(signal.SIGTERM)
+            self._escalate(self._signalGroup,[signal.SIGKILL])
+
+    def _escalate(self,send,signals):
+        if signals:
+            self._killTimer=threading.Timer(self._killDeadline,self._deadlineExpired,[send,signals])
+            self._killTimer.daemon=True
+            self._killTimer.start()
+
+    def _deadlineExpired(self,send,signals):
+        if self._groupAlive():
+            if self._debug:
+                print "Cancel: signal %s to %s" % (signals[0],self._commandToExecute)
+            send(signals[0])
+            self._escalate(send,signals[1:])
+
+    def _groupAlive(self):
+        self._isalive()         # reaps the child
         try:
-            line=command.read_nonblocking(size=100,timeout=0)
-            sys.stdout.write(line.strip('\r'))
-        except pexpect.TIMEOUT:
+            os.killpg(self._pid,0)
+        except OSError, e:
+            return e.errno == errno.EPERM       # root processes are left
+        return True
+
+    def _signalGroup(self,sig):
+        try:
+            os.killpg(self._pid,sig)
+        except OSError:
             pass
-        except pexpect.EOF:
-            break
-        
-    line=command.readlines()
-    for l in line:
-        print "f " + str(l).strip('\r'),
 
-    print "status: %s" % (command.getStatus())        
+#    su -c runs the command in a new session, so the groups of the children of su are signaled as well
+
+    def _signalAsRoot(self,sig):
+        kill='kill -%d -- -%d $(for p in $(pgrep -P %d); do echo -$p; done)' % (sig,self._pid,self._pid)
+        pexpect.run('su -c "%s"' % (kill), events={'.*:': self._password+'\n'}, timeout=self._killDeadline)
+
+#    Drives any number of asynchronous commands from one poll loop. Output chunks and exit status
+#    are delivered as events or to callbacks, no busy polling and no thread per child
+
+OUTPUT="output"
+EXIT="exit"
+
+class CommandLoop:
+
+    def __init__(self):
+        self._poll=select.poll()
+        self._commands={}                   # fd -> command
+        self._handlers={}                   # command -> (onOutput, onExit)
+
+    def start(self,command,onOutput=None,onExit=None):
+        command.execute()
+        fd=command.fileno()
+        self._commands[fd]=command
+        self._handlers[command]=(onOutput,onExit)
+        self._poll.register(fd,select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLERR)
+        return command
+
+    def _remove(self,command):
+        for (fd,c) in self._commands.items():
+            if c is command:
+                self._poll.unregister(fd)
+                del self._commands[fd]
+
+    def cancel(self,command):
+        self._remove(command)
+        command.close(force=True)
+        status=command.getStatus()
+        (onOutput,onExit)=self._handlers.pop(command,(None,None))
+        if onExit is not None:
+            onExit(command,status)
+        return status
+
+    def pending(self):
+        return self._commands.values()
+
+    def events(self,timeout=None):
+        """Generator of (command, OUTPUT, chunk) and (command, EXIT, status) events. Ends when all commands finished or after timeout seconds without any event"""
+        while self._commands:
+            ready=self._poll.poll(None if timeout is None else int(timeout*1000))
+            if not ready:
+                return
+            for (fd,event) in ready:
+                while fd in self._commands:            # command may be canceled by the consumer of an event
+                    command=self._commands[fd]
+                    try:
+                        yield (command,OUTPUT,command.read_nonblocking(size=65536,timeout=0))
+                    except pexpect.TIMEOUT:
+                        break
+                    except (pexpect.EOF,ValueError,OSError):
+                        self._remove(command)
+                        yield (command,EXIT,command.getStatus())
+
+    def run(self,timeout=None):
+        for (command,kind,data) in self.events(timeout):
+            (onOutput,onExit)=self._handlers.get(command,(None,None))
+            if kind == OUTPUT and onOutput is not None:
+                onOutput(command,data)
+            elif kind == EXIT:
+                self._handlers.pop(command,None)
+                if onExit is not None:
+                    onExit(command,data)
+
+def run(command):
+
+    def output(command,data):
+        sys.stdout.write(data.replace('\r',''))
+
+    def exit(command,status):
+        print "status: %s" % (status)
+
+    loop=CommandLoop()
+    loop.start(command,output,exit)
+    loop.run()
 
 if __name__ == "__main__":
     
@@ -24,12 +24,31 @@ files = [("pexpect.lic", "pexpect_lic"),
          ("collectNWDataGUI.jpg", "image_data"), 
          ("buildResults/"+"collectNWDataGUII18N.zip", "i18n_data")]
 
-fout=open("collectNWDataGUIResources.py", "wb")
+import hashlib
+import zlib
+
+# resources are written zlib compressed into one data file, the generated module only
+# holds the index and is accessed through ResourceStore
+
+fdata=open("collectNWDataGUIResources.dat", "wb")
+
+index={}
+offset=0
 
 for (file, name) in files:
     print "Modularizing %s as %s" % (file,name)
 
     with open(file, "rb") as fin:
-        glade_data=fin.read()
-        fout.write(name+"="+repr(glade_data)+'\n')
-    
+        data=fin.read()
+        compressed=zlib.compress(data,9)
+        fdata.write(compressed)
+        index[name]=(offset,len(compressed),hashlib.sha1(data).hexdigest())
+        offset+=len(compressed)
+
+fdata.close()
+
+fout=open("collectNWDataGUIResources.py", "wb")
+fout.write("from ResourceStore import ResourceStore\n")
+fout.write("index="+repr(index)+'\n')
+fout.write("store=ResourceStore(__name__,\"collectNWDataGUIResources.dat\",index)\n")
+fout.close()
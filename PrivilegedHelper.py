@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+#
+#    Copyright (C) 2006-2016 framp at linux-tips-and-tricks dot de
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Summary:
+#   Root helper which is started once per GUI session with su and executes all
+#   privileged commands. Client and helper exchange frames over the su pty which
+#   is switched into raw mode by the helper:
+#
+#   <kind> <length>\n<data>
+#
+#   client -> helper: RUN (json with command and cwd), SIGNAL (pid and signal), CANCEL (pid and kill deadline), QUIT
+#   helper -> client: PID (pid of started command), OUT (output), USAGE (json with resource usage), EXIT (exit status), ERR (error message)
+
+import pexpect
+import sys
+import os
+import select
+import signal
+import subprocess
+import json
+import tty
+import time
+from CommandExecutor import terminateProcessGroup, reapChild, resourceUsage, TraceLog, KILL_DEADLINE
+
+READY="READY"
+
+def writeFrame(fd,kind,data=''):
+    frame="%s %d\n%s" % (kind,len(data),data)
+    while frame:
+        written=os.write(fd,frame)
+        frame=frame[written:]
+
+class FrameReader:
+
+    def __init__(self):
+        self._buffer=''
+
+    def feed(self,data):
+        self._buffer+=data
+        frames=[]
+        while True:
+            headerEnd=self._buffer.find('\n')
+            if headerEnd < 0:
+                break
+            (kind,length)=self._buffer[:headerEnd].split(' ')
+            frameEnd=headerEnd+1+int(length)
+            if len(self._buffer) < frameEnd:
+                break
+            frames.append((kind,self._buffer[headerEnd+1:frameEnd]))
+            self._buffer=self._buffer[frameEnd:]
+        return frames
+
+#    command executed by the helper. Offers the same interface as an asynchronous CommandExecutor
+
+class PrivilegedCommand:
+
+    def __init__(self,helper,commandLine,debug=False):
+        self._helper=helper
+        self._commandLine=commandLine
+        self._pid=None
+        self._status=None
+        self._output=[]
+        self._tail=''
+        self._usage=None
+        self._canceled=False
+        self._trace=TraceLog() if debug else None   # same debug trace as the one of CommandExecutor
+
+    def execute(self):
+        self._helper._run(self)
+        return ('Started',0)
+
+    def _received(self,kind,data):
+        if kind == 'OUT':
+            self._output.append(data)
+            self._tail=(self._tail+data)[-1000:]
+            if self._trace is not None:
+                self._trace.write(data)
+                self._trace.flush()
+        elif kind == 'PID':
+            self._pid=int(data)
+        elif kind == 'USAGE':
+            self._usage=json.loads(data)
+        elif kind == 'EXIT':
+            self._status=int(data)
+        elif kind == 'ERR':
+            self._output.append(data)
+            self._tail=data
+            self._status=127
+        if self._status is not None:
+            self._closeTrace()
+
+    def _closeTrace(self):
+        if self._trace is not None:
+            self._trace.close()
+            self._trace=None
+
+    def before(self):
+        return self._tail
+
+    def after(self):
+        return ''
+
+    def isalive(self):
+        return self._status is None
+
+    def read_nonblocking(self,size=1,timeout=0):
+        while not self._output:
+            if self._status is not None:
+                raise pexpect.EOF('End Of File (EOF). Command terminated.')
+            self._helper._receive(timeout)       # raises TIMEOUT if no frame arrived
+        output=''.join(self._output)
+        self._output=[]
+        return output
+
+    def readlines(self):
+        output=''.join(self._output)
+        self._output=[]
+        return output.splitlines(True)
+
+    def getPid(self):
+        return self._pid
+
+    def fileno(self):
+        return self._helper.fileno()
+
+    def getStatus(self,usage=False):
+        while self._status is None:
+            self._helper._receive(None)
+        if usage:
+            return (self._status,self._usage)
+        return self._status
+
+#    the EXIT frame of a canceled command is received by the helper before it runs the next command
+
+    def close(self,force=False):
+        while self.isalive() and self._pid is None:     # PID frame not received yet
+            self._helper._receive(None)
+        if self.isalive() and not self._canceled:
+            self._helper.cancel(self._pid)
+            self._canceled=True
+
+#    client side of the helper
+
+class PrivilegedHelper:
+
+    def __init__(self,password=None,debug=False):
+        self._password=password
+        self._debug=debug
+        self._process=None
+        self._reader=FrameReader()
+        self._command=None
+
+    def start(self):
+        code="import sys; sys.path.insert(0,'%s'); import PrivilegedHelper; PrivilegedHelper.main()" % (os.path.dirname(os.path.abspath(__file__)))
+        if self._debug:
+            print "Starting privileged helper PWD passed: %s" % (self._password != None)
+        if self._password:
+            self._process=pexpect.spawn('su',['-c','%s -c "%s"' % (sys.executable,code)])
+            self._process.expect('.*:')
+            self._process.sendline(self._password)
+        else:
+            self._process=pexpect.spawn(sys.executable,['-c',code])
+        if self._process.expect([READY+'\r?\n',pexpect.EOF]) == 1:    # su failed
+            self._process.close()
+            return self._process.exitstatus
+        return 0
+
+    def errors(self):
+        return self._process.before
+
+    def fileno(self):
+        return self._process.fileno()
+
+    def isalive(self):
+        return self._process is not None and self._process.isalive()
+
+    def _receive(self,timeout):
+        try:
+            data=self._process.read_nonblocking(size=65536,timeout=timeout)
+        except pexpect.EOF:
+            if self._command is not None:
+                self._command._received('ERR','Privileged helper terminated')
+                self._command=None
+            return
+        for (kind,data) in self._reader.feed(data):
+            if self._command is not None:
+                self._command._received(kind,data)
+                if not self._command.isalive():
+                    self._command=None
+
+    def _run(self,command):
+        if self._debug:
+            print "ExecPrivileged: %s" % (command._commandLine)
+        if self._command is not None:      # frames of the previous command have to be received before the next RUN
+            self._command.close()
+            self._finish()
+        if not self.isalive():
+            command._received('ERR','Privileged helper terminated')
+            return
+        self._command=command
+        writeFrame(self.fileno(),'RUN',json.dumps({'command': command._commandLine, 'cwd': os.getcwd()}))
+
+#    wait for the EXIT of a canceled command. The helper is stopped if it doesn't answer in time
+
+    def _finish(self,deadline=KILL_DEADLINE+1):
+        end=time.time()+deadline
+        while self._command is not None and time.time() < end:
+            try:
+                self._receive(end-time.time())
+            except pexpect.TIMEOUT:
+                break
+        if self._command is not None:
+            self._command._received('ERR','Privileged helper not responding')
+            self._command=None
+            self.stop()
+
+    def run(self,commandLine):
+        command=PrivilegedCommand(self,commandLine)
+        command.execute()
+        return command
+
+    def call(self,commandLine):
+        command=self.run(commandLine)
+        output=[]
+        while True:
+            try:
+                output.append(command.read_nonblocking(timeout=None))
+            except pexpect.EOF:
+                break
+        return (''.join(output),command.getStatus())
+
+    def signal(self,pid,sig):
+        writeFrame(self.fileno(),'SIGNAL',"%d %d" % (pid,sig))
+
+    def cancel(self,pid,deadline=KILL_DEADLINE):
+        writeFrame(self.fileno(),'CANCEL',"%d %d" % (pid,deadline))
+
+    def stop(self):
+        if self._process is not None and self._process.isalive():
+            writeFrame(self.fileno(),'QUIT')
+            self._process.close()
+
+#    helper side, executed as root
+
+def main():
+
+    fdIn=sys.stdin.fileno()
+    fdOut=sys.stdout.fileno()
+    if os.isatty(fdIn):
+        tty.setraw(fdIn)       # no echo and no line discipline for the frames
+    os.write(fdOut,READY+'\n')
+
+    reader=FrameReader()
+    child=None
+
+    while True:
+        fds=[fdIn]
+        if child is not None:
+            fds.append(child.stdout.fileno())
+        r,w,e=select.select(fds,[],[])
+
+        if child is not None and child.stdout.fileno() in r:
+            data=os.read(child.stdout.fileno(),65536)
+            if data:
+                bytesRead+=len(data)
+                writeFrame(fdOut,'OUT',data)
+            else:
+                child.stdout.close()
+                status=reapChild(child)
+                if status < 0:      # killed by signal
+                    status=128-status
+                writeFrame(fdOut,'USAGE',json.dumps(resourceUsage(child.rusage,time.time()-started,bytesRead)))
+                writeFrame(fdOut,'EXIT',str(status))
+                child=None
+
+        if fdIn in r:
+            data=os.read(fdIn,65536)
+            if not data:                            # client is gone
+                break
+            for (kind,data) in reader.feed(data):
+                if kind == 'RUN':
+                    request=json.loads(data)
+                    if child is not None:
+                        writeFrame(fdOut,'ERR','Command already running')
+                        continue
+                    try:
+                        child=subprocess.Popen(request['command'],shell=True,cwd=request['cwd'],preexec_fn=os.setsid,
+                                               stdin=open(os.devnull),stdout=subprocess.PIPE,stderr=subprocess.STDOUT)
+                        (started,bytesRead)=(time.time(),0)
+                        writeFrame(fdOut,'PID',str(child.pid))
+                    except OSError, e:
+                        writeFrame(fdOut,'ERR',str(e))
+                elif kind == 'SIGNAL':
+                    (pid,sig)=data.split(' ')
+                    try:
+                        os.kill(int(pid),int(sig))
+                    except OSError:
+                        pass
+                elif kind == 'CANCEL':          # whole process group of the command, EXIT follows
+                    (pid,deadline)=data.split(' ')
+                    if child is not None and child.pid == int(pid):
+                        terminateProcessGroup(child.pid,lambda: reapChild(child,os.WNOHANG),int(deadline))
+                elif kind == 'QUIT':
+                    if child is not None:
+                        terminateProcessGroup(child.pid,lambda: reapChild(child,os.WNOHANG))
+                    return
+
+    if child is not None:
+        terminateProcessGroup(child.pid,lambda: reapChild(child,os.WNOHANG))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+#
+#    Copyright (C) 2006-2016 framp at linux-tips-and-tricks dot de
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Summary:
+#   Access to the resources bundled by ModulizeFiles.py. All resources are stored zlib
+#   compressed in one data file next to the generated index module and are decoded
+#   on first access only. release() drops a decoded resource which is no longer needed.
+#   If bundled the data file can't be read partially from the zip, so it's read once and
+#   kept (compressed) in memory.
+
+import os
+import sys
+import zlib
+
+class ResourceStore:
+
+    def __init__(self,moduleName,dataFileName,index):
+        module=sys.modules[moduleName]
+        self._dataPath=os.path.join(os.path.dirname(module.__file__),dataFileName)
+        self._loader=getattr(module,'__loader__',None)    # zipimporter if bundled
+        self._index=index                                   # name -> (offset, length, sha1)
+        self._resources={}
+        self._data=None                                     # content of the data file if bundled
+
+    def _read(self,offset,length):
+        if hasattr(self._loader,'get_data'):
+            if self._data is None:
+                self._data=self._loader.get_data(self._dataPath)
+            return self._data[offset:offset+length]
+        f=open(self._dataPath,"rb")
+        try:
+            f.seek(offset)
+            return f.read(length)
+        finally:
+            f.close()
+
+    def get(self,name):
+        if name not in self._resources:
+            (offset,length,sha1)=self._index[name]
+            self._resources[name]=zlib.decompress(self._read(offset,length))
+        return self._resources[name]
+
+    def release(self,name):
+        self._resources.pop(name,None)
+
+    def hash(self,name):
+        return self._index[name][2]
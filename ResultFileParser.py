@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+#
+#    Copyright (C) 2006-2016 framp at linux-tips-and-tricks dot de
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Summary:
+#   Streaming parser for collectNWData.txt as written by collectNWData.sh:
+#
+#   [code]
+#   collectNWData.sh V0.7.5.8 <date>/<time> - <commit>          -> VersionRecord
+#   ...
+#   !!! CND0100E: <message>                                     -> MessageRecord
+#   ...
+#   ==========...
+#   ===== <command> ==========...                               -> SectionRecord
+#   <output of command>
+#   ...
+#   ==========...
+#   *** NWElizaStates <version>
+#   <key>:<value> <key>:<value> ...                             -> StatesRecord
+#   [/code]
+#
+#   parse() reads the report line by line and yields the records, so memory
+#   does not depend on the size of the report. All records carry the byte
+#   offset of their first line which can be passed to parse() again.
+#
+# Example:
+#   for record in ResultFileParser.parse("collectNWData.txt"):
+#       if record.kind == ResultFileParser.MESSAGE and record.severity == 'E':
+#           print record.code, record.text
+
+import re
+import sys
+
+VERSION="version"
+MESSAGE="message"
+SECTION="section"
+STATES="states"
+
+CODE_BEGIN="[code]"
+CODE_END="[/code]"
+SECTION_PREFIX="===== "
+STATES_PREFIX="*** NWElizaStates"
+
+MESSAGE_PATTERN=re.compile(r"^\W{0,3}\s*(CND(\d+)([EWI])):?\s?(.*)$")
+SEPARATOR_PATTERN=re.compile(r"^={20,}$")
+
+class Record:
+    kind=None
+
+    def __init__(self,offset):
+        self.offset=offset
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__,", ".join(["%s=%r" % item for item in sorted(self.__dict__.items())]))
+
+#    first line of the report: <script> <version> <date> - <commit>
+
+class VersionRecord(Record):
+    kind=VERSION
+
+    def __init__(self,offset,line):
+        Record.__init__(self,offset)
+        self.line=line
+        fields=line.split(None,2)
+        self.script=fields[0] if len(fields) > 0 else None
+        self.version=fields[1] if len(fields) > 1 else None
+        self.build=fields[2] if len(fields) > 2 else None
+
+class MessageRecord(Record):
+    kind=MESSAGE
+
+    def __init__(self,offset,match):
+        Record.__init__(self,offset)
+        self.code=match.group(1)                # CND0100E
+        self.number=int(match.group(2))         # 100
+        self.severity=match.group(3)            # E, W or I
+        self.text=match.group(4)
+
+#    output of one collector. end is the offset of the line following the section,
+#    text is None if parse() was called with withText=False
+
+class SectionRecord(Record):
+    kind=SECTION
+
+    def __init__(self,offset,command):
+        Record.__init__(self,offset)
+        self.command=command
+        self.end=None
+        self.text=None
+
+class StatesRecord(Record):
+    kind=STATES
+
+    def __init__(self,offset,version,line):
+        Record.__init__(self,offset)
+        self.version=version
+        self.states=[]                          # list of (key, value) in report order
+        for field in line.split():
+            (key,sep,value)=field.partition(':')
+            self.states.append((key,value))
+
+    def get(self,key,default=None):
+        for (k,v) in self.states:
+            if k == key:
+                return v
+        return default
+
+def _sectionCommand(line):
+    return line[len(SECTION_PREFIX):].rstrip('=').strip()
+
+#    skip a partial line if offset doesn't point to the beginning of a line
+
+def _seek(f,offset):
+    if offset <= 0:
+        f.seek(0)
+        return 0
+    f.seek(offset-1)
+    if f.read(1) == '\n':
+        return offset
+    return offset+len(f.readline())
+
+#    fileOrName: name of the report or a file object opened in binary mode
+#    offset: byte offset to start at, usually the offset of a record returned before
+#    withText: return the output of the sections. Without the output memory is constant
+#              even for huge sections, the output can be read with the offsets of the record
+
+def parse(fileOrName,offset=0,withText=True):
+    if isinstance(fileOrName,basestring):
+        f=open(fileOrName,"rb")
+        try:
+            for record in _parse(f,offset,withText):
+                yield record
+        finally:
+            f.close()
+    else:
+        for record in _parse(fileOrName,offset,withText):
+            yield record
+
+def _parse(f,offset,withText):
+
+    position=_seek(f,offset)
+    versionSeen=offset > 0              # version is the first line of the report only
+    section=None
+    sectionText=[]
+    states=None
+
+    while True:
+        rawLine=f.readline()
+        if not rawLine:
+            break
+        lineOffset=position
+        position+=len(rawLine)
+        line=rawLine.rstrip('\r\n')
+
+        isSectionHeader=line.startswith(SECTION_PREFIX) and not SEPARATOR_PATTERN.match(line)
+        if section is not None and (isSectionHeader or line == CODE_END or SEPARATOR_PATTERN.match(line)):
+            section.end=lineOffset
+            if withText:
+                section.text=''.join(sectionText)
+                sectionText=[]
+            yield section
+            section=None
+
+        if states is not None:                  # line following *** NWElizaStates
+            yield StatesRecord(states[0],states[1],line)
+            states=None
+        elif isSectionHeader:
+            section=SectionRecord(lineOffset,_sectionCommand(line))
+        elif section is not None:
+            if withText:
+                sectionText.append(rawLine)
+        elif line == CODE_BEGIN or line == CODE_END or SEPARATOR_PATTERN.match(line):
+            pass
+        elif line.startswith(STATES_PREFIX):
+            states=(lineOffset,line[len(STATES_PREFIX):].strip())
+        elif not versionSeen:
+            if line.strip():
+                versionSeen=True
+                yield VersionRecord(lineOffset,line)
+        else:
+            match=MESSAGE_PATTERN.match(line)
+            if match:
+                yield MessageRecord(lineOffset,match)
+
+    if section is not None:                     # truncated report
+        section.end=position
+        if withText:
+            section.text=''.join(sectionText)
+        yield section
+
+if __name__ == "__main__":
+
+    for record in parse(sys.argv[1],withText=False):
+        print record
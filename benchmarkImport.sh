@@ -0,0 +1,62 @@
+#!/bin/bash
+#
+#    Copyright (C) 2006-2016 framp at linux-tips-and-tricks dot de
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Compares the import of the GUI modules from a bundle without bytecode (cold, all modules are
+# compiled from source on every launch) and with bytecode (warm) as created by bundle.sh.
+# Measures the time the loader in zipheader.sh needs to import collectNWDataGUI, which is the part
+# of the startup bytecode changes. The GUI itself is not started.
+#
+# Invocation: benchmarkImport.sh [runs]    (call after bundle.sh created the resources)
+
+RUNS=${1:-10}
+PYTHON=$(which python 2>/dev/null)
+MODULES="collectNWDataGUI.py collectNWDataGUIResources.py ResourceStore.py pexpect.py CommandExecutor.py PrivilegedHelper.py"
+RESOURCES_DIR=$(ls -td buildResults/cache/resources-* 2>/dev/null | head -n 1)   # latest resources built
+
+if [[ -z $RESOURCES_DIR ]]; then
+   echo "No resources found. Run bundle.sh first"
+   exit 1
+fi
+
+BENCHDIR=$(mktemp -d)
+trap 'rm -rf $BENCHDIR' EXIT
+
+cp collectNWDataGUI.py ResourceStore.py pexpect.py CommandExecutor.py PrivilegedHelper.py $RESOURCES_DIR/* $BENCHDIR
+(cd $BENCHDIR; zip -q cold.zip $MODULES collectNWDataGUIResources.dat)
+(cd $BENCHDIR; $PYTHON -c "import py_compile,sys; [py_compile.compile(f, cfile=f+'c', doraise=True) for f in sys.argv[1:]]" $MODULES)
+cp $BENCHDIR/cold.zip $BENCHDIR/warm.zip
+(cd $BENCHDIR; zip -q warm.zip ${MODULES//.py/.pyc})
+
+for bundle in cold warm; do
+   total=0
+   for (( i=0; $i < $RUNS; i++ )); do
+      t=$(cd $BENCHDIR; $PYTHON -c "
+import sys, time
+start=time.time()
+sys.path.insert(0, '$bundle.zip')
+import collectNWDataGUI
+print '%d' % ((time.time()-start)*1000000)
+")
+      if [[ -z $t ]]; then
+         echo "Import of collectNWDataGUI from $bundle bundle failed"
+         exit 1
+      fi
+      let total=total+t
+   done
+   let avg=total/RUNS
+   echo "$bundle: $avg us per import (average of $RUNS runs)"
+done
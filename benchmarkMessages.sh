@@ -0,0 +1,77 @@
+#!/bin/bash
+#
+#    Copyright (C) 2006-2016 framp at linux-tips-and-tricks dot de
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Counts the processes forked and the time needed by writeToEliza for all NWEliza messages
+# (one NWEliza pass writing every message once) of collectNWData.sh in the working
+# directory and of collectNWData.sh of a git revision.
+# Forks are counted with the process counter in /proc/stat, so the system should be idle.
+#
+# Invocation: benchmarkMessages.sh revision [language]    (default language: de_DE.UTF-8)
+#             revision is the one to compare with, i.e. a revision before messages were rendered with builtins
+
+if [[ -z $1 ]]; then
+   echo "Invocation: $0 revision [language]"
+   exit 1
+fi
+
+REVISION=$1
+LANGUAGE=${2:-de_DE.UTF-8}
+FUNCTIONS="writeToEliza writeToElizaOnly getLocalizedMessage getTargetMessage getMessageText renderMessage resolveMessageLanguage loadMessageCatalog"
+
+BENCHDIR=$(mktemp -d)
+trap 'rm -rf $BENCHDIR' EXIT
+
+# extract message tables and message functions of a script
+
+function extract() {   # script
+   local f
+   grep "^MSG_[A-Z_]*=[0-9]\|^MSG_[A-Z][A-Z]\[" $1
+   for f in $FUNCTIONS; do
+      awk '/^function '$f'\(\)/,/^}/' $1
+   done
+}
+
+git show $REVISION:collectNWData.sh > $BENCHDIR/before.sh || exit 1
+cp collectNWData.sh $BENCHDIR/after.sh
+
+for script in before after; do
+   extract $BENCHDIR/$script.sh > $BENCHDIR/$script.msg
+   result=$(LANG=$LANGUAGE CND_DIR=$BENCHDIR MYSELF=$script.sh bash -c '
+      . '$BENCHDIR/$script.msg'
+      if declare -F resolveMessageLanguage > /dev/null; then
+         resolveMessageLanguage
+      fi
+      GUI=1
+      EGREP="grep -E"
+      CND_INTERNATIONAL_POST=0
+      ELIZA_RESULT=/dev/null
+      messages=0
+      start=$(awk "/^processes/ { print \$2 }" /proc/stat)
+      startTime=$(date +%s%N)
+      for i in ${!MSG_EN[@]}; do
+         if [[ ${MSG_EN[$i]} == *CND* ]]; then
+            writeToEliza $i eth0 192.168.0.1 > /dev/null
+            let messages=messages+1
+         fi
+      done
+      endTime=$(date +%s%N)
+      end=$(awk "/^processes/ { print \$2 }" /proc/stat)
+      echo "$messages $(( $end - $start - 3 )) $(( ($endTime - $startTime) / 1000000 ))"    # minus date, date and awk
+   ')
+   set -- $result
+   echo "$script: $1 messages, $2 forks ($(( $2 / $1 )) per message), $3 ms"
+done
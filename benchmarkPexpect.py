@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+#
+#    Copyright (C) 2006-2016 framp at linux-tips-and-tricks dot de
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Summary:
+#   Throughput of the bundled pexpect when reading a long synthetic output
+#   similar to the one of collectNWData.sh with readline, readlines and expect.
+#   In addition searcher_string is compared with and without the prefix tree
+#   matcher for a growing number of literal patterns.
+#
+# Invocation: benchmarkPexpect.py [megabytes]
+
+import sys
+import time
+import pexpect
+
+LINE="CND0815I: --- eth0: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc pfifo_fast state UP"
+
+def spawnOutput(megabytes):
+    return pexpect.spawn('sh',['-c','yes "%s" | head -c %d; echo; echo END' % (LINE,megabytes*1024*1024)])
+
+def readlineLoop(child):
+    while child.readline():
+        pass
+
+def readlines(child):
+    child.readlines()
+
+def expectEOF(child):
+    child.expect(pexpect.EOF,timeout=None)
+
+def expectEnd(child):
+    child.expect('END\r\n',timeout=None)
+
+def expectExactEnd(child):
+    child.expect_exact('END\r\n',timeout=None)
+
+def searcherBenchmark(strings,text,trie):
+    searcher=pexpect.searcher_string(strings)
+    if not trie:
+        searcher._trie=None
+    elif searcher._trie is None:
+        searcher._trie=pexpect._string_trie(searcher._strings)
+    window=2000                         # default maxread of spawn
+    buffer=bytearray()                  # grows like the buffer of spawn.expect_loop()
+    start=time.time()
+    for offset in xrange(0,len(text),window):
+        buffer+=text[offset:offset+window]
+        searcher.search(buffer,window)
+    return time.time()-start
+
+def searcherBenchmarks(megabytes):
+    text=(LINE+"\r\n")*(megabytes*1024*1024/(len(LINE)+2))
+    for count in (2,4,8,16,32,64,128):
+        strings=[("state DOWN%d" if i % 2 else "mtu %d:") % (i) for i in range(count)]   # frequent prefixes, never match
+        find=searcherBenchmark(strings,text,False)
+        trie=searcherBenchmark(strings,text,True)
+        print "%3d strings : find %6.2f s  trie %6.2f s" % (count,find,trie)
+
+BENCHMARKS=[('readline',readlineLoop),('readlines',readlines),('expect EOF',expectEOF),
+            ('expect re',expectEnd),('expect exact',expectExactEnd)]
+
+def main():
+    megabytes=int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    for (name,benchmark) in BENCHMARKS:
+        child=spawnOutput(megabytes)
+        start=time.time()
+        benchmark(child)
+        elapsed=time.time()-start
+        child.close()
+        print "%-12s: %6.2f s %8.2f MB/s (%d MB)" % (name,elapsed,megabytes/elapsed,megabytes)
+    searcherBenchmarks(megabytes)
+
+if __name__ == "__main__":
+    main()
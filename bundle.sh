@@ -15,19 +15,132 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+#
+# Inputs are hashed and all generated artifacts are cached in buildResults/cache by the hash of their inputs.
+# Only artifacts whose inputs changed are generated again. Invoke with -c to clear the cache.
+# After a successful build only the entries used by the build and the newest CACHE_KEEP unused
+# entries of each kind are kept.
+#
+
+CACHE=buildResults/cache
+CACHE_KEEP=${CACHE_KEEP:-2}
+PYTHON=python
+MODULES="collectNWDataGUI.py ResourceStore.py pexpect.py CommandExecutor.py PrivilegedHelper.py"
+RESOURCES="ModulizeFiles.py pexpect.lic collectNWDataGUI.desktop collectNWData.sh collectNWDataGUI.glade collectNWDataGUI.jpg"
+
+# sha1 of names and contents of all files passed
+
+function hashFiles() {
+   local f
+   for f in "$@"; do
+      echo "$f"
+      cat "$f"
+   done | sha1sum | cut -d ' ' -f 1
+}
+
+function hashString() {
+   echo "$@" | sha1sum | cut -d ' ' -f 1
+}
+
+# compile module $1 located in directory $2 into cache and echo cache directory
+
+function cacheModule() {
+   local key
+   local dir
+   key=$(hashString "$($PYTHON -V 2>&1)" $(cd $2; hashFiles $1))
+   dir=$CACHE/py-$key
+   if [[ ! -d $dir ]]; then
+      echo "Compiling $1" 1>&2
+      mkdir -p $dir.tmp
+      cp -p $2/$1 $dir.tmp
+      (cd $dir.tmp; $PYTHON -c "import py_compile,sys; py_compile.compile(sys.argv[1], cfile=sys.argv[1]+'c', doraise=True)" $1) || exit 1
+      mv $dir.tmp $dir
+   fi
+   echo $dir
+}
+
+# remove all but the newest CACHE_KEEP unused entries of each kind. Leftovers of failed builds are removed
+
+function pruneCache() {   # entries used by the build
+   local kind
+   local entry
+   local keep
+   for kind in i18n resources py bundle; do
+      keep=$CACHE_KEEP
+      for entry in $(ls -dt $CACHE/$kind-* 2>/dev/null); do
+         if [[ " $* " == *" $entry "* ]]; then
+            continue
+         fi
+         if (( keep > 0 )) && [[ $entry != *.tmp ]]; then
+            let keep=keep-1
+         else
+            rm -rf $entry
+         fi
+      done
+   done
+}
+
+if [[ $1 == "-c" ]]; then
+   rm -rf $CACHE
+fi
+
 rm -f collectNWData.txt
-rm -f collectNWDataGUI.pyc
-rm -fr ~/collectNWDataTest/*
-if [[ ! -d buildResults ]]; then
-   mkdir buildResults
+mkdir -p $CACHE
+
+# I18N zip
+
+I18N_FILES=$(find locale -type f ! -path '*CVS*' | sort)
+I18N_KEY=$(hashFiles $I18N_FILES)
+I18N_ZIP=$CACHE/i18n-$I18N_KEY.zip
+if [[ ! -e $I18N_ZIP ]]; then
+   echo "Creating I18N zip"
+   zip -q -X $I18N_ZIP.tmp $I18N_FILES && mv $I18N_ZIP.tmp $I18N_ZIP || exit 1
+fi
+
+# resource module and data file
+
+RESOURCES_KEY=$(hashString $I18N_KEY $(hashFiles $RESOURCES))
+RESOURCES_DIR=$CACHE/resources-$RESOURCES_KEY
+if [[ ! -d $RESOURCES_DIR ]]; then
+   echo "Creating resources"
+   cp $I18N_ZIP buildResults/collectNWDataGUII18N.zip
+   $PYTHON ModulizeFiles.py || exit 1
+   rm buildResults/collectNWDataGUII18N.zip
+   mkdir -p $RESOURCES_DIR.tmp
+   mv collectNWDataGUIResources.py collectNWDataGUIResources.dat $RESOURCES_DIR.tmp
+   mv $RESOURCES_DIR.tmp $RESOURCES_DIR
+fi
+
+# bytecode of the target python next to the sources. zipimport can't write bytecode itself and
+# falls back to the sources if the bytecode doesn't match the interpreter
+
+MODULE_DIRS=$(cacheModule collectNWDataGUIResources.py $RESOURCES_DIR) || exit 1
+for module in $MODULES; do
+   MODULE_DIRS="$MODULE_DIRS $(cacheModule $module .)" || exit 1
+done
+
+# assemble bundle from cached members
+
+BUNDLE_KEY=$(hashString $RESOURCES_KEY $MODULE_DIRS $(hashFiles zipheader.sh pexpect.lic *.desktop))
+BUNDLE=$CACHE/bundle-$BUNDLE_KEY.sh
+if [[ ! -e $BUNDLE ]]; then
+   echo "Assembling bundle"
+   STAGE=buildResults/stage
+   rm -rf $STAGE
+   mkdir -p $STAGE
+   for dir in $MODULE_DIRS; do
+      cp -p $dir/* $STAGE
+   done
+   cp -p $RESOURCES_DIR/collectNWDataGUIResources.dat pexpect.lic *.desktop $STAGE
+   (cd $STAGE; zip -q -X ../collectNWDataGUIBundle.zip *) || exit 1
+   cat zipheader.sh buildResults/collectNWDataGUIBundle.zip > $BUNDLE
+   rm -rf $STAGE buildResults/collectNWDataGUIBundle.zip
 fi
-zip buildResults/collectNWDataGUII18N.zip -r locale/* -x \*CVS\*
-python ModulizeFiles.py
-rm buildResults/collectNWDataGUII18N.zip 
-zip buildResults/collectNWDataGUIBundle.zip coll*.py pexpect.py pexpect.lic CommandExecutor.py *.desktop
-cat zipheader.sh buildResults/collectNWDataGUIBundle.zip > buildResults/collectNWDataGUI.sh
-rm buildResults/collectNWDataGUIBundle.zip
-rm -rf ~/collectNWDataTest
+cp $BUNDLE buildResults/collectNWDataGUI.sh
+pruneCache $I18N_ZIP $RESOURCES_DIR $MODULE_DIRS $BUNDLE
+
+# the GUI replaces installed files which differ from the bundled ones so the test directory is kept
+
 mkdir -p ~/collectNWDataTest
 cp buildResults/collectNWDataGUI.sh ~/collectNWDataTest/collectNWDataGUI.sh
 chmod +x ~/collectNWDataTest/collectNWDataGUI.sh
@@ -101,6 +101,7 @@ process_chars_cnt=0
 MINOR_SEPARATOR="------------------------------------------------------------------------------------------------------------------"
 VERSION_STRING="$GIT_CODEVERSION"
 NUMBER_OF_LINES_TO_CHECK_IN_VAR_LOG_MESSAGES=300
+SITE_COLLECTORS_DIR="/etc/collectNWData.d"	# site specific collectors, see registerCollector
 MAX_ERROR_PERCENT=5                   # acceptable error rate on interfaces (xmit and rcv)
 
 # --- get the absolute path of script such that the output file can be written in the same directory
@@ -118,6 +119,7 @@ if [[ $UID -eq 0 || $USE_ROOT != "1" ]]; then
    FINAL_RESULT="${CND_DIR}/${MYSELF/.sh/}.txt"
    FINAL_RESULT_SHORT_NAME="${MYSELF/.sh/}.txt"
    STATE="/tmp/${MYSELF}_S.$$"
+   COLLECT_BUFFER="${COLLECT_RESULT}."
    LOG=$COLLECT_RESULT
 else
    chmod +x $CND_DIR/$MYSELF
@@ -229,6 +231,8 @@ eval $DISTRO
 
 MODS_OPT="HWINFO DHCPCD LSUSB RFKILL LSHW"	# optional commands
 MODS_ALL="EGREP AWK SED IFCONFIG IWCONFIG IWLIST IPTABLES LSPCI GREP PERL ARP ROUTE LSMOD SORT PING TAIL"  # required commands
+TOOL_DIRS="/sbin /usr/bin /usr/sbin /bin"	# directories searched for the commands in this order
+TOOL_CACHE="${CND_DIR}/${MYSELF/.sh/}.tools"	# paths of the commands, valid as long as it's newer than TOOL_DIRS
 
 #################################################################################
 # --- cleanup files in case of failure
@@ -239,11 +243,15 @@ function cleanupTempFiles {
    rm -f "$ELIZA_RESULT" 2>/dev/null
    rm -f "$CONSOLE_RESULT" 2>/dev/null
    rm -f "$COLLECT_RESULT" 2>/dev/null
+   if [[ -n $COLLECT_BUFFER ]]; then
+      rm -f "$COLLECT_BUFFER"[0-9]* 2>/dev/null
+   fi
    rm -f $STATE 2>/dev/null
 }
 
 function cleanupFiles {
    rm -f "$FINAL_RESULT" 2>/dev/null
+   rm -f "$TOOL_CACHE" 2>/dev/null
    cleanupTempFiles
    exit
 }
@@ -252,7 +260,10 @@ trap 'cleanupFiles' SIGHUP SIGINT SIGPIPE SIGTERM
 
 #################################################################################
 #
-# --- Messages in English and German
+# --- Messages in English
+#
+# The translations are located in message catalogs at the end of the script.
+# Only the catalog of the system language is loaded (see loadMessageCatalog)
 #
 # (volunteers to translate the messages into other languages are welcome)
 #
@@ -269,254 +280,79 @@ MSG_FR=1      # french
 
 MSG_UNDEFINED=0
 MSG_EN[$MSG_UNDEFINED]="Undefined message. Pls inform the author $CONTACT"
-MSG_FR[$MSG_UNDEFINED]="Message inconnu. S'il vous plaît informer l'auteur $CONTACT"
-MSG_CS[$MSG_UNDEFINED]="Nedefinována správa. Prosím, informujte autora $CONTACT"
-MSG_DE[$MSG_UNDEFINED]="Unbekannte Meldung. Bitte den Author $CONTACT informieren"
-MSG_PT[$MSG_UNDEFINED]="Por favor informe o autor $CONTACT"
-MSG_PL[$MSG_UNDEFINED]="Niezdefiniowany komunikat. Proszę poinformuj autora $CONTACT"
 MSG_INTERNAL_ERROR=1
 MSG_EN[$MSG_INTERNAL_ERROR]="Internal error %1 occured. Pls inform the author $CONTACT"
-MSG_FR[$MSG_INTERNAL_ERROR]="L'erreur interne %1 s'est produite . Svp informer l'auteur $CONTACT"
-MSG_CS[$MSG_INTERNAL_ERROR]="Objevile se %1 chyba. Kontaktujte prosím autora $CONTACT"
-MSG_DE[$MSG_INTERNAL_ERROR]="Interner Fehler %1 aufgetreten. Bitte den Author $CONTACT informieren"
-MSG_PT[$MSG_INTERNAL_ERROR]="Erro interno %1. Por favor informe o autor $CONTACT"
-MSG_PL[$MSG_INTERNAL_ERROR]="Wystąpił błąd wewnętrzny %1. Proszę poinformuj autora $CONTACT"
 MSG_ELIZA_START_ANALYZE=2
 MSG_EN[$MSG_ELIZA_START_ANALYZE]="--- NWEliza is analyzing the system for common network configuration errors ..."
-MSG_FR[$MSG_ELIZA_START_ANALYZE]="--- NWEliza recherche dans le système les erreurs de configuration du réseau ..."
-MSG_CS[$MSG_ELIZA_START_ANALYZE]="--- NWEliza analyzuje systém pro obecné chyby síťové konfigurace..."
-MSG_DE[$MSG_ELIZA_START_ANALYZE]="--- NWEliza untersucht das System nach häufigen Netzwerkkonfigurationsfehlern ..."
-MSG_PT[$MSG_ELIZA_START_ANALYZE]="--- NWEliza está procurando por erros comuns de configuração de rede no sistema ..."
-MSG_PL[$MSG_ELIZA_START_ANALYZE]="--- NWEliza analizuje system pod kątem najczęstszych błędów konfiguracji sieci."
 MSG_START_COLLECTING=3
 MSG_EN[$MSG_START_COLLECTING]="--- NWCollect is collecting networkconfiguration information into file %1 ..."
-MSG_FR[$MSG_START_COLLECTING]="--- NWCollect recueille l'information de configuration du réseau dans le fichier %1 ..."
-MSG_CS[$MSG_START_COLLECTING]="--- NWCollect shromažďuje informaci o síťové konfiguraci  do souboru %1 ..."
-MSG_DE[$MSG_START_COLLECTING]="--- NWCollect sammelt Netzwerkkonfigurationsinformationen in Datei %1 ..."
-MSG_PT[$MSG_START_COLLECTING]="--- NWCollect está reunindo informações de configuração de rede no arquivo %1 ..."
-MSG_PL[$MSG_START_COLLECTING]="--- NWCollect zbiera dane na temat konfiguracji sieci do pliku %1 ..."
 MSG_CON_WRL=4
 MSG_EN[$MSG_CON_WRL]="--- (1) Wireless connection (WLAN)"
-MSG_FR[$MSG_CON_WRL]="--- (1) Connexion sans fil (WLAN)"
-MSG_CS[$MSG_CON_WRL]="--- (1) Bezdrátové připojení (WLAN)"
-MSG_DE[$MSG_CON_WRL]="--- (1) Kabellose Verbindung (WLAN)"
-MSG_PT[$MSG_CON_WRL]="--- (1) Conexão sem fio (WLAN)"
-MSG_PL[$MSG_CON_WRL]="--- (1) Połączenie bezprzewodowe (WLAN)"
 MSG_ANSWER_CHARS_NO=5
 MSG_EN[$MSG_ANSWER_CHARS_NO]="Nn"
-MSG_FR[$MSG_ANSWER_CHARS_NO]="Nn"
-MSG_CS[$MSG_ANSWER_CHARS_NO]="Nn"
-MSG_DE[$MSG_ANSWER_CHARS_NO]="Nn"
-MSG_PT[$MSG_ANSWER_CHARS_NO]="Nn"
-MSG_PL[$MSG_ANSWER_CHARS_NO]="Nn"
 MSG_ANSWER_CHARS_YES=6
 MSG_EN[$MSG_ANSWER_CHARS_YES]="Yy"
-MSG_FR[$MSG_ANSWER_CHARS_YES]="Oo"
-MSG_CS[$MSG_ANSWER_CHARS_YES]="Aa"
-MSG_DE[$MSG_ANSWER_CHARS_YES]="Jj"
-MSG_PT[$MSG_ANSWER_CHARS_YES]="Ss"
-MSG_PL[$MSG_ANSWER_CHARS_YES]="Tt"
 MSG_MAIN_PROG_REQUIRED=7
 MSG_EN[$MSG_MAIN_PROG_REQUIRED]="!!! Program %1 not found. Install program and invoke script again"
-MSG_FR[$MSG_MAIN_PROG_REQUIRED]="!!! Le programme %1 est introuvable. Installez le programme et redémarrez le script"
-MSG_CS[$MSG_MAIN_PROG_REQUIRED]="!!! Program %1 se nenašel. Nainstalujte program a spusťte skript znovu"
-MSG_DE[$MSG_MAIN_PROG_REQUIRED]="!!! Das Programm %1 ist nicht verfügbar. Das Programm nachinstallieren und das Script danach noch einmal ausführen"
-MSG_PT[$MSG_MAIN_PROG_REQUIRED]="!!! Programa %1 não encontrado. Instale o programa e execute esse script novamente"
-MSG_PL[$MSG_MAIN_PROG_REQUIRED]="!!! Program %1 nie został znaleziony. Zainstaluj go i uruchom skrypt ponownie"
 MSG_MAIN_NO_ERROR_DETECTED=8
 MSG_EN[$MSG_MAIN_NO_ERROR_DETECTED]="--- No obvious errors/warnings detected. Post contents of file %1 in your favorite Linux forum and read $HTTP_UPLOAD_URL"
-MSG_FR[$MSG_MAIN_NO_ERROR_DETECTED]="--- Aucune erreur ou avertissement évidents détectés. Postez le contenu du fichier %1 dans votre forum Linux préféré et lisez $HTTP_UPLOAD_URL"
-MSG_CS[$MSG_MAIN_NO_ERROR_DETECTED]="--- Nejsou detekovány žádné zřejmé chyby/hlášení. Pošlete obsah souboru %1 do vašeho oblíbeného Linux fóra a přečtěte $HTTP_UPLOAD_URL"
-MSG_DE[$MSG_MAIN_NO_ERROR_DETECTED]="--- Keine offensichtlichen Konfigurationsfehler/-warnungen gefunden. Die Datei %1 im bevorzugten Linux Forum posten und $HTTP_UPLOAD_URL lesen."
-MSG_PT[$MSG_MAIN_NO_ERROR_DETECTED]="--- Nenhum erro/aviso óbvio detectado. Poste o conteúdo do arquivo %1 em seu fórum Linux preferido e leia $HTTP_UPLOAD_URL"
-MSG_PL[$MSG_MAIN_NO_ERROR_DETECTED]="--- Nie znaleziono żadnego oczywistego błędu lub ostrzeżenia. Umieść zawartość pliku %1 na swoim ulubionym forum i przeczytaj $HTTP_UPLOAD_URL"
 MSG_ASK_LANG=9
 MSG_EN[$MSG_ASK_LANG]="--- Do you want to post the result file in an international forum (y/[n])?"
-MSG_FR[$MSG_ASK_LANG]="--- Voulez-vous envoyer le fichier résultat à un forum international (o/[n])?"
-MSG_CS[$MSG_ASK_LANG]="--- Chcete poslat soubour s výsledky do mezinárodního fóra (a/[n])?"
-MSG_DE[$MSG_ASK_LANG]="--- Soll das Ergebnisfile in einem internationalen Forum gepostet werden (j/[n])?"
-MSG_PT[$MSG_ASK_LANG]="--- Você quer postar o arquivo resultante em um fórum internacional (s/[n])?"
-MSG_PL[$MSG_ASK_LANG]="--- Czy chcesz opublikować wyniki na międzynarodowym forum (t/[n])?"
 MSG_SELECT_LANG=10
 MSG_EN[$MSG_SELECT_LANG]="--- Please answer with yes (Y) or no (N):"
-MSG_FR[$MSG_SELECT_LANG]="--- S'il vous plaît répondre par oui (O) ou non (N):"
-MSG_CS[$MSG_SELECT_LANG]="--- Prosím, odpovězte takhle: ano (A) nebo ne (N):"
-MSG_DE[$MSG_SELECT_LANG]="--- Bitte mit ja (J) oder nein (N) antworten:"
-MSG_PT[$MSG_SELECT_LANG]="--- Por favor responda sim (S) ou não (N):"
-MSG_PL[$MSG_SELECT_LANG]="--- Proszę odpowiedz tak (T) lub nie (N):"
 MSG_GET_TOPOLOGY=11
 MSG_EN[$MSG_GET_TOPOLOGY]="--- What's the type of networktopology?"
-MSG_FR[$MSG_GET_TOPOLOGY]="--- Quel est le type de topologie du reséau?"
-MSG_CS[$MSG_GET_TOPOLOGY]="--- Jaký je typ síťové topologie ?"
-MSG_DE[$MSG_GET_TOPOLOGY]="--- Welche Netzwerktopologie liegt vor?"
-MSG_PT[$MSG_GET_TOPOLOGY]="--- Qual é a topologia da rede?"
-MSG_PL[$MSG_GET_TOPOLOGY]="--- Jaki jest typ topologi sieci?"
 MSG_UNSUPPORTED_TOPOLOGY=12
 MSG_EN[$MSG_UNSUPPORTED_TOPOLOGY]="--- Unknown topology"
-MSG_FR[$MSG_UNSUPPORTED_TOPOLOGY]="--- Topologie inconnue"
-MSG_CS[$MSG_UNSUPPORTED_TOPOLOGY]="--- Neznámá topologie"
-MSG_DE[$MSG_UNSUPPORTED_TOPOLOGY]="--- Netzwerktopologie unbekannt"
-MSG_PT[$MSG_UNSUPPORTED_TOPOLOGY]="--- Topologia desconhecida"
-MSG_PL[$MSG_UNSUPPORTED_TOPOLOGY]="--- Nieznana topologia"
 MSG_STRING=13
 MSG_EN[$MSG_STRING]="%1."
 MSG_PLEASE_CORRECT_ANSWER=14
 MSG_EN[$MSG_PLEASE_CORRECT_ANSWER]="--- Please answer with 1-%1: "
-MSG_FR[$MSG_PLEASE_CORRECT_ANSWER]="--- S'il vous plaît répondre avec 1-%1:"
-MSG_CS[$MSG_PLEASE_CORRECT_ANSWER]="--- Prosím odpovězte s 1-%1: "
-MSG_DE[$MSG_PLEASE_CORRECT_ANSWER]="--- Bitte mit 1-%1 anworten: "
-MSG_PT[$MSG_PLEASE_CORRECT_ANSWER]="--- Por favor responda com 1-%1: "
-MSG_PL[$MSG_PLEASE_CORRECT_ANSWER]="--- Proszę odpowiedz 1-%1: "
 MSG_TOPO_DM_LC=15
 MSG_EN[$MSG_TOPO_DM_LC]="--- (1) DSL modem <---> LinuxClient"
-MSG_FR[$MSG_TOPO_DM_LC]="--- (1) Modem DSL <---> Client Linux"
-MSG_CS[$MSG_TOPO_DM_LC]="--- (1) DSL modem <---> Linux klient"
-MSG_DE[$MSG_TOPO_DM_LC]="--- (1) DSL modem <---> LinuxClient"
-MSG_PT[$MSG_TOPO_DM_LC]="--- (1) Modem DSL <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_DM_LC]="--- (1) modem DSL <----> Klient Linux"
 MSG_TOPO_DR_LC=16
 MSG_EN[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> LinuxClient"
-MSG_FR[$MSG_TOPO_DR_LC]="--- (2) Routeur HW DSL <---> Client Linux"
-MSG_CS[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> Linux klient"
-MSG_DE[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> LinuxClient"
-MSG_PT[$MSG_TOPO_DR_LC]="--- (2) Roteador DSL <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> Klient Linux"
 MSG_TOPO_DM_LR_LC=17
 MSG_EN[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> LinuxRouter <---> LinuxClient"
-MSG_FR[$MSG_TOPO_DM_LR_LC]="--- (3) Modem DSL <--->  Routeur Linux <---> Client Linux"
-MSG_CS[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> Linux Router <---> Linux klient"
-MSG_DE[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> LinuxRouter <---> LinuxClient"
-MSG_PT[$MSG_TOPO_DM_LR_LC]="--- (3) Modem DSL <---> Roteador Linux <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> LinuxRouter <---> Klient Linux"
 MSG_TOPO_DR_LR_LC=18
 MSG_EN[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> LinuxClient"
-MSG_FR[$MSG_TOPO_DR_LR_LC]="--- 4) Routeur HW DSL<---> Routeur Linux <---> Client Linux"
-MSG_CS[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> LinuxClient"
-MSG_DE[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> LinuxClient"
-MSG_PT[$MSG_TOPO_DR_LR_LC]="--- (4) Roteador DSL <---> Roteador Linux <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> Klient Linux"
 MSG_MAIN_POST_FILE=27
 MSG_EN[$MSG_MAIN_POST_FILE]="--- If you are unsuccessful then place the contents of file %1 in the net\n--- (see $HTTP_UPLOAD_URL for links) \n--- and then paste the nopaste link on your favorite Linux forum. "
-MSG_FR[$MSG_MAIN_POST_FILE]="--- Si vous ne réussissez pas,  placez le contenu du fichier %1 sur internet\n --- (voir $HTTP_UPLOAD_URL pour les liens) \n --- et puis collez le lien 'nopaste' sur votre forum Linux favori."
-MSG_CS[$MSG_MAIN_POST_FILE]="--- Pokud posílání selhalo, umístněte obsah souboru %1 na internet\n--- (viz $HTTP_UPLOAD_URL pro odkazy) \n--- a pak vložte odkaz na vaše oblíbené Linux fórum. "
-MSG_DE[$MSG_MAIN_POST_FILE]="--- Wenn eigene Lösungsversuche erfolglos waren dann den Inhalt der Datei %1 im Netz ablegen\n--- (Links siehe $HTTP_UPLOAD_URL) \n--- und dann der nopaste Link im bevorzugten Linux Forum posten."
-MSG_PT[$MSG_MAIN_POST_FILE]="--- Se você não foi bem sucedido poste o conteúdo do arquivo %1 na internet\n--- (veja $HTTP_UPLOAD_URL para links) \n--- e informe o link nopaste em seu fórum Linux preferido."
-MSG_PL[$MSG_MAIN_POST_FILE]="--- Jeżeli nie udało się proszę umieść zawartość pliku %1 w sieci\n--- (linki możesz znaleźć w $HTTP_UPLOAD_URL) \n--- i umieść link na swoim ulubionym forum. "
 MSG_GET_HOST=29
 MSG_EN[$MSG_GET_HOST]="--- On which host is the script executed?"
-MSG_FR[$MSG_GET_HOST]="--- Sur quel ordinateur hôte le script est-il exécuté?"
-MSG_CS[$MSG_GET_HOST]="--- Na kterém host-u je skript spuštěn?"
-MSG_DE[$MSG_GET_HOST]="--- Auf welchem Rechner wird das Script ausgeführt?"
-MSG_PT[$MSG_GET_HOST]="--- Em que host o script é executado?"
-MSG_PL[$MSG_GET_HOST]="--- Na jakim komputerze został uruchomiony skrypt?"
 MSG_UNSUPPORTED_HOST=30
 MSG_EN[$MSG_UNSUPPORTED_HOST]="--- Invalid host"
-MSG_FR[$MSG_UNSUPPORTED_HOST]="--- Hôte non valide"
-MSG_CS[$MSG_UNSUPPORTED_HOST]="--- Nesprávný host"
-MSG_DE[$MSG_UNSUPPORTED_HOST]="--- Ungültiger Rechner"
-MSG_PT[$MSG_UNSUPPORTED_HOST]="--- Host inválido"
-MSG_PL[$MSG_UNSUPPORTED_HOST]="--- Nieprawidłowy host"
 MSG_HOST_RT=31
 MSG_EN[$MSG_HOST_RT]="--- (2) LinuxRouter"
-MSG_FR[$MSG_HOST_RT]="--- (2) Routeur Linux"
-MSG_CS[$MSG_HOST_RT]="--- (2) Linux Router"
-MSG_DE[$MSG_HOST_RT]="--- (2) LinuxRouter"
-MSG_PT[$MSG_HOST_RT]="--- (2) Roteador Linux"
-MSG_PL[$MSG_HOST_RT]="--- (2) LinuxRouter"
 MSG_HOST_CL=32
 MSG_EN[$MSG_HOST_CL]="--- (1) LinuxClient"
-MSG_FR[$MSG_HOST_CL]="--- (1) Client Linux"
-MSG_CS[$MSG_HOST_CL]="--- (1) Linux klient"
-MSG_DE[$MSG_HOST_CL]="--- (1) LinuxClient"
-MSG_PT[$MSG_HOST_CL]="--- (1) Cliente Linux"
-MSG_PL[$MSG_HOST_CL]="--- (1) Klient Linux"
 MSG_MAIN_BECOME_ROOT=33
 MSG_EN[$MSG_MAIN_BECOME_ROOT]="--- Please enter the root password."
-MSG_FR[$MSG_MAIN_BECOME_ROOT]="--- S'il vous plaît entrez le mot de passe root."
-MSG_CS[$MSG_MAIN_BECOME_ROOT]="--- Prosím vložte root heslo."
-MSG_DE[$MSG_MAIN_BECOME_ROOT]="--- Bitte das root Kennwort eingeben."
-MSG_PT[$MSG_MAIN_BECOME_ROOT]="--- Por favor digite a senha de root."
-MSG_PL[$MSG_MAIN_BECOME_ROOT]="--- Proszę wprowadzić hasło użytkownika root."
 MSG_CON_WRD=40
 MSG_EN[$MSG_CON_WRD]="--- (2) Wired connection"
-MSG_FR[$MSG_CON_WRD]="--- (2) Connexion filaire"
-MSG_CS[$MSG_CON_WRD]="--- (2) Drátové připojení"
-MSG_DE[$MSG_CON_WRD]="--- (2) Kabelgebundene Verbindung"
-MSG_PT[$MSG_CON_WRD]="--- (2) Conexão cabeada"
-MSG_PL[$MSG_CON_WRD]="--- (2) Połączenie przewodowe"
 MSG_GET_CONNECTION=41
 MSG_EN[$MSG_GET_CONNECTION]="--- Which type of your network connection should be tested?"
-MSG_FR[$MSG_GET_CONNECTION]="--- Quel type de connexion de votre réseau doit être testé?"
-MSG_CS[$MSG_GET_CONNECTION]="--- Který typ vašeho síťového připojení se má testovat?"
-MSG_DE[$MSG_GET_CONNECTION]="--- Welcher Netzwerkverbindungtyp soll getestet werden?"
-MSG_PT[$MSG_GET_CONNECTION]="--- Que tipo de conexão da sua rede deve ser testado?"
-MSG_PL[$MSG_GET_CONNECTION]="--- Który typ połączenia sieciowego ma zostać przetestowany?"
 MSG_UNSUPPORTED_CONNECTION=42
 MSG_EN[$MSG_UNSUPPORTED_CONNECTION]="--- Unknown network connection type"
-MSG_FR[$MSG_UNSUPPORTED_CONNECTION]="--- Type de connexion réseau inconnu"
-MSG_CS[$MSG_UNSUPPORTED_CONNECTION]="--- Neznámý typ připojení"
-MSG_DE[$MSG_UNSUPPORTED_CONNECTION]="--- Netzwerkverbindungstyp unbekannt"
-MSG_PT[$MSG_UNSUPPORTED_CONNECTION]="--- Tipo de conexão desconhecido"
-MSG_PL[$MSG_UNSUPPORTED_CONNECTION]="--- Nieznany typ połączenia sieciowego"
 MSG_EMPTY_LINE=43
 MSG_EN[$MSG_EMPTY_LINE]=""
 MSG_MAIN_GOTO_LINK=44
 MSG_EN[$MSG_MAIN_GOTO_LINK]="--- Go to $HTTP_HELP_URL to get more detailed instructions \n--- about the error/warning messages and how to fix the problems on your own."
-MSG_FR[$MSG_MAIN_GOTO_LINK]="--- Visitez $HTTP_HELP_URL pour obtenir des instructions plus détaillées \n --- sur les messages d'erreur/avertissement et comment résoudre vous même les problèmes."
-MSG_CS[$MSG_MAIN_GOTO_LINK]="--- Jděte na $HTTP_HELP_URL pro získaní více detailních instrukcí \n--- o cybě/hlášení a jak problém manuálně opravit."
-MSG_DE[$MSG_MAIN_GOTO_LINK]="--- Gehe zu $HTTP_HELP_URL um detailliertere Hinweise \n--- zu den Fehlermeldungen/Warnungen zu bekommen und wie die Fehler selbst beseitigt werden können."
-MSG_PT[$MSG_MAIN_GOTO_LINK]="--- Acesse $HTTP_HELP_URL para obter instruções detalhadas \n--- sobre mensagens de erro/aviso e como resolver os problemas por conta própria."
-MSG_PL[$MSG_MAIN_GOTO_LINK]="--- Przejdź do $HTTP_HELP_URL aby uzyskać szczegółowe instrukcje \n--- na temat błędów oraz ostrzeżeń oraz w jaki sposób samodzielnie usunąć problemy."
 MSG_TOPO_AP_LC=46
 MSG_EN[$MSG_TOPO_AP_LC]="--- (1) WLAN access point <---> LinuxClient"
-MSG_FR[$MSG_TOPO_AP_LC]="--- (1) Point d'accès WLAN <---> Client Linux"
-MSG_CS[$MSG_TOPO_AP_LC]="--- (1) WLAN access point <---> Linux klient"
-MSG_DE[$MSG_TOPO_AP_LC]="--- (1) WLAN access point <---> LinuxClient"
-MSG_PT[$MSG_TOPO_AP_LC]="--- (1) Ponto de acesso wireless <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_AP_LC]="--- (1) Punkt dostępowy WLAN <---> Klient Linux"
 MSG_TOPO_WR_LC=47
 MSG_EN[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> LinuxClient"
-MSG_FR[$MSG_TOPO_WR_LC]="--- (2) Routeur HW WLAN <---> Client Linux"
-MSG_CS[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> Linux klient"
-MSG_DE[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> LinuxClient"
-MSG_PT[$MSG_TOPO_WR_LC]="--- (2) Roteador wireless <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> Klient Linux"
 MSG_TOPO_AP_LR_LC=48
 MSG_EN[$MSG_TOPO_AP_LR_LC]="--- (3) WLAN access point <---> LinuxRouter <---> LinuxClient"
-MSG_FR[$MSG_TOPO_AP_LR_LC]="--- (3) Réseau sans fil <---> Routeur Linux <---> Client Linux"
-MSG_CS[$MSG_TOPO_AP_LR_LC]="--- (3) WLAN access point <---> Linux Router <---> Linux klient"
-MSG_DE[$MSG_TOPO_AP_LR_LC]="--- (3) WLAN access point <---> LinuxRouter <---> LinuxClient"
-MSG_PT[$MSG_TOPO_AP_LR_LC]="--- (3) Ponto de acesso wireless <---> Roteador Linux <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_AP_LR_LC]="--- (3) Punkt dostępowy WLAN <---> LinuxRouter <---> Klient Linux"
 MSG_TOPO_WR_LR_LC=49
 MSG_EN[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> LinuxRouter <---> LinuxClient"
-MSG_FR[$MSG_TOPO_WR_LR_LC]="--- (4) Routeur HW WLAN <---> Routeur Linux <---> Client Linux"
-MSG_CS[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> Linux Router <---> Linux klient"
-MSG_DE[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> LinuxRouter <---> LinuxClient"
-MSG_PT[$MSG_TOPO_WR_LR_LC]="--- (4) Roteador wireless <---> Roteador Linux <---> Cliente Linux"
-MSG_PL[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> LinuxRouter <---> Klient Linux"
 MSG_ASK_FOR_ROOT=59
 MSG_EN[$MSG_ASK_FOR_ROOT]="--- Invoking this script as root allows a more detailed analysis and will give better results. \n--- If you have any concerns to execute the script as root please read $HTTP_ROOT_ACCESS.\n--- Do you want to run the script as root ([y]/n)?"
-MSG_FR[$MSG_ASK_FOR_ROOT]="--- Invoquer ce script en tant que root permet une analyse plus détaillée et donnera de meilleurs résultats. \n --- Si vous avez des inquiétudes sur l' exécution du script en tant que root, s'il vous plaît lisez $HTTP_ROOT_ACCESS. \n --- Voulez-vous exécuter le script en tant que root ([o] / n)"
-MSG_CS[$MSG_ASK_FOR_ROOT]="--- Spyštění skriptu jako root umožňuje detailnější analýzu a lepší výsledky. \n--- Pokud máte jakékoli zaujetí spustit skript jako root, prosím přečtěte si $HTTP_ROOT_ACCESS.\n--- Chcete spustit skript jako root ([a]/n)?"
-MSG_DE[$MSG_ASK_FOR_ROOT]="--- Der Aufruf des Scripts als root erlaubt eine detailiertere Analyse und liefert bessere Ergebnisse. \n--- Falls Bedenken existieren das Script als root auszuführen bitte $HTTP_ROOT_ACCESS lesen.\n--- Willst Du das Script als root ausführen lassen ([j]/n)?"
-MSG_PT[$MSG_ASK_FOR_ROOT]="--- Executar esse script como root permite uma análise mais detalhada e melhores resultados. \n--- Se você se preocupa em executar o script como root por favor leia $HTTP_ROOT_ACCESS.\n--- Você quer executar o script como root ([s]/n)?"
-MSG_PL[$MSG_ASK_FOR_ROOT]="--- Uruchomienie tego skryptu jako root pozwala na uzyskanie bardziej szczegółowej analizy i przeważnie daje lepsze rezultaty.\n--- Jeżeli masz jakiekolwiek obawy z uruchamianiem skryptu jako root proszę przeczytaj $HTTP_ROOT_ACCESS.\n --- Czy mam uruchomić skrypt jak użytkownik root ([t]/n)?"
 MSG_GET_ESSID=60
 MSG_EN[$MSG_GET_ESSID]="--- Please enter the WLAN SSID you want to connect to (Will be masqueraded in output file): "
-MSG_FR[$MSG_GET_ESSID]="--- S'il vous plaît, indiquez le SSID du WLAN auquel vous voulez vous connecter (il sera masqué dans le fichier de sortie):"
-MSG_CS[$MSG_GET_ESSID]="--- Prosím vložte WLAN SSID ke kterému se chcete připojit (bude změněno ve výsledném souboru): "
-MSG_DE[$MSG_GET_ESSID]="--- Bitte die WLAN SSID zu der verbunden werden soll eingeben (Wird in der Ausgabedatei maskiert): "
-MSG_PT[$MSG_GET_ESSID]="--- Por favor digite a SSID da rede sem fio à qual quer se conectar (será mascarada no arquivo de saída): "
-MSG_PL[$MSG_GET_ESSID]="--- Proszę wprowadź nazwę sieci bezprzewodowej (WLAN SSID) do której chcesz się połączyć (nazwa będzie niewidoczna w pliku wynikowym): "
 MSG_GOT_ESSID=61
 #         Attention: Message text below used in regex to masquerade SSID !
 MSG_EN[$MSG_GOT_ESSID]="--- WLAN SSID to connect to: %1"
-MSG_FR[$MSG_GOT_ESSID]="--- WLAN SSID à connecter: %1"
-MSG_CS[$MSG_GOT_ESSID]="--- WLAN SSID připojit: %1"
-MSG_DE[$MSG_GOT_ESSID]="--- WLAN SSID zu der verbunden werden soll: %1"
-MSG_PT[$MSG_GOT_ESSID]="--- WLAN SSID da rede local sem fio a conectar: %1"
-MSG_PL[$MSG_GOT_ESSID]="--- WLAN SSID do połączenia: %1"
 
 MSG_ASK_FOR_XLATION=62
 MSG_EN[$MSG_ASK_FOR_XLATION]="==> Messages for your language are not translated right now and thus you get all messages in English.\n==> Any help to translate messages into your language is welcome.\n==> There is no programming expertise required. Native speakers will need about 1 hour to translate the messages.\n==> Pls goto $HTTP_XLATE_URL to get more details how to help to translate script messages into your language."
@@ -525,310 +361,97 @@ MSG_EN[$MSG_ASK_FOR_XLATION]="==> Messages for your language are not translated
 #
 MSG_NO_NIC_FOUND=300
 MSG_EN[$MSG_NO_NIC_FOUND]="!!! CND0100E: No network card for the selected connection type was found on the system"
-MSG_FR[$MSG_NO_NIC_FOUND]="!!! CND0100E: Aucune carte réseau pour le type de connexion sélectionné a été trouvée sur le système"
-MSG_CS[$MSG_NO_NIC_FOUND]="!!! CND0100E: Nenašla se žádná síťová karta  pro zvolený typ připojení"
-MSG_DE[$MSG_NO_NIC_FOUND]="!!! CND0100E: Keine Netzwerkkarte für den gewählten Verbindungstyp kann auf dem System gefunden werden"
-MSG_PT[$MSG_NO_NIC_FOUND]="!!! CND0100E: Nenhuma placa de rede para a conexão escolhida foi encontrada no sistema"
-MSG_PL[$MSG_NO_NIC_FOUND]="!!! CND0100E: Nie znaleziono kart sieciowych umożliwiających połączenie wybranego typu"
 MSG_NO_VALID_NI_FOUND=301
 MSG_EN[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: For the selected connection type there was no active network interface found on your system"
-MSG_FR[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Aucune interface réseau active n'a été trouvée sur votre système pour le type de connexion sélectionnée."
-MSG_CS[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Nenašlo se žádné aktivní síťové rozhraní pro zvolený typ připojení"
-MSG_DE[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Es wurde keine aktives Netzwerkinterface auf dem System für der gewählten Verbindungstyp gefunden"
-MSG_PT[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Nenhuma interface de rede ativa foi encontrada no sistema para a conexão escolhida"
-MSG_PL[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Nie aktywnych urządzeń dla wybranego typu połączenia"
 MSG_NO_IP_ASSIGNED_TO_NIC=302
 MSG_EN[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Network card %1 has no IP address"
-MSG_FR[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: La carte réseau %1 n'a pas d'adresse IP"
-MSG_CS[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Síťová karta %1 nemá žádnou IP adresu"
-MSG_DE[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Die Netzwerkkarte %1 hat keine IP Adresse"
-MSG_PT[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: A placa de rede %1 não está associada a um endereço IP"
-MSG_PL[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Karta sieciowa %1 nie ma przydzielonego adresu IP"
 MSG_DUPLICATE_NETWORKS=303
 MSG_EN[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: There is more than one network card defined in the same subnet: %1"
-MSG_FR[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Il y a plus d'une carte réseau définies dans le même sous-réseau: %1"
-MSG_CS[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Je definováno více síťových karet  ve stejném subnet-u/podsíti: %1"
-MSG_DE[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Es ist mehr als eine Netzwerkkarte im selben Subnetz definiert: %1"
-MSG_PT[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Há mais de uma placa de rede associada à mesma subrede: %1"
-MSG_PL[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Więcej niż jedna karta sieciowa jest przydzielona do tej samej podsieci: %1"
 MSG_NO_DEFAULT_GATEWAY_SET=304
 MSG_EN[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: No default gateway set on your system"
-MSG_FR[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Aucune passerelle n'est définie sur votre système"
-MSG_CS[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: V systému není nastavena žádná brana/gateway"
-MSG_DE[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Kein default gateway auf dem System definiert"
-MSG_PT[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Gateway padrão não especificado nesse sistema"
-MSG_PL[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Brak domyślnej bramy"
 MSG_CHECK_DEFAULT_GATEWAY_SETTING=305
 MSG_EN[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: There might be a problem with the default gateway definition %1 on interface %2"
-MSG_FR[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Il pourrait y avoir un problème avec la définition de la passerelle par défaut %1 sur l'interface %2"
-MSG_CS[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Může být problém s přednastavenou bránou %1 v síťovém rozhraní %2"
-MSG_DE[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Es kann ein Problem mit der default gateway definition %1 am Interface %2 vorliegen"
-MSG_PT[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Pode haver um problema com a especificação do gateway padrão %1 na interface %2"
-MSG_PL[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Ustawienie domyślnej bramy %1 na urządzeniu %2 może stwarzać problemy"
 MSG_NAMESERVER_NOT_ACCESSIBLE=306
 MSG_EN[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Unable to access nameserver with IP %1 defined in /etc/resolv.conf"
-MSG_FR[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Impossible d'accéder au serveur de noms d' IP %1 défini dans /etc/resolv.conf"
-MSG_CS[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Nemohu se připojit nameserver s IP %1 nastavenou v /etc/resolv.conf"
-MSG_DE[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Auf den definierter Nameserver mit der IP %1 in /etc/resolv.conf kann nicht zugegriffen werden"
-MSG_PT[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Não foi possível acessar o servidor de nomes %1 especificado em /etc/resolv.conf"
-MSG_PL[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Serwer nazw %1 zdefiniowany w pliku /etc/resolv.conf jest nieosiągalny"
 MSG_NO_NAMESERVER_DEFINED=307
 MSG_EN[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: No nameserver defined in /etc/resolv.conf"
-MSG_FR[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Aucun serveur de noms défini dans /etc/resolv.conf "
-MSG_CS[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Není nastavený žádný nameserver v /etc/resolv.conf"
-MSG_DE[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Kein Nameserver in /etc/resolv.conf definiert"
-MSG_PT[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Nenhum servidor de nomes especificado em /etc/resolv.conf"
-MSG_PL[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Brak zdefiniowanych serwerów nazw (DNS) w pliku /etc/resolv.conf"
 MSG_CANT_PING_EXTERNAL_IP=308
 MSG_EN[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: The system can't ping external IP address %1"
-MSG_FR[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Le système ne peut pas pinguer l'adresse IP externe %1"
-MSG_CS[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Systém nemůže provést ping test externí IP adresy %1"
-MSG_DE[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Das System kann die externe IP %1 nicht pingen"
-MSG_PT[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: O sistema não consegue dar ping no IP %1"
-MSG_PL[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Komenda ping nie może dotrzeć do zewnętrznego adresu IP %1"
 MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS=309
 MSG_EN[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: WLAN firmware is missing or cannot be loaded"
-MSG_FR[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: Le firmware pour WLAN est absent ou ne peut pas être chargé"
-MSG_CS[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: Chybí nebo nemohu nahrát WLAN firmware"
-MSG_DE[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: WLAN Firmware fehlt oder kann nicht geladen werden"
-MSG_PT[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: O firmware da rede sem fio está faltando ou não pode ser carregado"
-MSG_PL[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: Brak firmware dla WLAN bądź nie może on zostać załadowany"
 MSG_POSSIBLE_MTU_PROBLEMS=310
 MSG_EN[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Maximum possible MTU is %1, but actual MTU on nic %2 is %3"
-MSG_FR[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Le MTU maximum possible est de %1, mais le MTU réel sur la plaque réseau %2 est de %3"
-MSG_CS[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Maximum možného MTU je %1, ale nynější MTU na kartě %2 je %3"
-MSG_DE[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Die maximal ermittelte MTU ist %1, aber die aktuelle MTU an der Netzwerkkarte %2 ist %3"
-MSG_PT[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: O MTU máximo é %1, mas o MTU real na placa de rede %2 é %3"
-MSG_PL[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Maksymalne możliwe MTU wynosi %1, lecz aktualnie ustawione na karcie %2 jest %3"
 MSG_APIPA_DETECTED=311
 MSG_EN[$MSG_APIPA_DETECTED]="!!! CND0210W: APIPA IP address %1 detected on network card %2"
-MSG_FR[$MSG_APIPA_DETECTED]="!!! CND0210W: Adresse IP APIPA  %1 détectée sur la carte réseau %2"
-MSG_CS[$MSG_APIPA_DETECTED]="!!! CND0210W: APIPA IP adresa %1 detekována na síťové kartě %2"
-MSG_DE[$MSG_APIPA_DETECTED]="!!! CND0210W: APIPA IP Adresse %1 wurde an Netzwerkkarte %2 entdeckt"
-MSG_PT[$MSG_APIPA_DETECTED]="!!! CND0210W: Endereço IP %1 APIPA detectado na placa de rede %2"
-MSG_PL[$MSG_APIPA_DETECTED]="!!! CND0210W: Na karcie %2 przydzielony jest awaryjny automatyczny adres sieciowy (APIPA)"
 MSG_NIC_ERRORS=312
 MSG_EN[$MSG_NIC_ERRORS]="!!! CND0220W: Serious transmission errors on network interface %1 detected"
-MSG_FR[$MSG_NIC_ERRORS]="!!! CND0220W: Erreurs graves de transmission sur l'interface de réseau %1 détectée"
-MSG_CS[$MSG_NIC_ERRORS]="!!! CND0220W: Objevily se vážné přenosové chyby v síťovém rozhraní %1 "
-MSG_DE[$MSG_NIC_ERRORS]="!!! CND0220W: Ungewöhnlich viele Übertragungsfehler am Interface %1 entdeckt"
-MSG_PT[$MSG_NIC_ERRORS]="!!! CND0220W: Erros sérios de transmissão detectados na placa de rede %1"
-MSG_PL[$MSG_NIC_ERRORS]="!!! CND0220W: Na urządzeniu %1 wykryto poważne błędy transmisji"
 MSG_IPV6_DETECTED=313
 MSG_EN[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 enabled and may be the reason for network problems"
-MSG_FR[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 activé"
-MSG_CS[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 povolené"
-MSG_DE[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 ist eingeschaltet und kann der Grund für Netzwerkprobleme sein"
-MSG_PT[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 habilitado"
-MSG_PL[$MSG_IPV6_DETECTED]="!!! CND0230W: Włączony protokół IPV6"
 MSG_KNETWORKMANAGER_ERROR=314
 MSG_EN[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager for network configuration enabled but a YAST network card configuration for %1 exist"
-MSG_FR[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: le networkmanager pour configuration du réseau est actif, mais il existe une configuration YAST de carte réseau pour %1"
-MSG_CS[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager pro síťovou konfiguraci je povolen, ale existuje YAST konfigurace síťové karty pro %1 "
-MSG_DE[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager wird für die Netzwerkkonfiguration benutzt aber eine YAST Netzwerkkartenkonfiguration für %1 existiert"
 MSG_E[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager for network configuration enabled but a YAST network card configuration for %1 exist"
-MSG_PL[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager jest włączony ale jednocześnie karta sieciowa %1 jest skonfigurowana poprzez YAST"
 MSG_CANT_LOOKUP_EXTERNAL_DNS=315
 MSG_EN[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: The system can't lookup external DNS name %1"
-MSG_FR[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: Le système ne peut pas rechercher le DNS externe %1 "
-MSG_CS[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: System nemůže vyhledat externí DNS jméno %1"
-MSG_DE[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: Das System kann den externen Namen %1 nicht auflösen"
-MSG_PT[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: O sistema não consegue resolver o nome DNS externo %1"
-MSG_PL[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: Nie można odpytać zewnętrznego serwera nazw (DNS) %1"
 MSG_NDISWRAPPER_PROB=316
 MSG_EN[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper for %1 can't be used in parallel with linux native driver %2"
-MSG_FR[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper pour %1 ne peut pas être utilisé en parallèle avec le pilote Linux natif %2"
-MSG_CS[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper pro %1 nemůže být použit paralelně s linuxovým vlastním ovladačem %2"
-MSG_DE[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper für %1 kann nicht gemeinsam mit dem linux Treiber %2 benutzt werden"
-MSG_PT[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper para %1 não pode ser usado junto com o driver nativo do Linux %2"
-MSG_PL[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndsiwrpaper dla %1 nie może być użyty razem z natywnym sterownikiem dla linuxa %2"
 MSG_NDISWRAPPER_FW_PROB=317
 MSG_EN[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Used windows driver %1 was either not installed completely (e.g. sys files are missing)\n--- or is from a wrong windows version (e.g. Win 98 instead of XP)"
-MSG_FR[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Le pilote Windows %1 n'est soit pas installé complètement (fichiers système manquants, par exemple) \ n --- ou provient d'une version incorrecte de Windows (par exemple, 98 au lieu de Win XP)"
-MSG_CS[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Použitý windows ovladč %1 je neúplně nainstalován (např. chybí sys soubory)\n--- nebo je ze špatné windows verzi (např. Win 98 namísto XP)"
-MSG_DE[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Der verwendete Windowstreiber %1 wurde entweder nicht vollständig installiert (Treiberbestandteile fehlen z.B. sys Dateien)\n--- oder ist von der falschen Windows-Version (z.B. Win 98 statt XP)"
-MSG_PT[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: O driver Windows %1 usado não foi instalado completamente (p. ex. arquivos .sys faltando)\n--- ou são de uma versão windows incompatível (p. ex. Win 98 em vez de XP)"
-MSG_PL[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Używany sterownik Windows %1 nie został w całości zainstalowany (np. brak niektórych plików systemowych)\n--- bądź jest ze złej wersji Windows (np. Win98 zamiast XP)"
 MSG_NDISWRAPPER_ARCH_PROB=318
 MSG_EN[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Incompatible windows driver architecture of %1 and Linux architecture (32 bit and 64 bit architecture mixed)"
-MSG_FR[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Les architectures du pilote Windows de %1 et de Linux sont incompatibles (mélange d'architectures 32 bits et 64 bits)"
-MSG_CS[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Nekompatibilní architektura windows ovladače %1 a Linux architektury (32 bit a 64 bit smíchané architektury)"
-MSG_DE[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Inkompatible Windowstreiber Architektur von %1 und Linux Architektur (32 Bit und 64 Bit Architektur gemischt)"
-MSG_PT[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Arquiteturas incompatíveis dos drivers Windows %1 e Linux (32 bits e 64 bits misturadas)"
-MSG_PL[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Wersja sterowników Windows %1 niekompatybilna z architekturą Linuxa (Wymieszana architektura 32- i 64 bitowa)"
 MSG_NO_NIC_CONFIG_FOUND=319
 MSG_EN[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: No network configuration found for interface %1"
-MSG_FR[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Configuration réseau introuvable pour l'interface %1"
-MSG_CS[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Nenašla se žádná síťová konfigurace pro rozhraní %1"
-MSG_DE[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Keine Netzwerkkonfiguration für Interface %1 gefunden"
-MSG_PT[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Nenhuma configuração de rede encontrada para a interface %1"
-MSG_PL[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Nie znaleziono konfiguracji dla urządzenia %1"
 MSG_NO_DHCP_FOUND=320
 MSG_EN[$MSG_NO_DHCP_FOUND]="!!! CND0300E: No dhcp server found on interface %1"
-MSG_FR[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Pas trouvé de serveur dhcp sur l'interface %1"
-MSG_CS[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Nenašel se DHCP server found pro rozhraní %1"
-MSG_DE[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Keinen dhcp Server am Interface %1 gefunden"
-MSG_PT[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Nenhum servidor DHCP encontrado na interface %1"
-MSG_PL[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Nie znaleziono serwera DHCP na urządzeniu %1"
 MSG_IFUP_CONFIGURED=321
 MSG_EN[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Classic network configuration with ifup was detected. Configuration with networkmanager is easier"
-MSG_FR[$MSG_IFUP_CONFIGURED]="!!! CND0310W: une configuration classique de réseau par ifup a été détectée. La configuration par networkmanager est beaucoup plus facile"
-MSG_CS[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Detekována klasická síťová konfigurace s ifup. Konfigurace s networkmanager-em je mnohem lehčí"
-MSG_DE[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Klassische Netzwerkkonfiguration mit ifup wurde entdeckt. Die Konfiguration mit networkmanager ist einfacher"
-MSG_PT[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Configuração ifup clássica detectada. A configuração com o networkmanager é bem mais fácil"
-MSG_PL[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Wykryto standardową konfigurację sieciową poprzez ifup. Konfiguracja z użyciem networkmanager jest znacznie prostsza."
 MSG_WLAN_KILL_SWITCH_ON=322
 MSG_EN[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN turned off by hardware or software switch"
-MSG_FR[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN désactivé par interrupteur materiel ou logiciel"
-MSG_CS[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN je vypnuté hardwarovám nebo softwarovým přepínačem/switch-em"
-MSG_DE[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN ist mit dem Hardware oder Software Switch ausgeschaltet"
-MSG_PT[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: Rede sem fio desligada por interruptor de hardware ou software"
-MSG_PL[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: Sieć bezprzewodowa została wyłączona z poziomu sprzętowego bądź programowego"
 MSG_WLAN_AUTH_PROBS=323
 MSG_EN[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: WLAN credential problems exist on interface %1"
-MSG_FR[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Des problèmes d'authenticité du WLAN existent sur l'interface %1"
-MSG_CS[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: WLAN potíže existují na rozhraní %1"
-MSG_DE[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Es existierern Schlüsselprobleme am Interface %1"
-MSG_PT[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Problema de credenciais de rede sem fio na interface %1"
-MSG_PL[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Na urządzeniu %1 istnieje problem z uwierzytelnianiem WLAN"
 MSG_NO_DHCP_DETECTED=324
 MSG_EN[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: dhcp server may not available on interface %1"
-MSG_FR[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: Serveur DHCP peut être indisponibles sur l' interface %1"
-MSG_CS[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: dhcp server může být nedostupný na rozhraní %1"
-MSG_DE[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: Ein dhcp Server scheint nicht am Interface %1 zu existieren"
-MSG_PT[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: O servidor DHCP pode não estar disponível na interface %1"
-MSG_PL[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: DHCP serwer może nie być dostępny dla urządzenia %1"
 MSG_WLAN_WIRED_ONLINE=325
 MSG_EN[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Wireless connection tested with an existing wired connection on interface %1. Unplug the cable and execute the script again"
-MSG_FR[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Connexion sans fil testée avec une connexion filaire existante sur interface %1. Débranchez le câble d'interface et exécutez le script à nouveau"
-MSG_CS[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Bezdrátobé připojení ostestováno s existujícím drátovým připojením  na rozhraní %1. Odpojte kabel a opět spusťte skript"
-MSG_DE[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Eine drahtlose Verbindung wurde getestet obwohl eine kabelgebundene Verbindung am Interface %1 existiert . Das Netzwerkkabel ausstecken und das Script noch einmal starten"
-MSG_PT[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Conexão sem fio testada com uma conexão cabeada na interface %1. Desconecte o cabo e execute o script novamente"
-MSG_PL[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Testy połączenia bezprzewodowego przeprowadzone z istniejącym połączeniem sieciowym na urządzeniu %1. Proszę odłącz kabel sieciowy i uruchom skrypt ponownie"
 MSG_CANT_PING_EXTERNAL_DNS=326
 MSG_EN[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: The system can't ping external DNS name %1"
-MSG_FR[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: Le système ne peut pas pinger le nom DNS externe %1"
-MSG_CS[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: System nemůže provést ping test pro externí DNS jméno %1"
-MSG_DE[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: Das System kann den externen DNS Namen %1 nicht pingen"
-MSG_PT[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: O sistema não consegue dar ping no nome DNS externo %1"
-MSG_PL[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: Serwer nazw %1 niedostępny z użyciem komendy ping"
 MSG_WLAN_NO_SCAN=327
 MSG_EN[$MSG_WLAN_NO_SCAN]="!!! CND0380E: No WLANs detected on interface %1. Hardware and/or driver not configured properly"
-MSG_FR[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Pas de WLANs détectés sur l'interface %1. Le matériel et/ou le pilote sont mal configurés"
-MSG_CS[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Nedetkováno žádné WLAN na rozhraní %1. Hardware a/nebo ovladač není správně nakonfigurovno"
-MSG_DE[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Es wurden keine WLANs am Interface %1 gefunden. Die Hardware und/oder Treiber ist nicht richtig konfiguriert"
-MSG_PT[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Nenhuma rede local sem fio detectada na interface %1. Hardware e/ou driver configurados erroneamente"
-MSG_PL[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Nie wykryto żadnych sieci bezprzewodowych na urządzeniu %1. Urządzeniu i/lub sterownik nie zostały prawidłowo skonfigurowane"
 MSG_HW_NO_ACTIVE=328
 MSG_EN[$MSG_HW_NO_ACTIVE]="!!! CND0390E: No loaded module detected for interface %1"
-MSG_FR[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Aucun module chargé n 'est détecté pour l'interface %1"
-MSG_CS[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Není detekován žádný nahraný modul pro rozhraní %1"
-MSG_DE[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Kein Module am Interface %1 geladen"
-MSG_PT[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Nenhum módulo carregado detectado para a interface %1"
-MSG_PL[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Brak załadowanego modułu dla urządzenia %1"
 MSG_HW_SOME_INACTIVE=329
 MSG_EN[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Alternate modules %1 detected for interface %2"
-MSG_FR[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Modules alternatifs %1 détectés pour l'interface %2"
-MSG_CS[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Alternativní modul %1 detekován pro rozhraní %2"
-MSG_DE[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Es existieren weitere mögliche Module %1 für Interface %2"
-MSG_PT[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Módulo alternativo %1 detectado para a interface %2"
-MSG_PL[$MSG_HW_SOME_INACTIVE]="!!! cnd0400W: Alternatywne moduły %1 zostały wykryte dla urządzenia %2"
 MSG_NAMESERVER_NOT_VALID=330
 MSG_EN[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Configured nameserver with IP %1 is no nameserver"
-MSG_FR[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Le DNS configuré par l' IP %1 n'est pas un serveur DNS"
-MSG_CS[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Nakonfigurovaný nameserver s IP %1 není nameserver"
-MSG_DE[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Der konfigurierte Nameserver mit der IP %1 ist kein Nameserver"
-MSG_PT[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Servidor de nomes configurado com IP %1 não é um servidor de nomes"
-MSG_PL[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Serwer nazw skonfigurowany pod adresem %1 nie jest właściwym serwerem nazw"
 MSG_NAMESERVER_PROBLEM_UNKNOWN=331
 MSG_EN[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: There exists a problem with configured nameserver with IP %1"
-MSG_FR[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Il y a un problème avec le serveur DNS configuré avec IP %1"
-MSG_CS[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Je problém s nakonfigurovaným nameserver-em s IP %1"
-MSG_DE[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Es gibt ein Problem mit dem konfigurierten Nameserver mit der IP %1"
-MSG_PT[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Existe um problema com o servidor de nomes configurado com IP %1"
-MSG_PL[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Wykryto problem z serwerem nazw skonfigurowanym pod adresem %1"
 MSG_NWELIZA_UNAVAILABLE=332
 MSG_EN[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza doesn't support this Linux distribution"
-MSG_FR[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza ne supporte pas cette distribution Linux"
-MSG_CS[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza nepodporuje tuto Linux distribuci"
-MSG_DE[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza unterstützt diese Linux distribution nicht"
-MSG_PT[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza não suporta essa distribuição Linux"
-MSG_PL[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza nie jest wspierana dla tej dystrybucji"
 MSG_DISTRO_NOT_SUPPORTED=333
 MSG_EN[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: This distribution is not supported"
-MSG_FR[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Cette distribution n'est pas supportée"
-MSG_CS[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Tato distribuce není podporována"
-MSG_DE[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Diese Distribution wird leider nicht unterstützt"
-MSG_PT[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Essa distribuição não é suportada"
-MSG_PL[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Ta dystrybucja nie jest wspierana"
 MSG_CHECK_KEYS=334
 MSG_EN[$MSG_CHECK_KEYS]="!!! CND0450W: WLAN key masquerading is not fully tested on this distribution. Please check output file %1 for visible WLAN keys and masquerade them manually"
-MSG_FR[$MSG_CHECK_KEYS]="!!! CND0450W: Le 'masquerading' WLAN n'est pas entièrement testé sur cette distribution. S'il vous plaît vérifiez sur le fichier de sortie %1 les clés WLAN visibles et 'mascaradez' manuellement"
-MSG_CS[$MSG_CHECK_KEYS]="!!! CND0450W: WLAN masquerading klíč není zcela otestován na této distribuci. Prosím, zkontrolujte výsledný soubor %1 pro viditelné WLAN klíče a zamaskujte je manuálně"
-MSG_DE[$MSG_CHECK_KEYS]="!!! CND0450W: WLAN Schlüsselmaskierung ist nicht vollständig auf dieser Distribution getestet. Bitte das Ausgabefile %1 nach sichtbaren WLAN Schlüsseln absuchen und manuell maskieren"
-MSG_PT[$MSG_CHECK_KEYS]="!!! CND0450W: O mascaramento da chave de rede sem fio não está completamente testado nessa distribuição. Cheque o arquivo %1 e mascare chaves visíveis manualmente"
-MSG_PL[$MSG_CHECK_KEYS]="!!! CND0450W: Maskowania kluczy WLAN dla tej dystrybucji nie zostało w pełni przetestowane. Proszę sprawdź plik z wynikami %1 czy są tam zapisane klucze WLAN i zamaskuj je ręcznie."
 MSG_NO_ANALYSIS_AS_USER=335
 MSG_EN[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analysis of %1 only possible if script is invoked as root"
-MSG_FR[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: L'analyse de %1 est seulement possible si le script est invoqué en tant que root"
-MSG_CS[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analýza %1 je možná pouze pokud je skript spuštěn jako root"
-MSG_DE[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analyse von %1 nur möglich wenn das Script als root aufgerufen wird"
-MSG_PT[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Análise de %1 só é possível se o script for executado como root"
-MSG_PL[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analiza %1 jest możliwa tylko jeżeli skrypt został uruchomiony jako użytkownik root"
 MSG_ANALYSIS_AS_USER=336
 MSG_EN[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Reduced analysis capability and less network information because script was not invoked as root"
-MSG_FR[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Capacité d'analyse réduite et moins d'informations de réseau parce que le script n'a pas été invoqué en tant que root"
-MSG_CS[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Analýza redukována a méně síťových informací, protože skript nebyl spuštěn jako root"
-MSG_DE[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Reduzierte Analysefähigkeit und weniger Netzwerkinformationen da das Script nicht als root ausgeführt wurde"
-MSG_PT[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Capacidade reduzida de análise e menos informações de rede porque o script não foi executado como root"
-MSG_PL[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Ponieważ skrypt nie został uruchomiony z prawami roota wiarygodność analizy oraz ilość informacji zostały obniżone"
 MSG_MISSING_LINK=337
 MSG_EN[$MSG_MISSING_LINK]="!!! CND0480W: No link detected on interface %1"
-MSG_FR[$MSG_MISSING_LINK]="!!! CND0480W: Pas de lien détecté sur l'interface %1"
-MSG_CS[$MSG_MISSING_LINK]="!!! CND0480W: Nneí deetekováno žádné spojení na rozhraní %1"
-MSG_DE[$MSG_MISSING_LINK]="!!! CND0480W: Es wurde kein Linksignal auf Interface %1 entdeckt"
-MSG_PT[$MSG_MISSING_LINK]="!!! CND0480W: Nenhuma conexão detectada na interface %1"
-MSG_PL[$MSG_MISSING_LINK]="!!! CND0480W: Brak połączenia na urządzeniu %1"
 MSG_WLAN_NO_SSID_IN_SCAN_FOUND=338
 MSG_EN[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: No access point with your SSID detected on interface %1"
-MSG_FR[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Aucun point d'accès avec votre SSID détecté sur l'interface %1"
-MSG_CS[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Není detekován žádny přístupový bod s vašim SSID  na rozhraní %1"
-MSG_DE[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Kein Accesspoint mit der benutzen SSID auf dem Interface %1 gefunden"
-MSG_PT[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Nenhum ponto de acesso com sua SSID detectado na interface %1"
-MSG_PL[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Nie znaleziono punktu dostępowego z podaną nazwą (SSID) dla urządzenia %1"
 MSG_SSID_SAME_CHANNEL=339
 MSG_EN[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Channel %1 used by your accesspoint is also used by %2 other access points"
-MSG_FR[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Canal %1 utilisé par votre point d'accès est également utilisée par %2 autres points d'accès"
-MSG_CS[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Kanál %1 použitý vašim přístupovým bodem je také použit %2 ostatními přístup. body"
-MSG_DE[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Der Kanal %1, der vom eigenen Accesspoint benutzt wird, wird von %2 weiteren Accesspoints genutzt"
-MSG_PT[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: O canal %1 usado por seu ponto de acesso também é usado por %2 outros pontos de acesso"
-MSG_PL[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Kanał %1 używany przez Twój punkt dostępowy jest wykorzystywany również %2 innych punktów"
 MSG_SSID_INTERFERENCES=340
 MSG_EN[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Channel %1 used by your accesspoint interferes with %2 adjacent access points"
-MSG_FR[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Canal %1 utilisé par votre point d'accès interfère avec %2 des points d'accès adjacents"
-MSG_CS[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Kanál %1 použitý vašim přístupovým bodem se míchá s %2 sousedícími přístup. body"
-MSG_DE[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Der Kanal %1, der vom eigenen Accesspoint benutzt wird, wird von %2 benachbarten Access Points überlagert"
-MSG_PT[$MSG_SSID_INTERFERENCES]="!!! CND0510W: O canal %1 usado por seu ponto de acesso interfere com %2 pontos de acesso adjacentes"
-MSG_PL[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Kanał %1 używany przez twój punkt dostępowy interferuje z %2 innymi punktami dostępowymi"
 MSG_NO_WPA_SUPPLICANT_ACTIVE=341
 MSG_EN[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant is not active"
-MSG_FR[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: Le wpa_supplicant n'est pas actif"
-MSG_CS[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant není aktivní"
-MSG_DE[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant ist nicht aktiv"
-MSG_PT[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa-supplicant não está ativo"
-MSG_PL[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant nie jest aktywny"
 MSG_ENL80211L=342
 MSG_EN[$MSG_ENL80211L]="!!! CND0530E: Module %1 requires WIRELESS_WPA_DRIVER='wext' to be configured"
-MSG_DE[$MSG_ENL80211L]="!!! CND0530E: Module %1 erfordert die Konfiguration von WIRELESS_WPA_DRIVER='wext'"
 MSG_NIC_DROPPED=343
 MSG_EN[$MSG_NIC_DROPPED]="!!! CND0540W: Messages dropped on network interface %1"
-MSG_DE[$MSG_NIC_DROPPED]="!!! CND0540W: Messages wurden am Netzwerkinterface %1 verworfen"
 MSG_NO_NIC_FOUND_WARNING=344
 MSG_EN[$MSG_NO_NIC_FOUND_WARNING]="!!! CND0550W: Unable to detect USB network card for the selected connection type"
-MSG_DE[$MSG_NO_NIC_FOUND_WARNING]="!!! CND0550W: Für den gewählten Netzwerkverbindungstyp konnte keine USB Netzwerkarte gefunden werden"
 MSG_INVALID_SSID=345
 MSG_EN[$MSG_INVALID_SSID]="!!! CND0560E: Invalid characters in SSIDs detected"
-MSG_DE[$MSG_INVALID_SSID]="!!! CND0560E: Es befinden sich ungültige Zeichen in der SSID"
 
 #################################################################################
 # Debug helper
@@ -854,9 +477,9 @@ function isCommandAvailable() {		# $1: command
 
       local ucCmd	  
       local rc 
-      ucCMD=`echo $1 | perl -e "print uc(<>);"`
+      ucCmd=${1^^}
    
-      if [[ "${!ucCMD}" == "" ]]; then
+      if [[ "${!ucCmd}" == "" ]]; then
 	 rc=1
       else
 	 rc=0
@@ -866,6 +489,119 @@ function isCommandAvailable() {		# $1: command
 
 }
 
+########################################################################
+#
+# --- Locate all commands of MODS_ALL and MODS_OPT and set the uppercase
+#     variable of a command to its path (empty if not found)
+#
+# The paths are taken from CND_TOOLS if exported by the invoking script,
+# from TOOL_CACHE if it's newer than all TOOL_DIRS or by testing all
+# TOOL_DIRS. The result is exported in CND_TOOLS (MOD=path MOD=path ...)
+#
+########################################################################
+
+function discoverTools() {
+
+   local mod
+   local dir
+   local p
+   local tools
+
+   if setTools "$CND_TOOLS"; then
+      return
+   fi
+
+   if isToolCacheValid; then
+      read -r tools < "$TOOL_CACHE"
+      if setTools "$tools"; then
+         export CND_TOOLS=$tools
+         return
+      fi
+   fi
+
+   debug "Locating commands in $TOOL_DIRS"
+   tools=""
+   for mod in $MODS_ALL $MODS_OPT; do
+      p=""
+      for dir in $TOOL_DIRS; do
+         if [[ -e $dir/${mod,,} ]]; then
+            p=$dir/${mod,,}
+            break
+         fi
+      done
+      printf -v $mod "%s" "$p"
+      tools="$tools $mod=$p"
+   done
+   export CND_TOOLS=$tools
+
+   echo $tools > "$TOOL_CACHE.$$" 2>/dev/null && mv -f "$TOOL_CACHE.$$" "$TOOL_CACHE" 2>/dev/null
+}
+
+# --- checks whether the cache is newer than all TOOL_DIRS
+
+function isToolCacheValid() {
+
+   local dir
+
+   for dir in $TOOL_DIRS; do
+      if [[ ! $TOOL_CACHE -nt $dir ]]; then
+         return 1
+      fi
+   done
+   return 0
+}
+
+# --- sets the paths of MOD=path MOD=path ... if there is a valid path for all commands
+
+function setTools() {		# MOD=path MOD=path ...
+
+   local entry
+   local mod
+   local p
+
+   for mod in $MODS_ALL $MODS_OPT; do
+      if [[ " $1 " != *" $mod="* ]]; then
+         return 1
+      fi
+   done
+
+   for entry in $1; do
+      mod=${entry%%=*}
+      p=${entry#*=}
+      if isOneOf "$mod" $MODS_ALL; then
+         if [[ -z $p ]]; then             # required commands need a path
+            return 1
+         fi
+      elif ! isOneOf "$mod" $MODS_OPT; then
+         return 1
+      fi
+      if [[ -n $p ]] && [[ " $TOOL_DIRS " != *" ${p%/*} "* || ${p##*/} != ${mod,,} ]]; then     # only paths of the commands in TOOL_DIRS
+         return 1
+      fi
+   done
+
+   for entry in $1; do
+      printf -v "${entry%%=*}" "%s" "${entry#*=}"
+   done
+   return 0
+}
+
+# --- checks whether the first argument is identical to one of the following arguments
+
+function isOneOf() {		# word word1 word2 ...
+
+   local w
+   local word=$1
+
+   shift
+   for w in "$@"; do
+      if [[ $w == "$word" ]]; then
+         return 0
+      fi
+   done
+   return 1
+}
+
 #################################################################################
 # message & console handling
 #################################################################################
@@ -874,7 +610,8 @@ function isCommandAvailable() {		# $1: command
 
 function writeToConsoleNoNL() {   # messagenumber
    local msg
-   msg=`getLocalizedMessage $*`
+   renderMessage L $*
+   msg=$MESSAGE_TEXT
    if [[ $GUI -eq 0 ]]; then
 	   echo -ne $msg >> /dev/tty
    else
@@ -887,7 +624,8 @@ function writeToConsoleNoNL() {   # messagenumber
 
 function writeToConsole() {   # messagenumber
    local msg
-   msg=`getLocalizedMessage $*`
+   renderMessage L $*
+   msg=$MESSAGE_TEXT
    if [[ $GUI -eq 0 ]]; then
 	   echo -e $msg >> /dev/tty
    else
@@ -937,22 +675,28 @@ function writeToEliza() {   # messagenumber
    local severity
 
    local msg
-   msg=`getTargetMessage $*`
-   echo -e $msg >> "$ELIZA_RESULT"
-   msg=`getLocalizedMessage $*`
+   renderMessage T $*
+   echo -e $MESSAGE_TEXT >> "$ELIZA_RESULT"
+   if (( $CND_INTERNATIONAL_POST )); then
+      renderMessage L $*
+   fi
+   msg=$MESSAGE_TEXT
    if [[ $GUI -eq 0 ]]; then
 	echo -e $msg >> /dev/tty
    else
 	echo -e $msg
    fi
 
-   severity=`echo $msg | cut -d " " -f 2`
+   severity=""
+   if [[ $msg =~ ^[[:space:]]*[^[:space:]]+[[:space:]]+([^[:space:]]+) ]]; then     # second word
+      severity=${BASH_REMATCH[1]}
+   fi
 
-   if [[ `echo $severity | $EGREP "CND[0-9]+E"` ]]; then
+   if [[ $severity =~ CND[0-9]+E ]]; then
       let askEliza_error=$askEliza_error+1
    fi
 
-   if [[ `echo $severity | $EGREP "CND[0-9]+W"` ]]; then
+   if [[ $severity =~ CND[0-9]+W ]]; then
       let askEliza_warning=$askEliza_warning+1
    fi
 }
@@ -960,9 +704,8 @@ function writeToEliza() {   # messagenumber
 # ---Writes a messages to the NWEliza log
 
 function writeToElizaOnly() {                              # messagenumber
-   local msg
-   msg=`getTargetMessage $*`
-   echo -e $msg >> "$ELIZA_RESULT"
+   renderMessage T $*
+   echo -e $MESSAGE_TEXT >> "$ELIZA_RESULT"
 }
 
 # checks whether there exists support for the given language
@@ -971,12 +714,7 @@ function writeToElizaOnly() {                              # messagenumber
 
 function isLanguageSupported() {
 
-   LANG_EXT=`echo $LANG | tr '[:lower:]' '[:upper:]'`
-   LANG_SUFF=${LANG_EXT:0:2}
-
-   msgVar="MSG_${LANG_SUFF}"
-
-   if [[ ${!msgVar} != "" ]]; then
+   if [[ $MESSAGE_CATALOG == "MSG_${LANG_SUFF}" ]]; then
       return 1
    else
       return 0
@@ -989,76 +727,96 @@ function isLanguageSupported() {
 
 function isLanguageSupportedAndNotEnglish() {
 
-   LANG_EXT=`echo $LANG | tr '[:lower:]' '[:upper:]'`
-   LANG_SUFF=${LANG_EXT:0:2}
    if [[ $LANG_SUFF == "EN" ]]; then
       return 0
    fi
 
-   msgVar="MSG_${LANG_SUFF}"
+   isLanguageSupported
+}
 
-   if [[ ${!msgVar} != "" ]]; then
-      return 1
-   else
-      return 0
+# --- language of the messages, resolved once. Falls back to english if there is no translation
+
+function resolveMessageLanguage() {
+
+   LANG_EXT=${LANG^^}
+   LANG_SUFF=${LANG_EXT:0:2}
+
+   MESSAGE_CATALOG="MSG_${LANG_SUFF}"
+   if [[ ${!MESSAGE_CATALOG} == "" ]]; then
+      MESSAGE_CATALOG="MSG_EN"
+   elif [[ $LANG_SUFF != "EN" ]]; then
+      loadMessageCatalog $LANG_SUFF
    fi
 }
 
+# --- loads the message catalog of a language from the end of the script
+#
+# The catalogs follow the exit of the script and are never parsed by bash otherwise
+
+function loadMessageCatalog() {   # language, i.e. DE
+   local catalog
+   catalog=`sed -n "/^# --- MSG_$1\$/,/^# --- MSG_/ { /^MSG_$1\[/p }" "$CND_DIR/$MYSELF"`
+   eval "$catalog"
+}
+
+resolveMessageLanguage
+
 # --- Helper function to extract the message text in German or English and insert message parameters
 
 function getLocalizedMessage() { # messageNumber parm1 parm2
 
-   msg=`getMessageText L $@`
-   echo $msg
+   renderMessage L $@
+   echo $MESSAGE_TEXT
 }
 
 # get message for target forum
 
 function getTargetMessage() { # messageNumber parm1 parm2
 
-   if (( $CND_INTERNATIONAL_POST )); then
-      msg=`getMessageText D $@`
-   else
-      msg=`getMessageText L $@`
-   fi
-   echo $msg
+   renderMessage T $@
+   echo $MESSAGE_TEXT
 }
 
 function getMessageText() {         # languageflag messagenumber parm1 parm2 ...
-   local msg
-   local p
-   local i
-   local s
 
-   if [[ $1 == "D" ]]; then
-      msg=${MSG_EN[$2]};             # default is english
-   else
+   renderMessage $@
+   echo $MESSAGE_TEXT
+}
 
-      LANG_EXT=`echo $LANG | tr '[:lower:]' '[:upper:]'`
-      LANG_SUFF=${LANG_EXT:0:2}
+# --- Stores the message text in MESSAGE_TEXT. Uses builtins only, no subshell is forked
+#
+# languageflag: D(efault) english, L(ocalized) language of the system or T(arget) language of the forum
 
-      msgVar="MSG_${LANG_SUFF}"
+function renderMessage() {         # languageflag messagenumber parm1 parm2 ...
+   local language=$1
+   local msgVar
+   local i
+   local s
 
-      if [[ ${!msgVar} != "" ]]; then
-         msgVar="$msgVar[$2]"
-         msg=${!msgVar}
-         if [[ $msg == "" ]]; then               # no translation found
-            msg=${MSG_EN[$2]};                      # fallback into english
-         fi
+   if [[ $language == "T" ]]; then
+      language="L"
+      if (( $CND_INTERNATIONAL_POST )); then
+         language="D"
+      fi
+   fi
 
-      else
-         msg=${MSG_EN[$2]};                      # default is english
+   if [[ $language == "D" ]]; then
+      MESSAGE_TEXT=${MSG_EN[$2]};             # default is english
+   else
+      msgVar="${MESSAGE_CATALOG}[$2]"
+      MESSAGE_TEXT=${!msgVar}
+      if [[ $MESSAGE_TEXT == "" ]]; then               # no translation found
+         MESSAGE_TEXT=${MSG_EN[$2]};                      # fallback into english
       fi
    fi
 
    for (( i=3; $i <= $#; i++ )); do              # substitute all message parameters
-      p="${!i}"
       let s=$i-2
-      s="%$s"
-      msg=`echo $msg | sed 's!'$s'!'$p'!'`	# have to use explicit command name 
+      MESSAGE_TEXT=${MESSAGE_TEXT/"%$s"/"${!i}"}
+   done
+   while [[ $MESSAGE_TEXT =~ %[0-9]+ ]]; do      # delete trailing %n definitions
+      MESSAGE_TEXT=${MESSAGE_TEXT/"${BASH_REMATCH[0]}"/}
    done
-   msg=`echo $msg | perl -p -e "s/%[0-9]+//g"`      # delete trailing %n definitions
-   echo $msg
 }
 
 #################################################################################
@@ -1188,25 +946,6 @@ fi
 return
 }
 
-#################################################################################
-# --- display rfkill results if rfkill is available
-#
-#################################################################################
-
-function listrfkill() {
-
-   if `isCommandAvailable rfkill`; then
-
-      if [[ -z $1 ]]; then
-      	$RFKILL list wifi
-      else
-	echo "rfkill list wifi"
-   fi
-fi
-
-return
-}
-
 #################################################################################
 # check whether dhcp is configured either with a config file or by using networkmanager if there is no IP address
 #
@@ -3107,11 +2846,8 @@ function listFirmware() {
    if [[ $? == 0 ]]; then
       dir="/lib/firmware/bc43legacy"
    fi
-   if [[ -z $1 ]]; then
-	listFirmwareDirectory $dir
-    else
-	echo "ls $dir/*.{fw,ucode,bin}"
-    fi
+   collectorHeader "ls $dir/*.{fw,ucode,bin}"
+   listFirmwareDirectory $dir
 }
 
 function listFirmwareDirectory () {
@@ -3528,23 +3264,16 @@ local o
    o=`ps -eo comm 2>/dev/null | $EGREP -i "networkmanager"`      # networkmanager not used
    if [[ -z $o ]]; then
 
-        if [[ -z $1 ]]; then
-
-         o=`ps -eo comm 2>/dev/null | $EGREP -i "wpa_supplicant"`
-         if [[ ! -z $o ]]; then
-            IFSO=$IFS
-            IFS=""
-            o=`ps -eo args | $GREP -i [w]pa_supplicant`
-            if [[ $o != "" ]]; then
-               echo $o >> $LOG
-            fi
-            IFS=$IFSO
-         fi
-      else
-         o=`ps -eo comm 2>/dev/null | $EGREP -i "wpa_supplicant"`
-         if [[ ! -z $o ]]; then
-            echo "Active WPA processes"
+      o=`ps -eo comm 2>/dev/null | $EGREP -i "wpa_supplicant"`
+      if [[ ! -z $o ]]; then
+         collectorHeader "Active WPA processes" >> $LOG
+         IFSO=$IFS
+         IFS=""
+         o=`ps -eo args | $GREP -i [w]pa_supplicant`
+         if [[ $o != "" ]]; then
+            echo $o >> $LOG
          fi
+         IFS=$IFSO
       fi
    fi
 }
@@ -3683,40 +3412,31 @@ function listHWInfo() {
 
    if `isCommandAvailable hwinfo`; then
 
-      if [[ -z $1 ]]; then
-
-         $PERL -e '
+      $PERL -e '
 
-          my $MATCH = qr /Model:|Vendor:|Device:|Driver:|Driver Modules:|Subvendor:|Subdevice:|Device File:|^\d+:|Link detected|Driver Status:|Driver Activation Cmd:/;
-          my $line;
+       my $MATCH = qr /Model:|Vendor:|Device:|Driver:|Driver Modules:|Subvendor:|Subdevice:|Device File:|^\d+:|Link detected|Driver Status:|Driver Activation Cmd:/;
+       my $line;
 
-            foreach $line (`'$HWINFO' --netcard`) {
-               if ($line =~ /$MATCH/) {
-                  print "$line";
-               }
+         foreach $line (`'$HWINFO' --netcard`) {
+            if ($line =~ /$MATCH/) {
+               print "$line";
             }
-         '
-      else
-         echo "hwinfo (filtered)"
-      fi
+         }
+      '
 
    elif `isCommandAvailable lshw`; then
 
-      if [[ -z $1 ]]; then
-         $PERL -e '
+      $PERL -e '
 
-          my $MATCH = qr /product:|vendor:|capabilities:|configuration:/;
-          my $line;
+       my $MATCH = qr /product:|vendor:|capabilities:|configuration:/;
+       my $line;
 
-            foreach $line (`'$LSHW' -C network`) {
-               if ($line =~ /$MATCH/) {
-                  print "$line";
-               }
+         foreach $line (`'$LSHW' -C network`) {
+            if ($line =~ /$MATCH/) {
+               print "$line";
             }
-         '
-      else
-         echo "lshw -C network (filtered)"
-      fi
+         }
+      '
 
    fi
 
@@ -3805,30 +3525,6 @@ function checkForMissingLink () {
    fi
 }
 
-##################################################################################
-#
-# Extract some info from /etc/sysconfig/network (SUSE only)
-#
-##################################################################################
-
-function listSuSEConfig() {
-   local m
-
-   debug ">>listSuSEConfig"
-
-   if [[ $DISTRO == $SUSE ]]; then
-      if [[ -z $1 ]]; then
-         $EGREP -i "^[^#].*(persistent|networkmanager)" /etc/sysconfig/network/config 
-      else
-         m=`colorate "egrep -i \"^[^#].*(persistent|networkmanager)\" /etc/sysconfig/network/config"`
-         echo $m
-      fi
-   fi
-
-   debug "<<listSuSEConfig"
-
-}
-
 ##################################################################################
 #
 #  -- Masquerade sensitive informations
@@ -4115,9 +3811,14 @@ while (<>) {
 #
 ##################################################################################
 
+NETWORK_CONFIG_FILES=('/etc/sysconfig/network/ifcfg-[earwd]*' # SUSE
+        '/etc/sysconfig/network-scripts/ifcfg-[earwd]*' #REDHAT
+        '/etc/network/interfaces' # DEBIAN
+        '/etc/rc.conf' # ARCH
+        '/etc/rc.d/rc.inet1.conf') # SLACKWARE
+
 function listNetworkConfigs () {
 
-   local cmd
    local c
 
    if (( ! $CONFIG_READABLE )); then
@@ -4125,23 +3826,12 @@ function listNetworkConfigs () {
 		return 0
    fi
 
-   cmd=('/etc/sysconfig/network/ifcfg-[earwd]*' # SUSE
-        '/etc/sysconfig/network-scripts/ifcfg-[earwd]*' #REDHAT
-        '/etc/network/interfaces' # DEBIAN
-        '/etc/rc.conf' # ARCH
-        '/etc/rc.d/rc.inet1.conf') # SLACKWARE
-
-   if [[ -z $1 ]]; then
-	
-	   c=$(ls ${cmd[$DISTRO]} 2>&1 1>/dev/null)
-	   if [[ "$?" = "0" ]]; then	# if there exists files
-	      c="for f in \$(ls "${cmd[$DISTRO]}"); do echo \"--- \$f\"; cat \$f | "$EGREP" -v \"^#|^$\" | "$EGREP" -v \"=''\"; done"
-	      eval $c | stripWLANKeys
-	else
-		echo "No config files found"
-	fi
+   c=$(ls ${NETWORK_CONFIG_FILES[$DISTRO]} 2>&1 1>/dev/null)
+   if [[ "$?" = "0" ]]; then	# if there exists files
+      c="for f in \$(ls "${NETWORK_CONFIG_FILES[$DISTRO]}"); do echo \"--- \$f\"; cat \$f | "$EGREP" -v \"^#|^$\" | "$EGREP" -v \"=''\"; done"
+      eval $c | stripWLANKeys
    else
-      echo "cat ${cmd[$DISTRO]} | grep -v \"^#|^$\" | grep -v \"=''\""
+      echo "No config files found"
    fi
 
 }
@@ -4179,102 +3869,222 @@ function colorate () {  # message
 #
 ##################################################################################
 
+#
+# --- Collector registry
+#
+# registerCollector name flag cost tools depends header command
+#
+#   name:    unique name of the collector. Used by depends, disableCollector and CND_DISABLED_COLLECTORS
+#   flag:    s(tandard), h(ardware), w(ireless) or f(irewall). Collected if the flag is part of FLAGS
+#   cost:    0 cheap, always executed in this shell
+#            1 slow, executed in background if collectors run in parallel (-j)
+#            2 executed in this shell because NWEliza counters or state are updated
+#   tools:   tool variables required, i.e. "HWINFO PERL". Collector is skipped if one of them is not available
+#   depends: collectors which have to be finished before the collector is started
+#   header:  header written in front of the output. Empty if the collector writes its own header
+#   command: command or function to execute
+#
+# Sites can add or disable collectors in $SITE_COLLECTORS_DIR/*.sh with registerCollector and disableCollector
+#
+
+function registerCollector() {   # name flag cost tools depends header command
+   local n=${#COLLECTOR_NAME[@]}
+   COLLECTOR_NAME[$n]=$1
+   COLLECTOR_FLAG[$n]=$2
+   COLLECTOR_COST[$n]=$3
+   COLLECTOR_TOOLS[$n]=$4
+   COLLECTOR_DEPENDS[$n]=$5
+   COLLECTOR_HEADER[$n]=$6
+   COLLECTOR_CMD[$n]=$7
+}
+
+function disableCollector() {   # name
+   CND_DISABLED_COLLECTORS="$CND_DISABLED_COLLECTORS $1"
+}
+
+# --- writes the header of a collector
+
+function collectorHeader() {   # message
+   local header
+   set -f
+   header=`colorate "$1"`
+   echo $header
+   set +f
+}
+
+function registerCollectors() {
+
+   local f
+
+   COLLECTOR_NAME=()
+
+   # standard
+   registerCollector release s 0 "" "" "cat /etc/*[-_]release || cat /etc/*[-_]version" "(ls /etc/*[-_]release 2>/dev/null && cat /etc/*[-_]release) || (ls /etc/*[-_]version && cat /etc/*[-_]version)"
+   registerCollector uname s 0 "" "" "uname -a" "uname -a"
+   if (( $CONFIG_READABLE )); then
+      registerCollector networkConfigs s 2 "EGREP" "" "cat ${NETWORK_CONFIG_FILES[$DISTRO]} | grep -v \"^#|^$\" | grep -v \"=''\"" "listNetworkConfigs"
+   else
+      registerCollector networkConfigs s 2 "EGREP" "" "" "listNetworkConfigs"           # no section, just the NWEliza message
+   fi
+#   registerCollector dhcp s 1 "" "" "" "dhcpTests"
+   registerCollector ping s 1 "PING GREP" "" "ping tests" "pingTests"
+   registerCollector nameserver s 0 "GREP" "" "cat /etc/resolv | grep -i \"nameserver\"" "cat /etc/resolv.conf | $GREP -v \"^#\|^[ ]*$\" | $GREP -i \"nameserver\""
+   registerCollector hosts s 0 "GREP" "" "cat /etc/hosts" "cat /etc/hosts | $GREP -v \"^#\|^$\" | $GREP -v \"::\""
+   registerCollector route s 0 "ROUTE EGREP" "" "(route -n && route -A inet6 -n) | egrep \"(en|wl|eth|ath|ra|wlan|dsl|ppp)\"" "($ROUTE -n && $ROUTE -A inet6 -n) | $EGREP \"(en|wl|eth|ath|wlan|ra|dsl|ppp)\""
+   registerCollector ifconfig s 0 "IFCONFIG" "" "ifconfig (filtered for en|wl|eth|wlan|ra|ath|dsl|ppp)" "$IFCONFIG | awk '/^(en|wl|eth|eth|wlan|ra|ath|dsl|ppp)/ { ifc=\$1 } !NF { ifc=\"\" } ifc { print }'"
+   registerCollector lspci h 1 "PERL LSPCI EGREP" "" "lspci" "$PERL -e 'qx/uname -r/ =~/(\d+)\.(\d+)/; exit  (\$1 > 2 || ( \$1 == 2 && \$2 >= 6))' || $LSPCI -nnk | $EGREP -i -A 2 '(ethernet|network)'; $PERL -e 'qx/uname -r/ =~/(\d+)\.(\d+)/; exit  (\$1 > 2 || ( \$1 == 2 && \$2 >= 6))' && $LSPCI -nn | $EGREP -i '(ethernet|network)'"
+#   registerCollector lspciModules h 1 "" "" "" "listLSPCIModules"
+   registerCollector lsusb h 1 "GREP" "" "lsusb | grep -v \"root hub\"" "which lsusb 2>/dev/null 1>&2 && lsusb | $GREP -v \"root hub\";which lsusb 2>/dev/null 1>&2 || echo \"lsusb not available. usbutils package needs to be installed\""
+   if [[ -n $HWINFO ]]; then
+      registerCollector hwinfo h 1 "HWINFO PERL" "" "hwinfo (filtered)" "listHWInfo"
+   else
+      registerCollector hwinfo h 1 "LSHW PERL" "" "lshw -C network (filtered)" "listHWInfo"
+   fi
+   registerCollector lsmod h 1 "LSMOD PERL" "" "lsmod (filtered)" "listLoadedModules"
+   registerCollector iwconfig w 1 "IWCONFIG SED" "" "iwconfig" "$IWCONFIG 2>&1 | awk '/^(en|wl|eth|wlan|ra|ath|dsl|ppp)/ { ifc=\$1 } !NF { ifc=\"\" } ifc { print }' | $SED \"s/\(Encryption key:\)\([^o][^f][^f][^ ]*\)\(.*\)/\1@@ @@@-@@@@-@@@@-@@@@-   @@@@-@@@@@@@\3/\""
+   registerCollector firmware w 1 "LSPCI GREP EGREP PERL" "" "" "listFirmware"
+   registerCollector iwlist w 2 "IWLIST EGREP" "" "iwlist scanning (filtered)" "detectAPs"
+   registerCollector ndiswrapper w 0 "LSMOD GREP" "" "ndiswrapper -l" "( $LSMOD | $GREP -i ndiswrapper > /dev/null ) && ndiswrapper -l; ( $LSMOD | $GREP -i ndiswrapper > /dev/null ) || echo \"No ndiswrapper module loaded\""
+   registerCollector processes w 1 "EGREP" "" "Active processes" "listActiveProcesses"
+   registerCollector wpaProcesses w 1 "EGREP GREP" "" "" "listWPAProcesses"
+   if [[ $DISTRO == $SUSE ]]; then
+      registerCollector suseConfig w 0 "EGREP" "" "egrep -i \"^[^#].*(persistent|networkmanager)\" /etc/sysconfig/network/config" "$EGREP -i \"^[^#].*(persistent|networkmanager)\" /etc/sysconfig/network/config"
+   fi
+   registerCollector rfkill w 0 "RFKILL" "" "rfkill list wifi" "$RFKILL list wifi"
+   registerCollector date w 0 "" "" "Actual date for bias of following greps" "echo \"`date +\"%T %F\"`\" 1>&2"
+   registerCollector radioMessages w 1 "GREP TAIL" "" "grep -i radio ${VAR_LOG_MESSAGE_FILE} | tail -n 5" "[ $UID -eq 0 ] && ( $GREP -i radio ${VAR_LOG_MESSAGE_FILE} | $TAIL -n 5 ); [ $UID -ne 0 ] && echo \"??? Unable to access ${VAR_LOG_MESSAGE_FILE} to check for WLAN errors as normal user\""
+   registerCollector radioDmesg w 1 "GREP TAIL" "" "dmesg | grep -i radio | tail -n 5" "dmesg | $GREP -i radio | $TAIL -n 5"
+   registerCollector firmwareMessages w 1 "GREP TAIL" "" "tail -n $NUMBER_OF_LINES_TO_CHECK_IN_VAR_LOG_MESSAGES ${VAR_LOG_MESSAGE_FILE} | $GREP -i firmware | tail -n 10" "[ $UID -eq 0 ] && (tail -n $NUMBER_OF_LINES_TO_CHECK_IN_VAR_LOG_MESSAGES ${VAR_LOG_MESSAGE_FILE} | $GREP -i firmware | $TAIL -n 10); [ $UID -ne 0 ] && echo \"??? Unable to access ${VAR_LOG_MESSAGE_FILE} to check for firmware errors as normal user\""
+   registerCollector udevRules s 0 "EGREP GREP" "" "egrep 'en|wl|eth|ath|wlan|ra|ppp' /etc/udev/rules.d/*net_persistent* /etc/udev/rules.d/*persistent-net*" "$EGREP 'en|wl|eth|ath|wlan|ra|ppp' /etc/udev/rules.d/*net_persistent* /etc/udev/rules.d/*persistent-net* 2>/dev/null | $GREP -v \":#\|:$\" 2>/dev/null"
+   registerCollector modprobe w 1 "EGREP" "" "egrep -r '(en.*|wl.*|eth|ath|wlan|ra)[0-9]+' /etc/modprobe.*|egrep -v -i '#|blacklist'" "$EGREP -r '(en.*|wl.*|eth|ath|wlan|ra)[0-9]+' /etc/modprobe.*|$EGREP -v -i '#|blacklist'"
+   registerCollector arp f 0 "ARP" "" "arp -n" "$ARP -n"
+   registerCollector iptables f 1 "IPTABLES" "" "iptables -L -vn" "$IPTABLES -L -vn"
+   registerCollector suseFirewall f 0 "GREP" "" "cat /etc/sysconfig/SuSEfirewall2" "cat /etc/sysconfig/SuSEfirewall2 | $GREP -v \"^#\|^$\""
+   registerCollector ipForward f 0 "" "" "cat /proc/sys/net/ipv4/ip_forward" "cat /proc/sys/net/ipv4/ip_forward"
+
+   # site specific collectors
+
+   for f in $SITE_COLLECTORS_DIR/*.sh; do
+      if [[ -r $f ]]; then
+         debug "Loading collectors from $f"
+         . $f
+      fi
+   done
+}
+
+# --- checks whether a registered collector is selected by FLAGS, not disabled and all tools are available
+
+function isCollectorEligible() {   # collector index
+   local tool
+
+   if [[ $FLAGS != *${COLLECTOR_FLAG[$1]}* || " $CND_DISABLED_COLLECTORS " == *" ${COLLECTOR_NAME[$1]} "* ]]; then
+      return 1
+   fi
+   for tool in ${COLLECTOR_TOOLS[$1]}; do
+      if [[ -z ${!tool} ]]; then
+         debug "Collector ${COLLECTOR_NAME[$1]} skipped. $tool not available"
+         return 1
+      fi
+   done
+   return 0
+}
+
+# --- wait until not more than the given number of collectors run in background or the given collector finished
+
+function waitForCollectors() {   # number of collectors [pid of collector]
+   local pid
+   while (( ${#COLLECTOR_PIDS[@]} > $1 )); do
+      pid=${COLLECTOR_PIDS[0]}
+      wait $pid
+      COLLECTOR_PIDS=("${COLLECTOR_PIDS[@]:1}")
+      if [[ $pid == $2 ]]; then
+         break
+      fi
+   done
+}
+
+# --- wait for the collectors the given collector depends on
+
+function waitForDependencies() {   # collector index
+   local d
+   local n
+   for d in ${COLLECTOR_DEPENDS[$1]}; do
+      for (( n=0; $n < ${#COLLECTOR_NAME[@]}; n++ )); do
+         if [[ ${COLLECTOR_NAME[$n]} == $d && -n ${COLLECTOR_PID[$n]} && " ${COLLECTOR_PIDS[*]} " == *" ${COLLECTOR_PID[$n]} "* ]]; then
+            waitForCollectors 0 ${COLLECTOR_PID[$n]}
+         fi
+      done
+   done
+}
+
 #
 # --- Commands executed collect valuable informations about the network and it's configuration
 #
-function collectNWData () {   #listOnly
+function collectNWData () {
 
    debug ">>collectNWData"
 
-   # standard
-   i=0;FLAG[$i]="s";MSG[$i]="cat /etc/*[-_]release || cat /etc/*[-_]version";CMD[$i]="(ls /etc/*[-_]release 2>/dev/null && cat /etc/*[-_]release) || (ls /etc/*[-_]version && cat /etc/*[-_]version)"
-   i=$i+1;FLAG[$i]="s";MSG[$i]="uname -a";CMD[$i]="uname -a"
-   i=$i+1;FLAG[$i]="s";MSG[$i]="";CMD[$i]="listNetworkConfigs"
-#   i=$i+1;FLAG[$i]="s";MSG[$i]="";CMD[$i]="dhcpTests"
-   i=$i+1;FLAG[$i]="s";MSG[$i]="ping tests";CMD[$i]="pingTests"
-   i=$i+1;FLAG[$i]="s";MSG[$i]="cat /etc/resolv | grep -i \"nameserver\"";CMD[$i]="cat /etc/resolv.conf | $GREP -v \"^#\|^[ ]*$\" | $GREP -i \"nameserver\""
-   i=$i+1;FLAG[$i]="s";MSG[$i]="cat /etc/hosts";CMD[$i]="cat /etc/hosts | $GREP -v \"^#\|^$\" | $GREP -v \"::\""
-   i=$i+1;FLAG[$i]="s";MSG[$i]="(route -n && route -A inet6 -n) | egrep \"(en|wl|eth|ath|ra|wlan|dsl|ppp)\"";CMD[$i]="($ROUTE -n && $ROUTE -A inet6 -n) | $EGREP \"(en|wl|eth|ath|wlan|ra|dsl|ppp)\""
-   i=$i+1;FLAG[$i]="s";MSG[$i]="ifconfig (filtered for en|wl|eth|wlan|ra|ath|dsl|ppp)";CMD[$i]="$IFCONFIG | awk '/^(en|wl|eth|eth|wlan|ra|ath|dsl|ppp)/ { ifc=\$1 } !NF { ifc=\"\" } ifc { print }'"
-   i=$i+1;FLAG[$i]="h";MSG[$i]="lspci";CMD[$i]="$PERL -e 'qx/uname -r/ =~/(\d+)\.(\d+)/; exit  (\$1 > 2 || ( \$1 == 2 && \$2 >= 6))' || $LSPCI -nnk | $EGREP -i -A 2 '(ethernet|network)'; $PERL -e 'qx/uname -r/ =~/(\d+)\.(\d+)/; exit  (\$1 > 2 || ( \$1 == 2 && \$2 >= 6))' && $LSPCI -nn | $EGREP -i '(ethernet|network)'"
-#   i=$i+1;FLAG[$i]="h";MSG[$i]="";CMD[$i]="listLSPCIModules"
-   i=$i+1;FLAG[$i]="h";MSG[$i]="lsusb | grep -v \"root hub\"";CMD[$i]="which lsusb 2>/dev/null 1>&2 && lsusb | $GREP -v \"root hub\";which lsusb 2>/dev/null 1>&2 || echo \"lsusb not available. usbutils package needs to be installed\""
-   i=$i+1;FLAG[$i]="h";MSG[$i]="";CMD[$i]="listHWInfo"
-   i=$i+1;FLAG[$i]="h";MSG[$i]="lsmod (filtered)";CMD[$i]="listLoadedModules"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="iwconfig";CMD[$i]="$IWCONFIG 2>&1 | awk '/^(en|wl|eth|wlan|ra|ath|dsl|ppp)/ { ifc=\$1 } !NF { ifc=\"\" } ifc { print }' | $SED \"s/\(Encryption key:\)\([^o][^f][^f][^ ]*\)\(.*\)/\1@@ @@@-@@@@-@@@@-@@@@-   @@@@-@@@@@@@\3/\"" 
-   i=$i+1;FLAG[$i]="w";MSG[$i]="";CMD[$i]="listFirmware"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="iwlist scanning (filtered)";CMD[$i]="detectAPs"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="ndiswrapper -l";CMD[$i]="( $LSMOD | $GREP -i ndiswrapper > /dev/null ) && ndiswrapper -l; ( $LSMOD | $GREP -i ndiswrapper > /dev/null ) || echo \"No ndiswrapper module loaded\""
-   i=$i+1;FLAG[$i]="w";MSG[$i]="Active processes";CMD[$i]="listActiveProcesses"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="";CMD[$i]="listWPAProcesses"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="";CMD[$i]="listSuSEConfig"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="";CMD[$i]="listrfkill"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="Actual date for bias of following greps";CMD[$i]="echo \"`date +\"%T %F\"`\" 1>&2"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="grep -i radio ${VAR_LOG_MESSAGE_FILE} | tail -n 5";CMD[$i]="[ $UID -eq 0 ] && ( $GREP -i radio ${VAR_LOG_MESSAGE_FILE} | $TAIL -n 5 ); [ $UID -ne 0 ] && echo \"??? Unable to access ${VAR_LOG_MESSAGE_FILE} to check for WLAN errors as normal user\""
-   i=$i+1;FLAG[$i]="w";MSG[$i]="dmesg | grep -i radio | tail -n 5";CMD[$i]="dmesg | $GREP -i radio | $TAIL -n 5"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="tail -n $NUMBER_OF_LINES_TO_CHECK_IN_VAR_LOG_MESSAGES ${VAR_LOG_MESSAGE_FILE} | $GREP -i firmware | tail -n 10";CMD[$i]="[ $UID -eq 0 ] && (tail -n $NUMBER_OF_LINES_TO_CHECK_IN_VAR_LOG_MESSAGES ${VAR_LOG_MESSAGE_FILE} | $GREP -i firmware | $TAIL -n 10); [ $UID -ne 0 ] && echo \"??? Unable to access ${VAR_LOG_MESSAGE_FILE} to check for firmware errors as normal user\""
-   i=$i+1;FLAG[$i]="s";MSG[$i]="egrep 'en|wl|eth|ath|wlan|ra|ppp' /etc/udev/rules.d/*net_persistent* /etc/udev/rules.d/*persistent-net*";CMD[$i]="$EGREP 'en|wl|eth|ath|wlan|ra|ppp' /etc/udev/rules.d/*net_persistent* /etc/udev/rules.d/*persistent-net* 2>/dev/null | $GREP -v \":#\|:$\" 2>/dev/null"
-   i=$i+1;FLAG[$i]="w";MSG[$i]="egrep -r '(en.*|wl.*|eth|ath|wlan|ra)[0-9]+' /etc/modprobe.*|egrep -v -i '#|blacklist'";CMD[$i]="$EGREP -r '(en.*|wl.*|eth|ath|wlan|ra)[0-9]+' /etc/modprobe.*|$EGREP -v -i '#|blacklist'"
-   i=$i+1;FLAG[$i]="f";MSG[$i]="arp -n";CMD[$i]="$ARP -n"
-   i=$i+1;FLAG[$i]="f";MSG[$i]="iptables -L -vn";CMD[$i]="$IPTABLES -L -vn"
-   i=$i+1;FLAG[$i]="f";MSG[$i]="cat /etc/sysconfig/SuSEfirewall2";CMD[$i]="cat /etc/sysconfig/SuSEfirewall2 | $GREP -v \"^#\|^$\""
-   i=$i+1;FLAG[$i]="f";MSG[$i]="cat /proc/sys/net/ipv4/ip_forward";CMD[$i]="cat /proc/sys/net/ipv4/ip_forward"
-
-   # count number of eligible tests
-
-   NUMBER_OF_TESTS=0
-   i=0
-   while [ -n "${CMD[$i]}" ]; do
-      R=`echo $FLAGS | grep "${FLAG[$i]}"`
-      if [[ $? == 0 ]]; then
-         let NUMBER_OF_TESTS=NUMBER_OF_TESTS+1
+   local eligible=()
+   local buffers=()
+   local i
+   local pi
+   local out
+   local logSaved
+
+   registerCollectors
+
+   for (( i=0; $i < ${#COLLECTOR_NAME[@]}; i++ )); do
+      if isCollectorEligible $i; then
+         eligible+=($i)
       fi
-      let i=i+1
    done
+   NUMBER_OF_TESTS=${#eligible[@]}
 
-   i=0      # counter of all possible tests
    pi=0      # counter of eligible tests
+   COLLECTOR_PIDS=()
+   COLLECTOR_PID=()
 
    # process tests and print progress in percent
+   # with more than one worker every test writes into its own buffer and the buffers are appended to the log
+   # in the order of the registry. Only slow collectors are executed in background
 
-   while [ -n "${CMD[$i]}" ]; do
+   for i in "${eligible[@]}"; do
 
-   #   echo $FLAGS ${FLAG[$i]}
-      R=`echo $FLAGS | grep "${FLAG[$i]}"`
-
-      if [[ $? == 0 ]]; then
-   #      fill log file with information
-         debug "*** ${CMD[$i]} "
-         if [[ -z ${MSG[$i]} ]]; then
-            msg=`eval ${CMD[$i]} m`
-            if [[ -z $msg ]]; then         # no report for this distro
-               let i=i+1
-               let pi=pi+1
-               continue
-            fi
-   #         echo $SEPARATOR >> $LOG
-   #         echo "*** $msg" >> $LOG
-            set -f
-            header=`colorate "$msg"`
-            echo $header >> $LOG
-            debug "-- $msg"
-            set +f
-         else
-   #         echo $SEPARATOR >> $LOG
-   #         echo "*** ${MSG[$i]}" >> $LOG
-            set -f
-            header=`colorate "${MSG[$i]}"`
-            echo $header >> $LOG
-            debug "-- ${MSG[$i]}"
-            set +f
-         fi
-         processingMessage $pi $NUMBER_OF_TESTS $msg
-         eval ${CMD[$i]} 2>> $LOG 1>> $LOG
-         let pi=pi+1
+      debug "*** ${COLLECTOR_NAME[$i]}: ${COLLECTOR_CMD[$i]} "
+      if (( $COLLECTOR_WORKERS > 1 )); then
+         out="${COLLECT_BUFFER}$i"
+         rm -f "$out" 2>/dev/null
+         buffers+=("$out")
+      else
+         out=$LOG
       fi
-      let i=i+1
+      if [[ -n ${COLLECTOR_HEADER[$i]} ]]; then
+         collectorHeader "${COLLECTOR_HEADER[$i]}" >> $out
+         debug "-- ${COLLECTOR_HEADER[$i]}"
+      fi
+      processingMessage $pi $NUMBER_OF_TESTS
+      waitForDependencies $i
+      if (( $COLLECTOR_WORKERS > 1 && ${COLLECTOR_COST[$i]} == 1 )); then
+         waitForCollectors $(( $COLLECTOR_WORKERS - 1 ))
+         ( LOG=$out; eval ${COLLECTOR_CMD[$i]} 2>> $out 1>> $out ) &
+         COLLECTOR_PIDS+=($!)
+         COLLECTOR_PID[$i]=$!
+      else
+         logSaved=$LOG                  # collectors write into $LOG directly too
+         LOG=$out
+         eval ${COLLECTOR_CMD[$i]} 2>> $out 1>> $out
+         LOG=$logSaved
+      fi
+      let pi=pi+1
+
+   done
 
+   waitForCollectors 0
+   for out in "${buffers[@]}"; do
+      cat "$out" >> $LOG
+      rm -f "$out"
    done
+
    processingMessage $NUMBER_OF_TESTS $NUMBER_OF_TESTS   # display 100%
    sleep 1
    processingMessage -1               # clean output area now
@@ -4299,6 +4109,7 @@ function usage () { # exitcode
    echo "-g : script called by GUI wrapper"
    echo "-h : Print this help message"
    echo "-i : International posting"
+   echo "-j workers : Number of collectors executed in parallel (default: 1)"
    echo "-m : Turn MAC masquerading off"
    echo "-n : Turn NWEliza off"
    echo "-o : Executionhost (1-2)"
@@ -4342,6 +4153,7 @@ queryDistro
 DEBUG="off"				# debug messages
 TRACE=0				# detailed trace (-x -v)
 FLAGS="-shc"                	# default flags
+COLLECTOR_WORKERS=1				# collectors executed in parallel
 opt="$@"
 NWELIZA_ENABLED=1             # enabled for all distros
 USE_ROOT=1                    # default: Call script as root
@@ -4358,7 +4170,7 @@ CLEANUP=0
 CLEANALL=0
 
 # parse args
-while getopts ":a :c: :d :e: :f :g :h :i :k :l :m :n :o: :p: :r :s :t: :u :v :x" opt
+while getopts ":a :c: :d :e: :f :g :h :i :j: :k :l :m :n :o: :p: :r :s :t: :u :v :x" opt
 do 
    case "$opt" in
    a) CLEANALL=1;;
@@ -4374,6 +4186,11 @@ do
       VERSION_STRING="$VERSION_STRING -iGUI-";;
    h) usage 127;;
    i) INTERNATIONALOPTION=1;;
+   j) COLLECTOR_WORKERS=$OPTARG
+      if [[ ! $OPTARG =~ ^[0-9]+$ || $OPTARG -lt 1 ]]; then
+         echo "Argument for option -$opt should be a number greater than 0"
+         exit 127
+      fi;;
    k) CLEANUP=1;;
    m) MASQUERADE_MAC=0;;
    n) NWELIZA_ENABLED=0;;
@@ -4445,6 +4262,8 @@ if [[ $CND_VERSION_STRING == "" ]]; then
    fi
 fi
 
+discoverTools                   # paths are exported to the script started as root
+
 if (( ! $USE_USER_AS_PARM )); then      # invocation not as normal user requested
    if [ $UID -eq 0 -o $ROOTOPTION == "1" ]; then         # invoked by root already of root option selected
       USE_ROOT=1
@@ -4549,12 +4368,8 @@ MODS_MISSING=0
 for mod in $MODS; do
 #   echo "--------- $mod"
    # prog name in lower case
-   lwr=`echo $mod | perl -e "print lc(<>);"`
-   mod=`echo $mod | sed 's/-/_/'`
-   # store detected path
-   p=`find {/sbin,/usr/bin,/usr/sbin,/bin} -name $lwr | head -n 1`
-   eval "$mod=\"${p}\""
-   eval "c=\${${mod}}"
+   lwr=${mod,,}
+   c=${!mod}
 #   echo "------m $mod"
 #   echo "------c $c"
    if [ ! -x "$c" ]; then
@@ -4723,4 +4538,415 @@ if [[ $UID -eq 0 ]]; then
    export CND_INTERNATIONAL_POST=$CND_INTERNATIONAL_POST
 fi
 
+exit
+
+#################################################################################
+#
+# --- Message catalogs of the translations, loaded by loadMessageCatalog
+#
+#################################################################################
+
+# --- MSG_DE
+
+MSG_DE[$MSG_UNDEFINED]="Unbekannte Meldung. Bitte den Author $CONTACT informieren"
+MSG_DE[$MSG_INTERNAL_ERROR]="Interner Fehler %1 aufgetreten. Bitte den Author $CONTACT informieren"
+MSG_DE[$MSG_ELIZA_START_ANALYZE]="--- NWEliza untersucht das System nach häufigen Netzwerkkonfigurationsfehlern ..."
+MSG_DE[$MSG_START_COLLECTING]="--- NWCollect sammelt Netzwerkkonfigurationsinformationen in Datei %1 ..."
+MSG_DE[$MSG_CON_WRL]="--- (1) Kabellose Verbindung (WLAN)"
+MSG_DE[$MSG_ANSWER_CHARS_NO]="Nn"
+MSG_DE[$MSG_ANSWER_CHARS_YES]="Jj"
+MSG_DE[$MSG_MAIN_PROG_REQUIRED]="!!! Das Programm %1 ist nicht verfügbar. Das Programm nachinstallieren und das Script danach noch einmal ausführen"
+MSG_DE[$MSG_MAIN_NO_ERROR_DETECTED]="--- Keine offensichtlichen Konfigurationsfehler/-warnungen gefunden. Die Datei %1 im bevorzugten Linux Forum posten und $HTTP_UPLOAD_URL lesen."
+MSG_DE[$MSG_ASK_LANG]="--- Soll das Ergebnisfile in einem internationalen Forum gepostet werden (j/[n])?"
+MSG_DE[$MSG_SELECT_LANG]="--- Bitte mit ja (J) oder nein (N) antworten:"
+MSG_DE[$MSG_GET_TOPOLOGY]="--- Welche Netzwerktopologie liegt vor?"
+MSG_DE[$MSG_UNSUPPORTED_TOPOLOGY]="--- Netzwerktopologie unbekannt"
+MSG_DE[$MSG_PLEASE_CORRECT_ANSWER]="--- Bitte mit 1-%1 anworten: "
+MSG_DE[$MSG_TOPO_DM_LC]="--- (1) DSL modem <---> LinuxClient"
+MSG_DE[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> LinuxClient"
+MSG_DE[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> LinuxRouter <---> LinuxClient"
+MSG_DE[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> LinuxClient"
+MSG_DE[$MSG_MAIN_POST_FILE]="--- Wenn eigene Lösungsversuche erfolglos waren dann den Inhalt der Datei %1 im Netz ablegen\n--- (Links siehe $HTTP_UPLOAD_URL) \n--- und dann der nopaste Link im bevorzugten Linux Forum posten."
+MSG_DE[$MSG_GET_HOST]="--- Auf welchem Rechner wird das Script ausgeführt?"
+MSG_DE[$MSG_UNSUPPORTED_HOST]="--- Ungültiger Rechner"
+MSG_DE[$MSG_HOST_RT]="--- (2) LinuxRouter"
+MSG_DE[$MSG_HOST_CL]="--- (1) LinuxClient"
+MSG_DE[$MSG_MAIN_BECOME_ROOT]="--- Bitte das root Kennwort eingeben."
+MSG_DE[$MSG_CON_WRD]="--- (2) Kabelgebundene Verbindung"
+MSG_DE[$MSG_GET_CONNECTION]="--- Welcher Netzwerkverbindungtyp soll getestet werden?"
+MSG_DE[$MSG_UNSUPPORTED_CONNECTION]="--- Netzwerkverbindungstyp unbekannt"
+MSG_DE[$MSG_MAIN_GOTO_LINK]="--- Gehe zu $HTTP_HELP_URL um detailliertere Hinweise \n--- zu den Fehlermeldungen/Warnungen zu bekommen und wie die Fehler selbst beseitigt werden können."
+MSG_DE[$MSG_TOPO_AP_LC]="--- (1) WLAN access point <---> LinuxClient"
+MSG_DE[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> LinuxClient"
+MSG_DE[$MSG_TOPO_AP_LR_LC]="--- (3) WLAN access point <---> LinuxRouter <---> LinuxClient"
+MSG_DE[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> LinuxRouter <---> LinuxClient"
+MSG_DE[$MSG_ASK_FOR_ROOT]="--- Der Aufruf des Scripts als root erlaubt eine detailiertere Analyse und liefert bessere Ergebnisse. \n--- Falls Bedenken existieren das Script als root auszuführen bitte $HTTP_ROOT_ACCESS lesen.\n--- Willst Du das Script als root ausführen lassen ([j]/n)?"
+MSG_DE[$MSG_GET_ESSID]="--- Bitte die WLAN SSID zu der verbunden werden soll eingeben (Wird in der Ausgabedatei maskiert): "
+MSG_DE[$MSG_GOT_ESSID]="--- WLAN SSID zu der verbunden werden soll: %1"
+MSG_DE[$MSG_NO_NIC_FOUND]="!!! CND0100E: Keine Netzwerkkarte für den gewählten Verbindungstyp kann auf dem System gefunden werden"
+MSG_DE[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Es wurde keine aktives Netzwerkinterface auf dem System für der gewählten Verbindungstyp gefunden"
+MSG_DE[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Die Netzwerkkarte %1 hat keine IP Adresse"
+MSG_DE[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Es ist mehr als eine Netzwerkkarte im selben Subnetz definiert: %1"
+MSG_DE[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Kein default gateway auf dem System definiert"
+MSG_DE[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Es kann ein Problem mit der default gateway definition %1 am Interface %2 vorliegen"
+MSG_DE[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Auf den definierter Nameserver mit der IP %1 in /etc/resolv.conf kann nicht zugegriffen werden"
+MSG_DE[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Kein Nameserver in /etc/resolv.conf definiert"
+MSG_DE[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Das System kann die externe IP %1 nicht pingen"
+MSG_DE[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: WLAN Firmware fehlt oder kann nicht geladen werden"
+MSG_DE[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Die maximal ermittelte MTU ist %1, aber die aktuelle MTU an der Netzwerkkarte %2 ist %3"
+MSG_DE[$MSG_APIPA_DETECTED]="!!! CND0210W: APIPA IP Adresse %1 wurde an Netzwerkkarte %2 entdeckt"
+MSG_DE[$MSG_NIC_ERRORS]="!!! CND0220W: Ungewöhnlich viele Übertragungsfehler am Interface %1 entdeckt"
+MSG_DE[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 ist eingeschaltet und kann der Grund für Netzwerkprobleme sein"
+MSG_DE[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager wird für die Netzwerkkonfiguration benutzt aber eine YAST Netzwerkkartenkonfiguration für %1 existiert"
+MSG_DE[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: Das System kann den externen Namen %1 nicht auflösen"
+MSG_DE[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper für %1 kann nicht gemeinsam mit dem linux Treiber %2 benutzt werden"
+MSG_DE[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Der verwendete Windowstreiber %1 wurde entweder nicht vollständig installiert (Treiberbestandteile fehlen z.B. sys Dateien)\n--- oder ist von der falschen Windows-Version (z.B. Win 98 statt XP)"
+MSG_DE[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Inkompatible Windowstreiber Architektur von %1 und Linux Architektur (32 Bit und 64 Bit Architektur gemischt)"
+MSG_DE[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Keine Netzwerkkonfiguration für Interface %1 gefunden"
+MSG_DE[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Keinen dhcp Server am Interface %1 gefunden"
+MSG_DE[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Klassische Netzwerkkonfiguration mit ifup wurde entdeckt. Die Konfiguration mit networkmanager ist einfacher"
+MSG_DE[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN ist mit dem Hardware oder Software Switch ausgeschaltet"
+MSG_DE[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Es existierern Schlüsselprobleme am Interface %1"
+MSG_DE[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: Ein dhcp Server scheint nicht am Interface %1 zu existieren"
+MSG_DE[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Eine drahtlose Verbindung wurde getestet obwohl eine kabelgebundene Verbindung am Interface %1 existiert . Das Netzwerkkabel ausstecken und das Script noch einmal starten"
+MSG_DE[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: Das System kann den externen DNS Namen %1 nicht pingen"
+MSG_DE[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Es wurden keine WLANs am Interface %1 gefunden. Die Hardware und/oder Treiber ist nicht richtig konfiguriert"
+MSG_DE[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Kein Module am Interface %1 geladen"
+MSG_DE[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Es existieren weitere mögliche Module %1 für Interface %2"
+MSG_DE[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Der konfigurierte Nameserver mit der IP %1 ist kein Nameserver"
+MSG_DE[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Es gibt ein Problem mit dem konfigurierten Nameserver mit der IP %1"
+MSG_DE[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza unterstützt diese Linux distribution nicht"
+MSG_DE[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Diese Distribution wird leider nicht unterstützt"
+MSG_DE[$MSG_CHECK_KEYS]="!!! CND0450W: WLAN Schlüsselmaskierung ist nicht vollständig auf dieser Distribution getestet. Bitte das Ausgabefile %1 nach sichtbaren WLAN Schlüsseln absuchen und manuell maskieren"
+MSG_DE[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analyse von %1 nur möglich wenn das Script als root aufgerufen wird"
+MSG_DE[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Reduzierte Analysefähigkeit und weniger Netzwerkinformationen da das Script nicht als root ausgeführt wurde"
+MSG_DE[$MSG_MISSING_LINK]="!!! CND0480W: Es wurde kein Linksignal auf Interface %1 entdeckt"
+MSG_DE[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Kein Accesspoint mit der benutzen SSID auf dem Interface %1 gefunden"
+MSG_DE[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Der Kanal %1, der vom eigenen Accesspoint benutzt wird, wird von %2 weiteren Accesspoints genutzt"
+MSG_DE[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Der Kanal %1, der vom eigenen Accesspoint benutzt wird, wird von %2 benachbarten Access Points überlagert"
+MSG_DE[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant ist nicht aktiv"
+MSG_DE[$MSG_ENL80211L]="!!! CND0530E: Module %1 erfordert die Konfiguration von WIRELESS_WPA_DRIVER='wext'"
+MSG_DE[$MSG_NIC_DROPPED]="!!! CND0540W: Messages wurden am Netzwerkinterface %1 verworfen"
+MSG_DE[$MSG_NO_NIC_FOUND_WARNING]="!!! CND0550W: Für den gewählten Netzwerkverbindungstyp konnte keine USB Netzwerkarte gefunden werden"
+MSG_DE[$MSG_INVALID_SSID]="!!! CND0560E: Es befinden sich ungültige Zeichen in der SSID"
+
+# --- MSG_FR
+
+MSG_FR[$MSG_UNDEFINED]="Message inconnu. S'il vous plaît informer l'auteur $CONTACT"
+MSG_FR[$MSG_INTERNAL_ERROR]="L'erreur interne %1 s'est produite . Svp informer l'auteur $CONTACT"
+MSG_FR[$MSG_ELIZA_START_ANALYZE]="--- NWEliza recherche dans le système les erreurs de configuration du réseau ..."
+MSG_FR[$MSG_START_COLLECTING]="--- NWCollect recueille l'information de configuration du réseau dans le fichier %1 ..."
+MSG_FR[$MSG_CON_WRL]="--- (1) Connexion sans fil (WLAN)"
+MSG_FR[$MSG_ANSWER_CHARS_NO]="Nn"
+MSG_FR[$MSG_ANSWER_CHARS_YES]="Oo"
+MSG_FR[$MSG_MAIN_PROG_REQUIRED]="!!! Le programme %1 est introuvable. Installez le programme et redémarrez le script"
+MSG_FR[$MSG_MAIN_NO_ERROR_DETECTED]="--- Aucune erreur ou avertissement évidents détectés. Postez le contenu du fichier %1 dans votre forum Linux préféré et lisez $HTTP_UPLOAD_URL"
+MSG_FR[$MSG_ASK_LANG]="--- Voulez-vous envoyer le fichier résultat à un forum international (o/[n])?"
+MSG_FR[$MSG_SELECT_LANG]="--- S'il vous plaît répondre par oui (O) ou non (N):"
+MSG_FR[$MSG_GET_TOPOLOGY]="--- Quel est le type de topologie du reséau?"
+MSG_FR[$MSG_UNSUPPORTED_TOPOLOGY]="--- Topologie inconnue"
+MSG_FR[$MSG_PLEASE_CORRECT_ANSWER]="--- S'il vous plaît répondre avec 1-%1:"
+MSG_FR[$MSG_TOPO_DM_LC]="--- (1) Modem DSL <---> Client Linux"
+MSG_FR[$MSG_TOPO_DR_LC]="--- (2) Routeur HW DSL <---> Client Linux"
+MSG_FR[$MSG_TOPO_DM_LR_LC]="--- (3) Modem DSL <--->  Routeur Linux <---> Client Linux"
+MSG_FR[$MSG_TOPO_DR_LR_LC]="--- 4) Routeur HW DSL<---> Routeur Linux <---> Client Linux"
+MSG_FR[$MSG_MAIN_POST_FILE]="--- Si vous ne réussissez pas,  placez le contenu du fichier %1 sur internet\n --- (voir $HTTP_UPLOAD_URL pour les liens) \n --- et puis collez le lien 'nopaste' sur votre forum Linux favori."
+MSG_FR[$MSG_GET_HOST]="--- Sur quel ordinateur hôte le script est-il exécuté?"
+MSG_FR[$MSG_UNSUPPORTED_HOST]="--- Hôte non valide"
+MSG_FR[$MSG_HOST_RT]="--- (2) Routeur Linux"
+MSG_FR[$MSG_HOST_CL]="--- (1) Client Linux"
+MSG_FR[$MSG_MAIN_BECOME_ROOT]="--- S'il vous plaît entrez le mot de passe root."
+MSG_FR[$MSG_CON_WRD]="--- (2) Connexion filaire"
+MSG_FR[$MSG_GET_CONNECTION]="--- Quel type de connexion de votre réseau doit être testé?"
+MSG_FR[$MSG_UNSUPPORTED_CONNECTION]="--- Type de connexion réseau inconnu"
+MSG_FR[$MSG_MAIN_GOTO_LINK]="--- Visitez $HTTP_HELP_URL pour obtenir des instructions plus détaillées \n --- sur les messages d'erreur/avertissement et comment résoudre vous même les problèmes."
+MSG_FR[$MSG_TOPO_AP_LC]="--- (1) Point d'accès WLAN <---> Client Linux"
+MSG_FR[$MSG_TOPO_WR_LC]="--- (2) Routeur HW WLAN <---> Client Linux"
+MSG_FR[$MSG_TOPO_AP_LR_LC]="--- (3) Réseau sans fil <---> Routeur Linux <---> Client Linux"
+MSG_FR[$MSG_TOPO_WR_LR_LC]="--- (4) Routeur HW WLAN <---> Routeur Linux <---> Client Linux"
+MSG_FR[$MSG_ASK_FOR_ROOT]="--- Invoquer ce script en tant que root permet une analyse plus détaillée et donnera de meilleurs résultats. \n --- Si vous avez des inquiétudes sur l' exécution du script en tant que root, s'il vous plaît lisez $HTTP_ROOT_ACCESS. \n --- Voulez-vous exécuter le script en tant que root ([o] / n)"
+MSG_FR[$MSG_GET_ESSID]="--- S'il vous plaît, indiquez le SSID du WLAN auquel vous voulez vous connecter (il sera masqué dans le fichier de sortie):"
+MSG_FR[$MSG_GOT_ESSID]="--- WLAN SSID à connecter: %1"
+MSG_FR[$MSG_NO_NIC_FOUND]="!!! CND0100E: Aucune carte réseau pour le type de connexion sélectionné a été trouvée sur le système"
+MSG_FR[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Aucune interface réseau active n'a été trouvée sur votre système pour le type de connexion sélectionnée."
+MSG_FR[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: La carte réseau %1 n'a pas d'adresse IP"
+MSG_FR[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Il y a plus d'une carte réseau définies dans le même sous-réseau: %1"
+MSG_FR[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Aucune passerelle n'est définie sur votre système"
+MSG_FR[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Il pourrait y avoir un problème avec la définition de la passerelle par défaut %1 sur l'interface %2"
+MSG_FR[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Impossible d'accéder au serveur de noms d' IP %1 défini dans /etc/resolv.conf"
+MSG_FR[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Aucun serveur de noms défini dans /etc/resolv.conf "
+MSG_FR[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Le système ne peut pas pinguer l'adresse IP externe %1"
+MSG_FR[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: Le firmware pour WLAN est absent ou ne peut pas être chargé"
+MSG_FR[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Le MTU maximum possible est de %1, mais le MTU réel sur la plaque réseau %2 est de %3"
+MSG_FR[$MSG_APIPA_DETECTED]="!!! CND0210W: Adresse IP APIPA  %1 détectée sur la carte réseau %2"
+MSG_FR[$MSG_NIC_ERRORS]="!!! CND0220W: Erreurs graves de transmission sur l'interface de réseau %1 détectée"
+MSG_FR[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 activé"
+MSG_FR[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: le networkmanager pour configuration du réseau est actif, mais il existe une configuration YAST de carte réseau pour %1"
+MSG_FR[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: Le système ne peut pas rechercher le DNS externe %1 "
+MSG_FR[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper pour %1 ne peut pas être utilisé en parallèle avec le pilote Linux natif %2"
+MSG_FR[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Le pilote Windows %1 n'est soit pas installé complètement (fichiers système manquants, par exemple) \ n --- ou provient d'une version incorrecte de Windows (par exemple, 98 au lieu de Win XP)"
+MSG_FR[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Les architectures du pilote Windows de %1 et de Linux sont incompatibles (mélange d'architectures 32 bits et 64 bits)"
+MSG_FR[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Configuration réseau introuvable pour l'interface %1"
+MSG_FR[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Pas trouvé de serveur dhcp sur l'interface %1"
+MSG_FR[$MSG_IFUP_CONFIGURED]="!!! CND0310W: une configuration classique de réseau par ifup a été détectée. La configuration par networkmanager est beaucoup plus facile"
+MSG_FR[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN désactivé par interrupteur materiel ou logiciel"
+MSG_FR[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Des problèmes d'authenticité du WLAN existent sur l'interface %1"
+MSG_FR[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: Serveur DHCP peut être indisponibles sur l' interface %1"
+MSG_FR[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Connexion sans fil testée avec une connexion filaire existante sur interface %1. Débranchez le câble d'interface et exécutez le script à nouveau"
+MSG_FR[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: Le système ne peut pas pinger le nom DNS externe %1"
+MSG_FR[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Pas de WLANs détectés sur l'interface %1. Le matériel et/ou le pilote sont mal configurés"
+MSG_FR[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Aucun module chargé n 'est détecté pour l'interface %1"
+MSG_FR[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Modules alternatifs %1 détectés pour l'interface %2"
+MSG_FR[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Le DNS configuré par l' IP %1 n'est pas un serveur DNS"
+MSG_FR[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Il y a un problème avec le serveur DNS configuré avec IP %1"
+MSG_FR[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza ne supporte pas cette distribution Linux"
+MSG_FR[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Cette distribution n'est pas supportée"
+MSG_FR[$MSG_CHECK_KEYS]="!!! CND0450W: Le 'masquerading' WLAN n'est pas entièrement testé sur cette distribution. S'il vous plaît vérifiez sur le fichier de sortie %1 les clés WLAN visibles et 'mascaradez' manuellement"
+MSG_FR[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: L'analyse de %1 est seulement possible si le script est invoqué en tant que root"
+MSG_FR[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Capacité d'analyse réduite et moins d'informations de réseau parce que le script n'a pas été invoqué en tant que root"
+MSG_FR[$MSG_MISSING_LINK]="!!! CND0480W: Pas de lien détecté sur l'interface %1"
+MSG_FR[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Aucun point d'accès avec votre SSID détecté sur l'interface %1"
+MSG_FR[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Canal %1 utilisé par votre point d'accès est également utilisée par %2 autres points d'accès"
+MSG_FR[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Canal %1 utilisé par votre point d'accès interfère avec %2 des points d'accès adjacents"
+MSG_FR[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: Le wpa_supplicant n'est pas actif"
+
+# --- MSG_CS
+
+MSG_CS[$MSG_UNDEFINED]="Nedefinována správa. Prosím, informujte autora $CONTACT"
+MSG_CS[$MSG_INTERNAL_ERROR]="Objevile se %1 chyba. Kontaktujte prosím autora $CONTACT"
+MSG_CS[$MSG_ELIZA_START_ANALYZE]="--- NWEliza analyzuje systém pro obecné chyby síťové konfigurace..."
+MSG_CS[$MSG_START_COLLECTING]="--- NWCollect shromažďuje informaci o síťové konfiguraci  do souboru %1 ..."
+MSG_CS[$MSG_CON_WRL]="--- (1) Bezdrátové připojení (WLAN)"
+MSG_CS[$MSG_ANSWER_CHARS_NO]="Nn"
+MSG_CS[$MSG_ANSWER_CHARS_YES]="Aa"
+MSG_CS[$MSG_MAIN_PROG_REQUIRED]="!!! Program %1 se nenašel. Nainstalujte program a spusťte skript znovu"
+MSG_CS[$MSG_MAIN_NO_ERROR_DETECTED]="--- Nejsou detekovány žádné zřejmé chyby/hlášení. Pošlete obsah souboru %1 do vašeho oblíbeného Linux fóra a přečtěte $HTTP_UPLOAD_URL"
+MSG_CS[$MSG_ASK_LANG]="--- Chcete poslat soubour s výsledky do mezinárodního fóra (a/[n])?"
+MSG_CS[$MSG_SELECT_LANG]="--- Prosím, odpovězte takhle: ano (A) nebo ne (N):"
+MSG_CS[$MSG_GET_TOPOLOGY]="--- Jaký je typ síťové topologie ?"
+MSG_CS[$MSG_UNSUPPORTED_TOPOLOGY]="--- Neznámá topologie"
+MSG_CS[$MSG_PLEASE_CORRECT_ANSWER]="--- Prosím odpovězte s 1-%1: "
+MSG_CS[$MSG_TOPO_DM_LC]="--- (1) DSL modem <---> Linux klient"
+MSG_CS[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> Linux klient"
+MSG_CS[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> Linux Router <---> Linux klient"
+MSG_CS[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> LinuxClient"
+MSG_CS[$MSG_MAIN_POST_FILE]="--- Pokud posílání selhalo, umístněte obsah souboru %1 na internet\n--- (viz $HTTP_UPLOAD_URL pro odkazy) \n--- a pak vložte odkaz na vaše oblíbené Linux fórum. "
+MSG_CS[$MSG_GET_HOST]="--- Na kterém host-u je skript spuštěn?"
+MSG_CS[$MSG_UNSUPPORTED_HOST]="--- Nesprávný host"
+MSG_CS[$MSG_HOST_RT]="--- (2) Linux Router"
+MSG_CS[$MSG_HOST_CL]="--- (1) Linux klient"
+MSG_CS[$MSG_MAIN_BECOME_ROOT]="--- Prosím vložte root heslo."
+MSG_CS[$MSG_CON_WRD]="--- (2) Drátové připojení"
+MSG_CS[$MSG_GET_CONNECTION]="--- Který typ vašeho síťového připojení se má testovat?"
+MSG_CS[$MSG_UNSUPPORTED_CONNECTION]="--- Neznámý typ připojení"
+MSG_CS[$MSG_MAIN_GOTO_LINK]="--- Jděte na $HTTP_HELP_URL pro získaní více detailních instrukcí \n--- o cybě/hlášení a jak problém manuálně opravit."
+MSG_CS[$MSG_TOPO_AP_LC]="--- (1) WLAN access point <---> Linux klient"
+MSG_CS[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> Linux klient"
+MSG_CS[$MSG_TOPO_AP_LR_LC]="--- (3) WLAN access point <---> Linux Router <---> Linux klient"
+MSG_CS[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> Linux Router <---> Linux klient"
+MSG_CS[$MSG_ASK_FOR_ROOT]="--- Spyštění skriptu jako root umožňuje detailnější analýzu a lepší výsledky. \n--- Pokud máte jakékoli zaujetí spustit skript jako root, prosím přečtěte si $HTTP_ROOT_ACCESS.\n--- Chcete spustit skript jako root ([a]/n)?"
+MSG_CS[$MSG_GET_ESSID]="--- Prosím vložte WLAN SSID ke kterému se chcete připojit (bude změněno ve výsledném souboru): "
+MSG_CS[$MSG_GOT_ESSID]="--- WLAN SSID připojit: %1"
+MSG_CS[$MSG_NO_NIC_FOUND]="!!! CND0100E: Nenašla se žádná síťová karta  pro zvolený typ připojení"
+MSG_CS[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Nenašlo se žádné aktivní síťové rozhraní pro zvolený typ připojení"
+MSG_CS[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Síťová karta %1 nemá žádnou IP adresu"
+MSG_CS[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Je definováno více síťových karet  ve stejném subnet-u/podsíti: %1"
+MSG_CS[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: V systému není nastavena žádná brana/gateway"
+MSG_CS[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Může být problém s přednastavenou bránou %1 v síťovém rozhraní %2"
+MSG_CS[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Nemohu se připojit nameserver s IP %1 nastavenou v /etc/resolv.conf"
+MSG_CS[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Není nastavený žádný nameserver v /etc/resolv.conf"
+MSG_CS[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Systém nemůže provést ping test externí IP adresy %1"
+MSG_CS[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: Chybí nebo nemohu nahrát WLAN firmware"
+MSG_CS[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Maximum možného MTU je %1, ale nynější MTU na kartě %2 je %3"
+MSG_CS[$MSG_APIPA_DETECTED]="!!! CND0210W: APIPA IP adresa %1 detekována na síťové kartě %2"
+MSG_CS[$MSG_NIC_ERRORS]="!!! CND0220W: Objevily se vážné přenosové chyby v síťovém rozhraní %1 "
+MSG_CS[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 povolené"
+MSG_CS[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager pro síťovou konfiguraci je povolen, ale existuje YAST konfigurace síťové karty pro %1 "
+MSG_CS[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: System nemůže vyhledat externí DNS jméno %1"
+MSG_CS[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper pro %1 nemůže být použit paralelně s linuxovým vlastním ovladačem %2"
+MSG_CS[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Použitý windows ovladč %1 je neúplně nainstalován (např. chybí sys soubory)\n--- nebo je ze špatné windows verzi (např. Win 98 namísto XP)"
+MSG_CS[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Nekompatibilní architektura windows ovladače %1 a Linux architektury (32 bit a 64 bit smíchané architektury)"
+MSG_CS[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Nenašla se žádná síťová konfigurace pro rozhraní %1"
+MSG_CS[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Nenašel se DHCP server found pro rozhraní %1"
+MSG_CS[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Detekována klasická síťová konfigurace s ifup. Konfigurace s networkmanager-em je mnohem lehčí"
+MSG_CS[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: WLAN je vypnuté hardwarovám nebo softwarovým přepínačem/switch-em"
+MSG_CS[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: WLAN potíže existují na rozhraní %1"
+MSG_CS[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: dhcp server může být nedostupný na rozhraní %1"
+MSG_CS[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Bezdrátobé připojení ostestováno s existujícím drátovým připojením  na rozhraní %1. Odpojte kabel a opět spusťte skript"
+MSG_CS[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: System nemůže provést ping test pro externí DNS jméno %1"
+MSG_CS[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Nedetkováno žádné WLAN na rozhraní %1. Hardware a/nebo ovladač není správně nakonfigurovno"
+MSG_CS[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Není detekován žádný nahraný modul pro rozhraní %1"
+MSG_CS[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Alternativní modul %1 detekován pro rozhraní %2"
+MSG_CS[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Nakonfigurovaný nameserver s IP %1 není nameserver"
+MSG_CS[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Je problém s nakonfigurovaným nameserver-em s IP %1"
+MSG_CS[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza nepodporuje tuto Linux distribuci"
+MSG_CS[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Tato distribuce není podporována"
+MSG_CS[$MSG_CHECK_KEYS]="!!! CND0450W: WLAN masquerading klíč není zcela otestován na této distribuci. Prosím, zkontrolujte výsledný soubor %1 pro viditelné WLAN klíče a zamaskujte je manuálně"
+MSG_CS[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analýza %1 je možná pouze pokud je skript spuštěn jako root"
+MSG_CS[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Analýza redukována a méně síťových informací, protože skript nebyl spuštěn jako root"
+MSG_CS[$MSG_MISSING_LINK]="!!! CND0480W: Nneí deetekováno žádné spojení na rozhraní %1"
+MSG_CS[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Není detekován žádny přístupový bod s vašim SSID  na rozhraní %1"
+MSG_CS[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Kanál %1 použitý vašim přístupovým bodem je také použit %2 ostatními přístup. body"
+MSG_CS[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Kanál %1 použitý vašim přístupovým bodem se míchá s %2 sousedícími přístup. body"
+MSG_CS[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant není aktivní"
+
+# --- MSG_PT
+
+MSG_PT[$MSG_UNDEFINED]="Por favor informe o autor $CONTACT"
+MSG_PT[$MSG_INTERNAL_ERROR]="Erro interno %1. Por favor informe o autor $CONTACT"
+MSG_PT[$MSG_ELIZA_START_ANALYZE]="--- NWEliza está procurando por erros comuns de configuração de rede no sistema ..."
+MSG_PT[$MSG_START_COLLECTING]="--- NWCollect está reunindo informações de configuração de rede no arquivo %1 ..."
+MSG_PT[$MSG_CON_WRL]="--- (1) Conexão sem fio (WLAN)"
+MSG_PT[$MSG_ANSWER_CHARS_NO]="Nn"
+MSG_PT[$MSG_ANSWER_CHARS_YES]="Ss"
+MSG_PT[$MSG_MAIN_PROG_REQUIRED]="!!! Programa %1 não encontrado. Instale o programa e execute esse script novamente"
+MSG_PT[$MSG_MAIN_NO_ERROR_DETECTED]="--- Nenhum erro/aviso óbvio detectado. Poste o conteúdo do arquivo %1 em seu fórum Linux preferido e leia $HTTP_UPLOAD_URL"
+MSG_PT[$MSG_ASK_LANG]="--- Você quer postar o arquivo resultante em um fórum internacional (s/[n])?"
+MSG_PT[$MSG_SELECT_LANG]="--- Por favor responda sim (S) ou não (N):"
+MSG_PT[$MSG_GET_TOPOLOGY]="--- Qual é a topologia da rede?"
+MSG_PT[$MSG_UNSUPPORTED_TOPOLOGY]="--- Topologia desconhecida"
+MSG_PT[$MSG_PLEASE_CORRECT_ANSWER]="--- Por favor responda com 1-%1: "
+MSG_PT[$MSG_TOPO_DM_LC]="--- (1) Modem DSL <---> Cliente Linux"
+MSG_PT[$MSG_TOPO_DR_LC]="--- (2) Roteador DSL <---> Cliente Linux"
+MSG_PT[$MSG_TOPO_DM_LR_LC]="--- (3) Modem DSL <---> Roteador Linux <---> Cliente Linux"
+MSG_PT[$MSG_TOPO_DR_LR_LC]="--- (4) Roteador DSL <---> Roteador Linux <---> Cliente Linux"
+MSG_PT[$MSG_MAIN_POST_FILE]="--- Se você não foi bem sucedido poste o conteúdo do arquivo %1 na internet\n--- (veja $HTTP_UPLOAD_URL para links) \n--- e informe o link nopaste em seu fórum Linux preferido."
+MSG_PT[$MSG_GET_HOST]="--- Em que host o script é executado?"
+MSG_PT[$MSG_UNSUPPORTED_HOST]="--- Host inválido"
+MSG_PT[$MSG_HOST_RT]="--- (2) Roteador Linux"
+MSG_PT[$MSG_HOST_CL]="--- (1) Cliente Linux"
+MSG_PT[$MSG_MAIN_BECOME_ROOT]="--- Por favor digite a senha de root."
+MSG_PT[$MSG_CON_WRD]="--- (2) Conexão cabeada"
+MSG_PT[$MSG_GET_CONNECTION]="--- Que tipo de conexão da sua rede deve ser testado?"
+MSG_PT[$MSG_UNSUPPORTED_CONNECTION]="--- Tipo de conexão desconhecido"
+MSG_PT[$MSG_MAIN_GOTO_LINK]="--- Acesse $HTTP_HELP_URL para obter instruções detalhadas \n--- sobre mensagens de erro/aviso e como resolver os problemas por conta própria."
+MSG_PT[$MSG_TOPO_AP_LC]="--- (1) Ponto de acesso wireless <---> Cliente Linux"
+MSG_PT[$MSG_TOPO_WR_LC]="--- (2) Roteador wireless <---> Cliente Linux"
+MSG_PT[$MSG_TOPO_AP_LR_LC]="--- (3) Ponto de acesso wireless <---> Roteador Linux <---> Cliente Linux"
+MSG_PT[$MSG_TOPO_WR_LR_LC]="--- (4) Roteador wireless <---> Roteador Linux <---> Cliente Linux"
+MSG_PT[$MSG_ASK_FOR_ROOT]="--- Executar esse script como root permite uma análise mais detalhada e melhores resultados. \n--- Se você se preocupa em executar o script como root por favor leia $HTTP_ROOT_ACCESS.\n--- Você quer executar o script como root ([s]/n)?"
+MSG_PT[$MSG_GET_ESSID]="--- Por favor digite a SSID da rede sem fio à qual quer se conectar (será mascarada no arquivo de saída): "
+MSG_PT[$MSG_GOT_ESSID]="--- WLAN SSID da rede local sem fio a conectar: %1"
+MSG_PT[$MSG_NO_NIC_FOUND]="!!! CND0100E: Nenhuma placa de rede para a conexão escolhida foi encontrada no sistema"
+MSG_PT[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Nenhuma interface de rede ativa foi encontrada no sistema para a conexão escolhida"
+MSG_PT[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: A placa de rede %1 não está associada a um endereço IP"
+MSG_PT[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Há mais de uma placa de rede associada à mesma subrede: %1"
+MSG_PT[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Gateway padrão não especificado nesse sistema"
+MSG_PT[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Pode haver um problema com a especificação do gateway padrão %1 na interface %2"
+MSG_PT[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Não foi possível acessar o servidor de nomes %1 especificado em /etc/resolv.conf"
+MSG_PT[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Nenhum servidor de nomes especificado em /etc/resolv.conf"
+MSG_PT[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: O sistema não consegue dar ping no IP %1"
+MSG_PT[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: O firmware da rede sem fio está faltando ou não pode ser carregado"
+MSG_PT[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: O MTU máximo é %1, mas o MTU real na placa de rede %2 é %3"
+MSG_PT[$MSG_APIPA_DETECTED]="!!! CND0210W: Endereço IP %1 APIPA detectado na placa de rede %2"
+MSG_PT[$MSG_NIC_ERRORS]="!!! CND0220W: Erros sérios de transmissão detectados na placa de rede %1"
+MSG_PT[$MSG_IPV6_DETECTED]="!!! CND0230W: IPV6 habilitado"
+MSG_PT[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: O sistema não consegue resolver o nome DNS externo %1"
+MSG_PT[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndiswrapper para %1 não pode ser usado junto com o driver nativo do Linux %2"
+MSG_PT[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: O driver Windows %1 usado não foi instalado completamente (p. ex. arquivos .sys faltando)\n--- ou são de uma versão windows incompatível (p. ex. Win 98 em vez de XP)"
+MSG_PT[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Arquiteturas incompatíveis dos drivers Windows %1 e Linux (32 bits e 64 bits misturadas)"
+MSG_PT[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Nenhuma configuração de rede encontrada para a interface %1"
+MSG_PT[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Nenhum servidor DHCP encontrado na interface %1"
+MSG_PT[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Configuração ifup clássica detectada. A configuração com o networkmanager é bem mais fácil"
+MSG_PT[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: Rede sem fio desligada por interruptor de hardware ou software"
+MSG_PT[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Problema de credenciais de rede sem fio na interface %1"
+MSG_PT[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: O servidor DHCP pode não estar disponível na interface %1"
+MSG_PT[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Conexão sem fio testada com uma conexão cabeada na interface %1. Desconecte o cabo e execute o script novamente"
+MSG_PT[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: O sistema não consegue dar ping no nome DNS externo %1"
+MSG_PT[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Nenhuma rede local sem fio detectada na interface %1. Hardware e/ou driver configurados erroneamente"
+MSG_PT[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Nenhum módulo carregado detectado para a interface %1"
+MSG_PT[$MSG_HW_SOME_INACTIVE]="!!! CND0400W: Módulo alternativo %1 detectado para a interface %2"
+MSG_PT[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Servidor de nomes configurado com IP %1 não é um servidor de nomes"
+MSG_PT[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Existe um problema com o servidor de nomes configurado com IP %1"
+MSG_PT[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza não suporta essa distribuição Linux"
+MSG_PT[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Essa distribuição não é suportada"
+MSG_PT[$MSG_CHECK_KEYS]="!!! CND0450W: O mascaramento da chave de rede sem fio não está completamente testado nessa distribuição. Cheque o arquivo %1 e mascare chaves visíveis manualmente"
+MSG_PT[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Análise de %1 só é possível se o script for executado como root"
+MSG_PT[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Capacidade reduzida de análise e menos informações de rede porque o script não foi executado como root"
+MSG_PT[$MSG_MISSING_LINK]="!!! CND0480W: Nenhuma conexão detectada na interface %1"
+MSG_PT[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Nenhum ponto de acesso com sua SSID detectado na interface %1"
+MSG_PT[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: O canal %1 usado por seu ponto de acesso também é usado por %2 outros pontos de acesso"
+MSG_PT[$MSG_SSID_INTERFERENCES]="!!! CND0510W: O canal %1 usado por seu ponto de acesso interfere com %2 pontos de acesso adjacentes"
+MSG_PT[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa-supplicant não está ativo"
+
+# --- MSG_PL
+
+MSG_PL[$MSG_UNDEFINED]="Niezdefiniowany komunikat. Proszę poinformuj autora $CONTACT"
+MSG_PL[$MSG_INTERNAL_ERROR]="Wystąpił błąd wewnętrzny %1. Proszę poinformuj autora $CONTACT"
+MSG_PL[$MSG_ELIZA_START_ANALYZE]="--- NWEliza analizuje system pod kątem najczęstszych błędów konfiguracji sieci."
+MSG_PL[$MSG_START_COLLECTING]="--- NWCollect zbiera dane na temat konfiguracji sieci do pliku %1 ..."
+MSG_PL[$MSG_CON_WRL]="--- (1) Połączenie bezprzewodowe (WLAN)"
+MSG_PL[$MSG_ANSWER_CHARS_NO]="Nn"
+MSG_PL[$MSG_ANSWER_CHARS_YES]="Tt"
+MSG_PL[$MSG_MAIN_PROG_REQUIRED]="!!! Program %1 nie został znaleziony. Zainstaluj go i uruchom skrypt ponownie"
+MSG_PL[$MSG_MAIN_NO_ERROR_DETECTED]="--- Nie znaleziono żadnego oczywistego błędu lub ostrzeżenia. Umieść zawartość pliku %1 na swoim ulubionym forum i przeczytaj $HTTP_UPLOAD_URL"
+MSG_PL[$MSG_ASK_LANG]="--- Czy chcesz opublikować wyniki na międzynarodowym forum (t/[n])?"
+MSG_PL[$MSG_SELECT_LANG]="--- Proszę odpowiedz tak (T) lub nie (N):"
+MSG_PL[$MSG_GET_TOPOLOGY]="--- Jaki jest typ topologi sieci?"
+MSG_PL[$MSG_UNSUPPORTED_TOPOLOGY]="--- Nieznana topologia"
+MSG_PL[$MSG_PLEASE_CORRECT_ANSWER]="--- Proszę odpowiedz 1-%1: "
+MSG_PL[$MSG_TOPO_DM_LC]="--- (1) modem DSL <----> Klient Linux"
+MSG_PL[$MSG_TOPO_DR_LC]="--- (2) DSL HW router <---> Klient Linux"
+MSG_PL[$MSG_TOPO_DM_LR_LC]="--- (3) DSL modem  <---> LinuxRouter <---> Klient Linux"
+MSG_PL[$MSG_TOPO_DR_LR_LC]="--- (4) DSL HW router <---> LinuxRouter <---> Klient Linux"
+MSG_PL[$MSG_MAIN_POST_FILE]="--- Jeżeli nie udało się proszę umieść zawartość pliku %1 w sieci\n--- (linki możesz znaleźć w $HTTP_UPLOAD_URL) \n--- i umieść link na swoim ulubionym forum. "
+MSG_PL[$MSG_GET_HOST]="--- Na jakim komputerze został uruchomiony skrypt?"
+MSG_PL[$MSG_UNSUPPORTED_HOST]="--- Nieprawidłowy host"
+MSG_PL[$MSG_HOST_RT]="--- (2) LinuxRouter"
+MSG_PL[$MSG_HOST_CL]="--- (1) Klient Linux"
+MSG_PL[$MSG_MAIN_BECOME_ROOT]="--- Proszę wprowadzić hasło użytkownika root."
+MSG_PL[$MSG_CON_WRD]="--- (2) Połączenie przewodowe"
+MSG_PL[$MSG_GET_CONNECTION]="--- Który typ połączenia sieciowego ma zostać przetestowany?"
+MSG_PL[$MSG_UNSUPPORTED_CONNECTION]="--- Nieznany typ połączenia sieciowego"
+MSG_PL[$MSG_MAIN_GOTO_LINK]="--- Przejdź do $HTTP_HELP_URL aby uzyskać szczegółowe instrukcje \n--- na temat błędów oraz ostrzeżeń oraz w jaki sposób samodzielnie usunąć problemy."
+MSG_PL[$MSG_TOPO_AP_LC]="--- (1) Punkt dostępowy WLAN <---> Klient Linux"
+MSG_PL[$MSG_TOPO_WR_LC]="--- (2) WLAN HW router <---> Klient Linux"
+MSG_PL[$MSG_TOPO_AP_LR_LC]="--- (3) Punkt dostępowy WLAN <---> LinuxRouter <---> Klient Linux"
+MSG_PL[$MSG_TOPO_WR_LR_LC]="--- (4) WLAN HW router <---> LinuxRouter <---> Klient Linux"
+MSG_PL[$MSG_ASK_FOR_ROOT]="--- Uruchomienie tego skryptu jako root pozwala na uzyskanie bardziej szczegółowej analizy i przeważnie daje lepsze rezultaty.\n--- Jeżeli masz jakiekolwiek obawy z uruchamianiem skryptu jako root proszę przeczytaj $HTTP_ROOT_ACCESS.\n --- Czy mam uruchomić skrypt jak użytkownik root ([t]/n)?"
+MSG_PL[$MSG_GET_ESSID]="--- Proszę wprowadź nazwę sieci bezprzewodowej (WLAN SSID) do której chcesz się połączyć (nazwa będzie niewidoczna w pliku wynikowym): "
+MSG_PL[$MSG_GOT_ESSID]="--- WLAN SSID do połączenia: %1"
+MSG_PL[$MSG_NO_NIC_FOUND]="!!! CND0100E: Nie znaleziono kart sieciowych umożliwiających połączenie wybranego typu"
+MSG_PL[$MSG_NO_VALID_NI_FOUND]="!!! CND0110E: Nie aktywnych urządzeń dla wybranego typu połączenia"
+MSG_PL[$MSG_NO_IP_ASSIGNED_TO_NIC]="!!! CND0120E: Karta sieciowa %1 nie ma przydzielonego adresu IP"
+MSG_PL[$MSG_DUPLICATE_NETWORKS]="!!! CND0130E: Więcej niż jedna karta sieciowa jest przydzielona do tej samej podsieci: %1"
+MSG_PL[$MSG_NO_DEFAULT_GATEWAY_SET]="!!! CND0140E: Brak domyślnej bramy"
+MSG_PL[$MSG_CHECK_DEFAULT_GATEWAY_SETTING]="!!! CND0150E: Ustawienie domyślnej bramy %1 na urządzeniu %2 może stwarzać problemy"
+MSG_PL[$MSG_NAMESERVER_NOT_ACCESSIBLE]="!!! CND0160E: Serwer nazw %1 zdefiniowany w pliku /etc/resolv.conf jest nieosiągalny"
+MSG_PL[$MSG_NO_NAMESERVER_DEFINED]="!!! CND0170E: Brak zdefiniowanych serwerów nazw (DNS) w pliku /etc/resolv.conf"
+MSG_PL[$MSG_CANT_PING_EXTERNAL_IP]="!!! CND0180I: Komenda ping nie może dotrzeć do zewnętrznego adresu IP %1"
+MSG_PL[$MSG_POSSIBLE_WLAN_FIRMWARE_PROBLEMS]="!!! CND0190E: Brak firmware dla WLAN bądź nie może on zostać załadowany"
+MSG_PL[$MSG_POSSIBLE_MTU_PROBLEMS]="!!! CND0200W: Maksymalne możliwe MTU wynosi %1, lecz aktualnie ustawione na karcie %2 jest %3"
+MSG_PL[$MSG_APIPA_DETECTED]="!!! CND0210W: Na karcie %2 przydzielony jest awaryjny automatyczny adres sieciowy (APIPA)"
+MSG_PL[$MSG_NIC_ERRORS]="!!! CND0220W: Na urządzeniu %1 wykryto poważne błędy transmisji"
+MSG_PL[$MSG_IPV6_DETECTED]="!!! CND0230W: Włączony protokół IPV6"
+MSG_PL[$MSG_KNETWORKMANAGER_ERROR]="!!! CND0240E: networkmanager jest włączony ale jednocześnie karta sieciowa %1 jest skonfigurowana poprzez YAST"
+MSG_PL[$MSG_CANT_LOOKUP_EXTERNAL_DNS]="!!! CND0250E: Nie można odpytać zewnętrznego serwera nazw (DNS) %1"
+MSG_PL[$MSG_NDISWRAPPER_PROB]="!!! CND0260E: ndsiwrpaper dla %1 nie może być użyty razem z natywnym sterownikiem dla linuxa %2"
+MSG_PL[$MSG_NDISWRAPPER_FW_PROB]="!!! CND0270E: Używany sterownik Windows %1 nie został w całości zainstalowany (np. brak niektórych plików systemowych)\n--- bądź jest ze złej wersji Windows (np. Win98 zamiast XP)"
+MSG_PL[$MSG_NDISWRAPPER_ARCH_PROB]="!!! CND0280E: Wersja sterowników Windows %1 niekompatybilna z architekturą Linuxa (Wymieszana architektura 32- i 64 bitowa)"
+MSG_PL[$MSG_NO_NIC_CONFIG_FOUND]="!!! CND0290E: Nie znaleziono konfiguracji dla urządzenia %1"
+MSG_PL[$MSG_NO_DHCP_FOUND]="!!! CND0300E: Nie znaleziono serwera DHCP na urządzeniu %1"
+MSG_PL[$MSG_IFUP_CONFIGURED]="!!! CND0310W: Wykryto standardową konfigurację sieciową poprzez ifup. Konfiguracja z użyciem networkmanager jest znacznie prostsza."
+MSG_PL[$MSG_WLAN_KILL_SWITCH_ON]="!!! CND0320E: Sieć bezprzewodowa została wyłączona z poziomu sprzętowego bądź programowego"
+MSG_PL[$MSG_WLAN_AUTH_PROBS]="!!! CND0330E: Na urządzeniu %1 istnieje problem z uwierzytelnianiem WLAN"
+MSG_PL[$MSG_NO_DHCP_DETECTED]="!!! CND0350W: DHCP serwer może nie być dostępny dla urządzenia %1"
+MSG_PL[$MSG_WLAN_WIRED_ONLINE]="!!! CND0360E: Testy połączenia bezprzewodowego przeprowadzone z istniejącym połączeniem sieciowym na urządzeniu %1. Proszę odłącz kabel sieciowy i uruchom skrypt ponownie"
+MSG_PL[$MSG_CANT_PING_EXTERNAL_DNS]="!!! CND0370I: Serwer nazw %1 niedostępny z użyciem komendy ping"
+MSG_PL[$MSG_WLAN_NO_SCAN]="!!! CND0380E: Nie wykryto żadnych sieci bezprzewodowych na urządzeniu %1. Urządzeniu i/lub sterownik nie zostały prawidłowo skonfigurowane"
+MSG_PL[$MSG_HW_NO_ACTIVE]="!!! CND0390E: Brak załadowanego modułu dla urządzenia %1"
+MSG_PL[$MSG_HW_SOME_INACTIVE]="!!! cnd0400W: Alternatywne moduły %1 zostały wykryte dla urządzenia %2"
+MSG_PL[$MSG_NAMESERVER_NOT_VALID]="!!! CND0410E: Serwer nazw skonfigurowany pod adresem %1 nie jest właściwym serwerem nazw"
+MSG_PL[$MSG_NAMESERVER_PROBLEM_UNKNOWN]="!!! CND0420E: Wykryto problem z serwerem nazw skonfigurowanym pod adresem %1"
+MSG_PL[$MSG_NWELIZA_UNAVAILABLE]="!!! CND0430I: NWEliza nie jest wspierana dla tej dystrybucji"
+MSG_PL[$MSG_DISTRO_NOT_SUPPORTED]="!!! CND0440E: Ta dystrybucja nie jest wspierana"
+MSG_PL[$MSG_CHECK_KEYS]="!!! CND0450W: Maskowania kluczy WLAN dla tej dystrybucji nie zostało w pełni przetestowane. Proszę sprawdź plik z wynikami %1 czy są tam zapisane klucze WLAN i zamaskuj je ręcznie."
+MSG_PL[$MSG_NO_ANALYSIS_AS_USER]="!!! CND0460I: Analiza %1 jest możliwa tylko jeżeli skrypt został uruchomiony jako użytkownik root"
+MSG_PL[$MSG_ANALYSIS_AS_USER]="!!! CND0470I: Ponieważ skrypt nie został uruchomiony z prawami roota wiarygodność analizy oraz ilość informacji zostały obniżone"
+MSG_PL[$MSG_MISSING_LINK]="!!! CND0480W: Brak połączenia na urządzeniu %1"
+MSG_PL[$MSG_WLAN_NO_SSID_IN_SCAN_FOUND]="!!! CND0490E: Nie znaleziono punktu dostępowego z podaną nazwą (SSID) dla urządzenia %1"
+MSG_PL[$MSG_SSID_SAME_CHANNEL]="!!! CND0500W: Kanał %1 używany przez Twój punkt dostępowy jest wykorzystywany również %2 innych punktów"
+MSG_PL[$MSG_SSID_INTERFERENCES]="!!! CND0510W: Kanał %1 używany przez twój punkt dostępowy interferuje z %2 innymi punktami dostępowymi"
+MSG_PL[$MSG_NO_WPA_SUPPLICANT_ACTIVE]="!!! CND0520W: wpa_supplicant nie jest aktywny"
+
 # vim: tabstop=4:softtabstop=4:shiftwidth=4:noexpandtab:syntax=sh 
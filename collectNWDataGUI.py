@@ -66,6 +66,11 @@ import shlex
 import Queue
 import re
 import errno
+import hashlib
+import json
+import mmap
+import collections
+import time
 import sys
 import subprocess
 import os
@@ -77,6 +82,7 @@ import pexpect
 import collectNWDataGUIResources
 import urllib
 from CommandExecutor import CommandExecutor       
+from PrivilegedHelper import PrivilegedHelper, PrivilegedCommand
 
 ### constants
 
@@ -89,6 +95,8 @@ WINDOW_SIZE_FINAL=(800,600)
 SCRIPT_NAME="collectNWData"
 SCRIPT_FILENAME=SCRIPT_NAME+".sh"
 SCRIPT_RESULTFILE=SCRIPT_NAME+".txt"
+SCRIPT_USAGEFILE=SCRIPT_NAME+".usage"        # resource usage of the last script run (json)
+SCRIPT_TOOLSFILE=SCRIPT_NAME+".tools"        # paths of the commands used by the script (cache)
 GUI_NAME=os.path.splitext(os.path.basename(__file__))[0]   
 GUI_FILENAME=GUI_NAME+".sh"
 ERR_FILENAME=GUI_NAME+".err"
@@ -120,8 +128,24 @@ CHECKSUM_WEBPAGE="http://www.linux-tips-and-tricks.de/index.php/View-document-de
 
 TEMPFILE_PREFIX="cnd-"
 
+TEXTVIEW_FLUSH_INTERVAL=40      # ms - textviews are updated at most once per frame
+RESULTFILE_SECTION_HEADER="\n====="   # section header line as written by colorate() of collectNWData.sh
+RESULTFILE_PAINT_SIZE=32768        # bytes of the result file materialized per paint
+DEBUGLOG_SIZE=5000              # debug records kept in memory and lines kept in the debug view
+DEBUGLOG_RENDER_INTERVAL=250    # ms between debug view updates
+
 ### Helper functions
 
+#    language followed by the more general ones, e.g. de_AT.UTF-8@euro, de_AT.UTF-8, de_AT, de
+
+def languageVariants(language):
+    variants=[language]
+    for separator in ['@','.','_']:
+        language=language.split(separator)[0]
+        if language not in variants:
+            variants.append(language)
+    return variants
+
 def getCVSInfo():
 #    guiInfo=[GUI_FILENAME,VERSION,CVS_REVISION,CVS_DATE]
     guiInfo=[GUI_FILENAME,VERSION]
@@ -157,22 +181,221 @@ def which(program):
 
     return None
 
+def fileHash(fileName):
+    f=open(fileName,"rb")
+    try:
+        return hashlib.sha1(f.read()).hexdigest()
+    finally:
+        f.close()
+
+#    write into a temporary file in the target directory and rename it so the file is never seen half written
+
+def writeFileAtomic(fileName, data, mode):
+    (fd,tempFileName)=tempfile.mkstemp(prefix=TEMPFILE_PREFIX, dir=os.path.dirname(os.path.abspath(fileName)))
+    try:
+        f=os.fdopen(fd,"wb")
+        try:
+            f.write(data)
+            os.fchmod(fd, mode)
+        finally:
+            f.close()
+        os.rename(tempFileName, fileName)
+    except:
+        os.remove(tempFileName)
+        raise
+
 def progressTimeout(progressbar):
     progressbar.pulse()
     return True 
 
-class AsynchronousFileReader(threading.Thread):
-    def __init__(self, fd, queue):
+#    Collects text appended to a textview and writes it with one insert and one scroll per frame
+
+class TextViewAppender:
+    def __init__(self, textView, interval=TEXTVIEW_FLUSH_INTERVAL):
+        self._textView = textView
+        self._interval = interval
+        self._pending = []
+        self._timer = None
+
+    def append(self, text):
+        self._pending.append(text)
+        if self._timer is None:
+            self._timer = gobject.timeout_add(self._interval, self._flushTimeout)
+
+    def _flushTimeout(self):
+        self._timer = None
+        self.flush()
+        return False
+
+    def flush(self):
+        if self._timer is not None:
+            gobject.source_remove(self._timer)
+            self._timer = None
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending = []
+        textbuffer = self._textView.get_buffer()
+        textbuffer.insert(textbuffer.get_end_iter(), text)
+        self._textView.scroll_to_mark(textbuffer.get_insert(), 0)
+
+    def clear(self):
+        if self._timer is not None:
+            gobject.source_remove(self._timer)
+            self._timer = None
+        self._pending = []
+        textbuffer = self._textView.get_buffer()
+        textbuffer.delete(textbuffer.get_start_iter(),textbuffer.get_end_iter())
+
+#    Maps the result file, indexes its sections and materializes them in a textview when scrolled to
+
+class ResultFileLoader:
+    def __init__(self, textView, scrollWindow):
+        self._textView = textView
+        self._adjustment = scrollWindow.get_vadjustment()
+        self._map = None
+        self._sections = []
+        self._nextSection = 0
+        self._handler = None
+        self._textView.connect("move-cursor", self._cursorMoved)
+
+    def load(self, fileName):
+        self.clear()
+        f=open(fileName,'rb')
+        try:
+            if os.fstat(f.fileno()).st_size > 0:     # empty files can't be mapped
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            f.close()
+        if self._map is None:
+            return
+        self._sections = self._indexSections()
+        self._handler = self._adjustment.connect("value-changed", self._scrolled)
+        self.paint()
+
+    def _indexSections(self):
+        offsets = [0]
+        pos = self._map.find(RESULTFILE_SECTION_HEADER)
+        while pos >= 0:
+            offsets.append(pos+1)
+            pos = self._map.find(RESULTFILE_SECTION_HEADER, pos+1)
+        offsets.append(len(self._map))
+        return [(start,end) for (start,end) in zip(offsets[:-1],offsets[1:]) if end > start]
+
+    def _scrolled(self, adjustment):
+        if adjustment.get_value() + 2*adjustment.get_page_size() >= adjustment.get_upper():   # last page visible
+            self.paint()
+
+    def _cursorMoved(self, textView, step, count, extendSelection):
+        if step == gtk.MOVEMENT_BUFFER_ENDS and count > 0:           # jump to end of file
+            self.paintAll()
+
+    def paint(self, size=RESULTFILE_PAINT_SIZE):
+        if self._nextSection >= len(self._sections):
+            return False
+        start = self._sections[self._nextSection][0]
+        end = start
+        while self._nextSection < len(self._sections) and end - start < size:
+            end = self._sections[self._nextSection][1]
+            self._nextSection += 1
+        textbuffer = self._textView.get_buffer()
+        textbuffer.insert(textbuffer.get_end_iter(), self._map[start:end])
+        return True
+
+    def paintAll(self):
+        if self._map is not None:
+            self.paint(len(self._map))
+
+    def getText(self):
+        if self._map is None:
+            return ''
+        return self._map[:]
+
+    def clear(self):
+        if self._handler is not None:
+            self._adjustment.disconnect(self._handler)
+            self._handler = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._sections = []
+        self._nextSection = 0
+        textbuffer = self._textView.get_buffer()
+        textbuffer.delete(textbuffer.get_start_iter(),textbuffer.get_end_iter())
+
+def formatDebugRecord(record):
+    (timestamp,message)=record
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%H:%M:%S.%f")+" - " + message+'\n'
+
+#    Writes debug records into a file in the background. Records are dropped if the writer falls behind.
+#    lock is held by everybody else writing into the same file
+
+class DebugLogSpiller(threading.Thread):
+    def __init__(self, logFile, lock, size=DEBUGLOG_SIZE):
         threading.Thread.__init__(self)
-        self._fd = fd
-        self._queue = queue
- 
+        self.daemon = True
+        self._logFile = logFile
+        self._lock = lock
+        self._queue = Queue.Queue(size)
+
+    def put(self, record):
+        try:
+            self._queue.put_nowait(record)
+        except Queue.Full:
+            pass
+
     def run(self):
-        for line in iter(self._fd.readline, ''):
-            self._queue.put(line)
- 
-    def eof(self):
-        return not self.is_alive() and self._queue.empty() 
+        while True:
+            records = [self._queue.get()]
+            try:
+                while True:
+                    records.append(self._queue.get_nowait())
+            except Queue.Empty:
+                pass
+            with self._lock:
+                self._logFile.write(''.join([formatDebugRecord(r) for r in records]))
+                self._logFile.flush()
+
+#    Keeps the latest debug records in a ring and renders new ones in batches into a textview
+
+class DebugLog:
+    def __init__(self, textView, size=DEBUGLOG_SIZE, spiller=None):
+        self._textView = textView
+        self._size = size
+        self._records = collections.deque(maxlen=size)
+        self._pushed = 0
+        self._rendered = 0
+        self._timer = None
+        self._spiller = spiller
+        if self._spiller:
+            self._spiller.start()
+
+    def push(self, message):
+        record = (time.time(), message)
+        self._records.append(record)
+        self._pushed += 1
+        if self._spiller:
+            self._spiller.put(record)
+        if self._timer is None:
+            self._timer = gobject.timeout_add(DEBUGLOG_RENDER_INTERVAL, self._renderTimeout)
+
+    def _renderTimeout(self):
+        self._timer = None
+        self.render()
+        return False
+
+    def render(self):
+        missing = min(self._pushed - self._rendered, len(self._records))   # older records were dropped from the ring
+        self._rendered = self._pushed
+        if missing == 0:
+            return
+        records = list(self._records)[-missing:]
+        textbuffer = self._textView.get_buffer()
+        textbuffer.insert(textbuffer.get_end_iter(), ''.join([formatDebugRecord(r) for r in records]))
+        excess = textbuffer.get_line_count() - self._size
+        if excess > 0:
+            textbuffer.delete(textbuffer.get_start_iter(), textbuffer.get_iter_at_line(excess))
+        self._textView.scroll_to_mark(textbuffer.get_insert(), 0)
 
 ### Main class
             
@@ -210,11 +433,17 @@ class CollectNWDataGUI:
                     
         return [True,desktopPath+'/'+DESKTOP_FILENAME]
     
+    def getLogFile(self):
+        if not hasattr(self,'ERR_FILE'):
+            self.ERR_FILE=open(ERR_FILENAME,"w")
+            self.ERR_FILE_LOCK=threading.Lock()     # shared with the DebugLogSpiller thread
+        return self.ERR_FILE
+
     def writeLogFile(self,message):
         if self.opts['LOG']:
-            if not hasattr(self,'ERR_FILE'):
-                self.ERR_FILE=open(ERR_FILENAME,"w")
-            print >> self.ERR_FILE, message
+            logFile=self.getLogFile()
+            with self.ERR_FILE_LOCK:
+                print >> logFile, message
     
 #    populate bundled glade xml, jpeg and I18N files 
     
@@ -222,12 +451,6 @@ class CollectNWDataGUI:
         
         # import I18N 
         
-        I18NZipString=StringIO.StringIO(collectNWDataGUIResources.i18n_data)
-        I18NZipFile=zipfile.ZipFile(I18NZipString, "r")
-        I18NTempdir=tempfile.mkdtemp(prefix=TEMPFILE_PREFIX)
-        I18NZipFile.extractall(I18NTempdir)    
-        I18NTempdirName=I18NTempdir+"/locale"
-        
         # following I18N initialization sequence with language fallback is adapted from http://wiki.maemo.org/How_to_Internationalize_python_apps
         
         # handle I18N detection and fallback
@@ -255,11 +478,11 @@ class CollectNWDataGUI:
      
         gettext.install (True,localedir=None, unicode=1)
      
-        gettext.find(GUI_NAME, I18NTempdirName) 
         gettext.textdomain (GUI_NAME) 
         gettext.bind_textdomain_codeset(GUI_NAME, "UTF-8")
      
-        language = gettext.translation (GUI_NAME, I18NTempdirName, languages = languages, fallback = True)
+        language = self.loadTranslation(collectNWDataGUIResources.store.get('i18n_data'), languages)
+        collectNWDataGUIResources.store.release('i18n_data')
         language.install()
 
         self.localLanguage = str(lc).split('_')[0]
@@ -268,18 +491,46 @@ class CollectNWDataGUI:
         self.installedLanguage = str(language._info['language']).split('_')[0]
         if self.opts['ENV']:            
             self.writeLogFile("Installed language: %s - %s" % (self.installedLanguage, language._info['language']))
-                
-        shutil.rmtree(I18NTempdir) # delete directory
     
         # extract other resources
             
-        self.GLADEXML=collectNWDataGUIResources.glade_data
-        self.PEXPECTLIC=collectNWDataGUIResources.pexpect_lic
-        
         loader = gtk.gdk.PixbufLoader('jpeg')
-        loader.write(collectNWDataGUIResources.image_data)
+        loader.write(collectNWDataGUIResources.store.get('image_data'))
         loader.close()
         self.LOGO = loader.get_pixbuf()
+        collectNWDataGUIResources.store.release('image_data')
+
+#    read the catalogs of all available languages directly from the bundled I18N zip. Same language selection
+#    and fallback chain (e.g. de_AT -> de -> en) as gettext.translation() but without extracting the zip into the filesystem
+
+    def loadTranslation(self, i18nData, languages):
+
+        I18NZipFile=zipfile.ZipFile(StringIO.StringIO(i18nData), "r")
+        catalogs=set(I18NZipFile.namelist())
+
+        expandedLanguages=[]
+        for lang in languages:
+            for expandedLanguage in languageVariants(lang):
+                if expandedLanguage not in expandedLanguages:
+                    expandedLanguages.append(expandedLanguage)
+
+        translation=None
+        for lang in expandedLanguages:
+            if lang == 'C':
+                break
+            catalog="locale/%s/LC_MESSAGES/%s.mo" % (lang, GUI_NAME)
+            if catalog in catalogs:
+                if self.opts['ENV']:
+                    self.writeLogFile("Catalog: %s" % (catalog))
+                catalogTranslation=gettext.GNUTranslations(StringIO.StringIO(I18NZipFile.read(catalog)))
+                if translation is None:
+                    translation=catalogTranslation
+                else:
+                    translation.add_fallback(catalogTranslation)
+
+        if translation is None:
+            return gettext.NullTranslations()
+        return translation
 
 #    either install/run or uninstall
 
@@ -333,7 +584,7 @@ class CollectNWDataGUI:
 
         desktopFound, desktopFile=self.getDesktopFilename()
         
-        filesToRemove=[SCRIPT_FILENAME, SCRIPT_RESULTFILE, ERR_FILENAME, LOGO_FILENAME, desktopFile, PEXPECT_LIC]
+        filesToRemove=[SCRIPT_FILENAME, SCRIPT_RESULTFILE, SCRIPT_USAGEFILE, SCRIPT_TOOLSFILE, ERR_FILENAME, LOGO_FILENAME, desktopFile, PEXPECT_LIC]
     
         if not os.path.islink(SCRIPT_FILENAME):
             for f in filesToRemove:
@@ -355,63 +606,45 @@ class CollectNWDataGUI:
              
         installingMessageWritten=False
         installingMessage=(_('%s will be installed')) % (GUI_NAME)
-               
-        # TODO: Check if existing version is older/newer than bundled version 
+
+        # existing files are only rewritten if their content differs from the bundled version
+
+        filesToInstall=[]
         if not os.path.islink(SCRIPT_FILENAME):      # don't overwrite my link in my dev env
-            if not os.path.exists(SCRIPT_FILENAME):
-                if not installingMessageWritten:
-                    print installingMessage
-                    installingMessageWritten=True
-                print (_('Creating file %s')) % (SCRIPT_FILENAME)
-                f=open(SCRIPT_FILENAME,"w")
-                f.write(collectNWDataGUIResources.script_data)
-                f.close()
-                os.chmod("./"+SCRIPT_FILENAME, 0755)     # make script executable 
-                    
-        if not os.path.exists(LOGO_FILENAME):
-            if not installingMessageWritten:
-                print installingMessage
-                installingMessageWritten=True
-            print (_('Creating file %s')) % (LOGO_FILENAME)
-            f=open(LOGO_FILENAME,"wb")
-            f.write(collectNWDataGUIResources.image_data)
-            f.close()
+            filesToInstall.append((SCRIPT_FILENAME, 'script_data', 0755))
+        filesToInstall.append((LOGO_FILENAME, 'image_data', 0644))
+        filesToInstall.append((PEXPECT_LIC, 'pexpect_lic', 0644))
 
-        if not os.path.exists(PEXPECT_LIC):
+        for (fileName, resource, mode) in filesToInstall:      # resources are only decoded if they have to be written
+            if os.path.exists(fileName) and fileHash(fileName) == collectNWDataGUIResources.store.hash(resource):
+                continue
             if not installingMessageWritten:
                 print installingMessage
                 installingMessageWritten=True
-            print (_('Creating file %s')) % (PEXPECT_LIC)
-            f=open(PEXPECT_LIC,"wb")
-            f.write(collectNWDataGUIResources.pexpect_lic)
-            f.close()
-    
-        homeDir=os.path.expanduser('~')        
-    
+            print (_('Creating file %s')) % (fileName)
+            writeFileAtomic(fileName, collectNWDataGUIResources.store.get(resource), mode)
+            collectNWDataGUIResources.store.release(resource)
+
         desktopFound, desktopFile=self.getDesktopFilename()
-                
-        if desktopFile:            
-            if not os.path.exists(desktopFile):    
-                if not installingMessageWritten:
-                    print installingMessage
-                    installingMessageWritten=True
-        
+
         if not desktopFound:
             print (_('Unable to create desktop start icon'))
 
-        print (_('Creating file %s')) % (desktopFile)
-        result=''
-        for line in collectNWDataGUIResources.desktop_data.split('\n'):
+        desktopData=''
+        for line in collectNWDataGUIResources.store.get('desktop_data').split('\n'):
            line=line.replace('§',os.getcwd())
-           result+=line+'\n'
-        
-        f=open(desktopFile,"w")
-        f.write(result)
-        f.close()
-        os.chmod(desktopFile, 0755)    
+           desktopData+=line+'\n'
+        collectNWDataGUIResources.store.release('desktop_data')
+
+        if not (os.path.exists(desktopFile) and fileHash(desktopFile) == hashlib.sha1(desktopData).hexdigest()):
+            if not installingMessageWritten:
+                print installingMessage
+                installingMessageWritten=True
+            print (_('Creating file %s')) % (desktopFile)
+            writeFileAtomic(desktopFile, desktopData, 0755)
 
         shellName=os.path.splitext(sys.argv[0])[0]+".sh"    # make me executable
-        if os.path.exists(shellName):
+        if os.path.exists(shellName) and not os.access(shellName, os.X_OK):
             os.chmod(shellName, 0755)
 
         if installingMessageWritten:
@@ -518,11 +751,7 @@ class CollectNWDataGUI:
     def debugMessage(self,message):
 #        print datetime.datetime.now().strftime("%H:%M:%S.%f")+" - " + message
         if self.debugGUIEnabled:
-            textbuffer = self.debugView.get_buffer()
-            textbuffer.insert(textbuffer.get_end_iter(), datetime.datetime.now().strftime("%H:%M:%S.%f")+" - " + message+'\n')
-            self.debugView.scroll_to_mark(textbuffer.get_insert(), 0)
-            while gtk.events_pending():
-                gtk.mainiteration(gtk.FALSE)
+            self.debugLog.push(message)
 
     def setProcessingMessage(self,message):
         self.statusInfo.push(self.statusInfo.get_context_id("a"), message)
@@ -625,6 +854,13 @@ class CollectNWDataGUI:
 
         self.debugView=self.glade.get_object("debugView")
         self.debugView.modify_font(pango.FontDescription("courier 10"))
+
+        self.reportAppender=TextViewAppender(self.reportView)
+        self.detailsLoader=ResultFileLoader(self.detailsView, self.glade.get_object("detailsViewWindow"))
+        if self.opts['LOG']:
+            self.debugLog=DebugLog(self.debugView, spiller=DebugLogSpiller(self.getLogFile(), self.ERR_FILE_LOCK))
+        else:
+            self.debugLog=DebugLog(self.debugView)
      
         self.noteBook=self.glade.get_object("notebook1")
         self.reportPage=self.noteBook.get_nth_page(0)
@@ -665,6 +901,8 @@ class CollectNWDataGUI:
         self.debugOptionEnabled=True
         self.cancelButton=False
         self.cancelButtonInProgress=False
+        self.quitRequested=False        # GUI was closed while the script was running
+        self.outputWatch=None
         self.internationalPostingSelected=True
         self.connectionType=0   # 0=WLAN, 1=WIRED
         self.topologyComboListItems=[[_('WLAN Accesspoint <-> Client'),_('WLAN Hardwarerouter <-> Client'),_('WLAN Accesspoint <-> LinuxRouter <-> Client'),_('WLAN Hardwarerouter <-> LinuxRouter <-> Client')],
@@ -676,10 +914,12 @@ class CollectNWDataGUI:
         self.ssid=""
         self.rootPassword=None
         self.rootSelected=True                       
+        self.privilegedHelper=None      # root helper started with the first privileged command
 
         self.glade = gtk.Builder()
         self.glade.set_translation_domain('collectNWDataGUI')
-        self.glade.add_from_string(self.GLADEXML)
+        self.glade.add_from_string(collectNWDataGUIResources.store.get('glade_data'))
+        collectNWDataGUIResources.store.release('glade_data')
 
 #        if  self.opts['ROOT']:
 #            self.glade.get_object("rootButton").set_sensitive(True)
@@ -812,12 +1052,7 @@ class CollectNWDataGUI:
         if self.process != None:
             self.debugMessage("cancelProgress")
             self.process.close(force=True)
-            self.setProcessingMessage(_('Processing canceled'))
-        
-    def on_MainWindow_delete_event(self, widget, event):
-        self.cancelProcess()
-        self.cleanUpFilesystem()
-        gtk.main_quit()
+            self.setProcessingMessage(_('Processing canceled'))    # scriptFinished is called when the canceled script terminated
 
 #    misc event handling routines
 
@@ -852,7 +1087,12 @@ class CollectNWDataGUI:
     def cancelButtonClicked(self,widget, data=None):
         self.debugMessage("cancelButtonClicked")
         self.cancelButton=True
-        self.cancelProcess()
+        if gtk.main_level() > 1:        # script is running, okButtonClicked quits when the nested main loop was left
+            self.quitRequested=True
+            self.cancelButtonInProgress=True
+            self.cancelProcess()
+            return
+        self.stopPrivilegedHelper()
         gtk.main_quit()
         
     def cancelButtonClickedInProgress(self,widget, data=None):
@@ -900,10 +1140,37 @@ class CollectNWDataGUI:
 
     def cleanupOutputFiles(self):
         self.setProcessingMessage(_('Cleaning output files'))        
-        command=CommandExecutor("./" + SCRIPT_FILENAME,"-g -a", self.rootPassword)
-        (output,status)=command.execute()
+        (output,status)=self.executeCommandAsRoot("./" + SCRIPT_FILENAME + " -g -a")
         self.debugMessage("Cleanup RC: %s" % (status) )
 
+#    root commands are passed to the privileged helper if it's running already
+
+    def executeCommandAsRoot(self,command):
+        if self.privilegedHelper is not None and self.privilegedHelper.isalive():
+            return self.privilegedHelper.call(command)
+        return CommandExecutor(command,password=self.rootPassword,pipes=True).execute()
+
+#    start the root helper once per session. Returns the su exit code
+
+    def startPrivilegedHelper(self):
+        if self.privilegedHelper is not None and self.privilegedHelper.isalive():
+            return 0
+        self.debugMessage('Starting privileged helper')
+        helper=PrivilegedHelper(self.rootPassword,debug=self.debugScriptEnabled)
+        exitCode=helper.start()
+        self.debugMessage('Privileged helper RC: %s' % (exitCode))
+        if exitCode != 0:
+            self.errLog=[helper.errors()]
+            return exitCode
+        self.privilegedHelper=helper
+        return 0
+
+    def stopPrivilegedHelper(self):
+        if self.privilegedHelper is not None:
+            self.debugMessage('Stopping privileged helper')
+            self.privilegedHelper.stop()
+            self.privilegedHelper=None
+
     def ssidEntered(self, widget, entry):
         self.ssid = entry.get_text()
 
@@ -946,7 +1213,9 @@ class CollectNWDataGUI:
 
         rootPasswordEntered=False
         if self.rootSelected:
-            if not INVOKED_AS_ROOT:
+            if self.privilegedHelper is not None and self.privilegedHelper.isalive():
+                rootPasswordEntered=True    # root helper authenticated already
+            elif not INVOKED_AS_ROOT:
                 rootPasswordEntered=self.promptForRootPassword()
             else:
                 rootPasswordEntered=True    # I'm already root
@@ -967,7 +1236,7 @@ class CollectNWDataGUI:
                 self.startOver()                        
                 self.debugMessage('handleScriptInvocation - Exit - False')
                 return False
-            elif exitCode > 1:     # script error
+            elif exitCode > 1 and not self.cancelButtonInProgress:     # script error, canceled scripts terminate with 128+signal
                 self.setProcessingMessage(_('Error running collectNWData.sh ExitCode %s') % (exitCode))
                 error=self.glade.get_object("shellerrordialog")
                 error.format_secondary_text("ExitCode %s" % (exitCode))
@@ -1006,16 +1275,7 @@ class CollectNWDataGUI:
             self.debugMessage('handleScriptResults - Exit')        
             return
         
-        inputFile=open('./'+SCRIPT_RESULTFILE,'r')
-        textbuffer = self.detailsView.get_buffer()
-
-        for line in inputFile:
-            textbuffer.insert(textbuffer.get_end_iter(), line)
-            self.detailsView.scroll_to_mark(textbuffer.get_insert(), 0)
-#            time.sleep(.05)
-            while gtk.events_pending():
-                gtk.mainiteration(gtk.FALSE)
-        inputFile.close()
+        self.detailsLoader.load('./'+SCRIPT_RESULTFILE)      # remaining sections are loaded when scrolled to
 
 #        Scroll top top of window
 
@@ -1035,11 +1295,7 @@ class CollectNWDataGUI:
         self.setProcessingMessage(_('Copying detailed analysis result into clipboard'))
 
         clipboard = gtk.clipboard_get()
-        textbuffer=self.detailsView.get_buffer()
-        startiter, enditer = textbuffer.get_bounds()
-        textbuffer.select_range(startiter,enditer)
-        textbuffer.copy_clipboard(clipboard)
-        textbuffer.place_cursor(startiter)  # remove selection
+        clipboard.set_text(self.detailsLoader.getText())    # whole file, not only the sections loaded so far
         clipboard.store()
 
         window = gtk.Window()
@@ -1083,7 +1339,14 @@ class CollectNWDataGUI:
 #        scriptCall.extend(parameters.split(' '))
 #        commandToExecute=command+'"'+ ' '.join(scriptCall)+'"'
 
-        self.process=CommandExecutor(command, parameters=parameters, password=self.rootPassword,async=True,debug=self.debugScriptEnabled)
+        if rootPasswordEntered and not INVOKED_AS_ROOT:
+            exitCode=self.startPrivilegedHelper()
+            if exitCode != 0:                   # invalid password
+                self.debugMessage('executeShellScript - Exit: rc: %s' % (exitCode))
+                return exitCode
+            self.process=PrivilegedCommand(self.privilegedHelper, command + " " + parameters, debug=self.debugScriptEnabled)
+        else:
+            self.process=CommandExecutor(command, parameters=parameters, async=True,debug=self.debugScriptEnabled,pipes=True)
 
         self.debugMessage("Parameters: " + parameters)        
         self.setProcessingMessage(_('Running collectNWData.sh'))
@@ -1096,50 +1359,46 @@ class CollectNWDataGUI:
 
         self.progresswindow.set_title(self.windowTitle)
         self.progresswindow.show()
-        self.timer = gobject.timeout_add (10, progressTimeout, self.progressbar)
+        self.timer = gobject.timeout_add (100, progressTimeout, self.progressbar)
         
         cancelButton=self.progresswindow.action_area.get_children()[0]
         cancelButton.connect("clicked", self.cancelButtonClickedInProgress)
 
-        textbuffer = self.reportView.get_buffer()
-
         self.setProcessingMessage(_('Reading screen output from collectNWData.sh'))
-        
+
         self.errLog=[]
 
-        while self.process.isalive():
-            try:
-                line=self.process.read_nonblocking(size=1000,timeout=0).strip('\r')
-                self.errLog.append(line)
-                if len(self.errLog) > 3:
-                    self.errLog=self.errLog[1:]
-                self.debugMessage("line - %s" % line)                
-                textbuffer.insert(textbuffer.get_end_iter(), line)
-                self.reportView.scroll_to_mark(textbuffer.get_insert(), 0)
-            except pexpect.TIMEOUT:
-                pass
-            except pexpect.EOF:
-                break
-             
-            while gtk.events_pending():
-                gtk.mainiteration(gtk.FALSE)
-                
-        exitCode=self.process.getStatus()
+        # output is consumed by scriptOutputAvailable whenever the pty becomes readable,
+        # the nested main loop is left by scriptFinished when the script terminates
+
+        self.outputWatch=gobject.io_add_watch(self.process.fileno(),
+                                              gobject.IO_IN | gobject.IO_HUP | gobject.IO_ERR | gobject.IO_NVAL,
+                                              self.scriptOutputAvailable)
+        gtk.main()
+
+        (exitCode,usage)=self.process.getStatus(usage=True)
         self.setProcessingMessage(_('Finished script execution'))
         self.debugMessage("collectNWData.sh RC: %s" % exitCode)
-        if exitCode > 1 and exitCode != 125:
-            self.errLog = self.process.before().strip('\r') + '\n --- ' + self.process.after().strip('\r')
+        self.writeUsage(command + " " + parameters, exitCode, usage)
+        errors=self.process.errors().splitlines() if isinstance(self.process,CommandExecutor) else []
+        for line in errors:         # stderr is available separately if the script was run with pipes, warnings included
+            self.debugMessage("stderr - %s" % line)
+        if exitCode > 1 and exitCode != 125 and not self.cancelButtonInProgress:
+            if errors:
+                self.errLog = errors
+            else:
+                self.errLog = [self.process.before().strip('\r'), ' --- ' + self.process.after().strip('\r')]
 
         self.debugMessage("line f - now starts")                            
         try:
             lines=self.process.readlines()
             for line in lines:
                 self.debugMessage("line f - %s" % line)                
-                textbuffer.insert(textbuffer.get_end_iter(), line.strip('\r'))
-                self.reportView.scroll_to_mark(textbuffer.get_insert(), 0)
+                self.reportAppender.append(line.strip('\r'))
         except ValueError,ex:      # process canceled or invalid pwd
             self.debugMessage("Value error %s" % (ex))
             pass
+        self.reportAppender.flush()
 
         self.glade.get_object("cancelButton").set_sensitive(True)
                 
@@ -1148,8 +1407,49 @@ class CollectNWDataGUI:
 
         self.debugMessage('executeShellScript - Exit: rc: %s' % (exitCode))
 
-        return exitCode        
-    
+        return exitCode
+
+#    resource usage of the script run is logged and written into a sidecar file of the result file
+
+    def writeUsage(self, commandLine, exitCode, usage):
+        if usage is None:
+            return
+        self.debugMessage("collectNWData.sh usage: wall %(wallTime)ss user %(userTime)ss system %(systemTime)ss maxRSS %(maxRSS)sKB read %(bytesRead)s bytes" % collections.defaultdict(lambda: '-', usage))
+        record=dict(usage, command=commandLine, exitCode=exitCode, root=self.rootSelected,
+                    finished=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        try:
+            writeFileAtomic(SCRIPT_USAGEFILE, json.dumps(record, sort_keys=True) + "\n", 0644)
+        except (IOError, OSError), ex:
+            self.debugMessage("Unable to write %s: %s" % (SCRIPT_USAGEFILE, ex))
+
+#    io watch callback which reads available script output
+
+    def scriptOutputAvailable(self, fd, condition):
+
+        if condition & gobject.IO_IN:
+            try:
+                while True:                 # the privileged helper may have delivered output and exit together
+                    line=self.process.read_nonblocking(size=1000,timeout=0).strip('\r')
+                    self.errLog.append(line)
+                    if len(self.errLog) > 3:
+                        self.errLog=self.errLog[1:]
+                    self.debugMessage("line - %s" % line)
+                    self.reportAppender.append(line)
+            except pexpect.TIMEOUT:
+                return True                 # keep watching
+            except (pexpect.EOF, ValueError):   # ValueError: process canceled
+                pass
+
+        self.scriptFinished()
+        return False                        # remove watch
+
+#    called when the script terminated or was canceled
+
+    def scriptFinished(self):
+        self.debugMessage('scriptFinished')
+        self.outputWatch=None
+        gtk.main_quit()                     # leave nested main loop of executeShellScript
+
     def ssidRequiredAndInserted(self):
         
         if self.connectionType==0 and self.ssid=="":  # wireless and ssid missing
@@ -1167,7 +1467,7 @@ class CollectNWDataGUI:
 
         try:
             self.debugMessage("Cleaning up filesystem")
-            (output,exitCode) = CommandExecutor("bash ./" + SCRIPT_FILENAME + " -g -k",password=self.rootPassword).execute()
+            (output,exitCode) = self.executeCommandAsRoot("bash ./" + SCRIPT_FILENAME + " -g -k")
             self.debugMessage("Cleaning up filesystem RC: %s" % (exitCode))
         except Exception,ex:
             self.debugMessage("Cleaning up filesystem: Exception occured %s" % (ex))
@@ -1201,23 +1501,23 @@ class CollectNWDataGUI:
         # clean output area 
 
         self.debugMessage('Cleaning output area')        
-        textbuffer = self.reportView.get_buffer()
-        textbuffer.delete(textbuffer.get_start_iter(),textbuffer.get_end_iter())        
-        textbuffer = self.detailsView.get_buffer()
-        textbuffer.delete(textbuffer.get_start_iter(),textbuffer.get_end_iter())        
+        self.reportAppender.clear()
+        self.detailsLoader.clear()
     
         if self.handleScriptInvocation():
             self.handleScriptResults()
         else:
             self.debugMessage('Cleaning output area')        
-            textbuffer = self.reportView.get_buffer()
-            textbuffer.delete(textbuffer.get_start_iter(),textbuffer.get_end_iter())        
-            textbuffer = self.detailsView.get_buffer()
-            textbuffer.delete(textbuffer.get_start_iter(),textbuffer.get_end_iter())
+            self.reportAppender.clear()
+            self.detailsLoader.clear()
             self.debugMessage("Final processing. Cancel detected")
             
         self.cleanupFileSystem()
         self.startOver()        
+
+        if self.quitRequested:
+            self.stopPrivilegedHelper()
+            gtk.main_quit()
     
 def main():
                           
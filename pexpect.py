@@ -68,6 +68,8 @@ try:
     import select
     import string
     import re
+    import sre_parse
+    import sre_constants
     import struct
     import resource
     import types
@@ -86,9 +88,12 @@ support it. Pexpect is intended for UNIX-like operating systems.""")
 
 __version__ = '2.3'
 __revision__ = '$Revision: 399 $'
-__all__ = ['ExceptionPexpect', 'EOF', 'TIMEOUT', 'spawn', 'run', 'which',
+__all__ = ['ExceptionPexpect', 'EOF', 'TIMEOUT', 'spawn', 'spawn_multiplexer', 'run', 'which',
     'split_command_line', '__version__', '__revision__']
 
+BULK_READ_SIZE = 65536 # bytes read at once when draining the output of a child
+STRING_TRIE_MIN_STRINGS = 16 # searcher_string uses a _string_trie for at least this many strings
+
 # Exception classes used by this module.
 class ExceptionPexpect(Exception):
 
@@ -391,6 +396,7 @@ class spawn (object):
         self.exitstatus = None
         self.signalstatus = None
         self.status = None # status returned by os.waitpid
+        self.rusage = None # resource usage of the child returned by os.wait4
         self.flag_eof = False
         self.pid = None
         self.child_fd = -1 # initially closed
@@ -854,15 +860,22 @@ class spawn (object):
 
         if size == 0:
             return ''
+        if self.delimiter is EOF:
+            # Read directly into the buffer, there is nothing to search for.
+            if size < 0:
+                return self.__read_all()
+            while len(self.buffer) < size:
+                if not self.__fill_buffer(max(self.maxread, size - len(self.buffer))):
+                    break
+            result = self.buffer[:size]
+            self.buffer = self.buffer[size:]
+            self.before = result
+            self.after = EOF if not self.buffer and self.flag_eof else ''
+            return result
         if size < 0:
-            self.expect (self.delimiter) # delimiter default is EOF
+            self.expect (self.delimiter)
             return self.before
 
-        # I could have done this more directly by not using expect(), but
-        # I deliberately decided to couple read() to expect() so that
-        # I would catch any bugs early and ensure consistant behavior.
-        # It's a little less efficient, but there is less for me to
-        # worry about if I have to later modify read() or expect().
         # Note, it's OK if size==-1 in the regex. That just means it
         # will never match anything in which case we stop only on EOF.
         cre = re.compile('.{%d}' % size, re.DOTALL)
@@ -884,12 +897,60 @@ class spawn (object):
 
         if size == 0:
             return ''
-        index = self.expect (['\r\n', self.delimiter]) # delimiter default is EOF
+        if self.delimiter is EOF:
+            # Scan the buffer for the line end and read only if there is none.
+            searchstart = 0
+            while True:
+                n = self.buffer.find('\r\n', searchstart)
+                if n >= 0:
+                    line = self.buffer[:n+2]
+                    self.buffer = self.buffer[n+2:]
+                    self.before = line[:-2]
+                    self.after = '\r\n'
+                    return line
+                searchstart = max(0, len(self.buffer) - 1)
+                if not self.__fill_buffer(self.maxread):
+                    line = self.buffer
+                    self.buffer = ''
+                    self.before = line
+                    self.after = EOF
+                    return line
+        index = self.expect (['\r\n', self.delimiter])
         if index == 0:
             return self.before + '\r\n'
         else:
             return self.before
 
+    def __fill_buffer(self, size):
+
+        """This appends up to size bytes read from the child to the buffer.
+        This returns False if EOF was hit. A TIMEOUT is raised as by
+        read_nonblocking(), the buffer keeps all data read so far. """
+
+        try:
+            self.buffer = self.buffer + self.read_nonblocking(size, self.timeout)
+        except EOF:
+            return False
+        return True
+
+    def __read_all(self):
+
+        """This reads until EOF in large blocks. All data is joined once. """
+
+        chunks = [self.buffer]
+        try:
+            while True:
+                chunks.append(self.read_nonblocking(BULK_READ_SIZE, self.timeout))
+        except EOF:
+            pass
+        except TIMEOUT:
+            self.buffer = ''.join(chunks)
+            raise
+        self.buffer = ''
+        self.before = ''.join(chunks)
+        self.after = EOF
+        return self.before
+
     def __iter__ (self):    # File-like object.
 
         """This is to support iterators over a file-like object.
@@ -909,9 +970,17 @@ class spawn (object):
 
     def readlines (self, sizehint = -1):    # File-like object.
 
-        """This reads until EOF using readline() and returns a list containing
-        the lines thus read. The optional "sizehint" argument is ignored. """
-
+        """This reads until EOF and returns a list containing the lines thus
+        read. The optional "sizehint" argument is ignored. """
+
+        if self.delimiter is EOF:
+            # Drain everything in large blocks and split it in one pass.
+            lines = self.__read_all().split('\r\n')
+            last = lines.pop()
+            lines = [line + '\r\n' for line in lines]
+            if last:
+                lines.append(last)
+            return lines
         lines = []
         while True:
             line = self.readline()
@@ -1091,7 +1160,7 @@ class spawn (object):
         is still alive until its output is read. """
 
         if self.isalive():
-            pid, status = os.waitpid(self.pid, 0)
+            pid, status, self.rusage = os.wait4(self.pid, 0)
         else:
             raise ExceptionPexpect ('Cannot wait for dead child process.')
         self.exitstatus = os.WEXITSTATUS(status)
@@ -1129,7 +1198,7 @@ class spawn (object):
             waitpid_options = os.WNOHANG
 
         try:
-            pid, status = os.waitpid(self.pid, waitpid_options)
+            pid, status, self.rusage = os.wait4(self.pid, waitpid_options)
         except OSError, e: # No child processes
             if e[0] == errno.ECHILD:
                 raise ExceptionPexpect ('isalive() encountered condition where "terminated" is 0, but there was no child process. Did someone else call waitpid() on our process?')
@@ -1141,7 +1210,7 @@ class spawn (object):
         # report, and the value of status is undefined.
         if pid == 0:
             try:
-                pid, status = os.waitpid(self.pid, waitpid_options) ### os.WNOHANG) # Solaris!
+                pid, status, self.rusage = os.wait4(self.pid, waitpid_options) ### os.WNOHANG) # Solaris!
             except OSError, e: # This should never happen...
                 if e[0] == errno.ECHILD:
                     raise ExceptionPexpect ('isalive() encountered condition that should never happen. There was no child process. Did someone else call waitpid() on our process?')
@@ -1359,15 +1428,17 @@ class spawn (object):
         if searchwindowsize == -1:
             searchwindowsize = self.searchwindowsize
 
+        # incoming is a bytearray which grows in place (amortized), the searchers
+        # only look at the fresh data plus the overlap of the longest pattern
         try:
-            incoming = self.buffer
+            incoming = bytearray(self.buffer)
             freshlen = len(incoming)
             while True: # Keep reading until exception or return.
                 index = searcher.search(incoming, freshlen, searchwindowsize)
                 if index >= 0:
-                    self.buffer = incoming[searcher.end : ]
-                    self.before = incoming[ : searcher.start]
-                    self.after = incoming[searcher.start : searcher.end]
+                    self.buffer = str(incoming[searcher.end : ])
+                    self.before = str(incoming[ : searcher.start])
+                    self.after = str(incoming[searcher.start : searcher.end])
                     self.match = searcher.match
                     self.match_index = index
                     return self.match_index
@@ -1377,13 +1448,12 @@ class spawn (object):
                 # Still have time left, so read more data
                 c = self.read_nonblocking (self.maxread, timeout)
                 freshlen = len(c)
-                time.sleep (0.0001)
-                incoming = incoming + c
+                incoming += c
                 if timeout is not None:
                     timeout = end_time - time.time()
         except EOF, e:
             self.buffer = ''
-            self.before = incoming
+            self.before = str(incoming)
             self.after = EOF
             index = searcher.eof_index
             if index >= 0:
@@ -1395,8 +1465,8 @@ class spawn (object):
                 self.match_index = None
                 raise EOF (str(e) + '\n' + str(self))
         except TIMEOUT, e:
-            self.buffer = incoming
-            self.before = incoming
+            self.buffer = str(incoming)
+            self.before = self.buffer
             self.after = TIMEOUT
             index = searcher.timeout_index
             if index >= 0:
@@ -1408,7 +1478,7 @@ class spawn (object):
                 self.match_index = None
                 raise TIMEOUT (str(e) + '\n' + str(self))
         except:
-            self.before = incoming
+            self.before = str(incoming)
             self.after = None
             self.match = None
             self.match_index = None
@@ -1578,6 +1648,116 @@ class spawn (object):
 # End of spawn class
 ##############################################################################
 
+class spawn_multiplexer (object):
+
+    """This watches any number of spawn instances with one poll() or epoll()
+    system call per wakeup. Example::
+
+        mux = pexpect.spawn_multiplexer()
+        for host in hosts:
+            mux.register(pexpect.spawn('ssh', [host, 'collectNWData.sh']))
+        while len(mux) > 0:
+            for child, event, data in mux.poll():
+                if event == pexpect.spawn_multiplexer.READ:
+                    output[child] += data
+                elif event == pexpect.spawn_multiplexer.EXIT:
+                    status[child] = data
+
+    The events of a child are READ with the data read, EOF and finally EXIT
+    with the exit status (None if the child was killed by a signal, see
+    signalstatus of the spawn instance). A child is unregistered after its
+    EXIT event. The data is passed to the logfiles of the child like in
+    read_nonblocking(), but is not added to its buffer. """
+
+    READ = 'read'
+    EOF = 'eof'
+    EXIT = 'exit'
+
+    def __init__(self, use_epoll=None):
+
+        """This creates an empty multiplexer. epoll is used if use_epoll is
+        True or if it is None and the platform has epoll, poll otherwise. """
+
+        if use_epoll is None:
+            use_epoll = hasattr(select, 'epoll')
+        self._epoll = use_epoll
+        if use_epoll:
+            self._poller = select.epoll()
+            self._mask = select.EPOLLIN | select.EPOLLPRI | select.EPOLLHUP | select.EPOLLERR
+        else:
+            self._poller = select.poll()
+            self._mask = select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLERR
+        self._children = {} # child_fd -> spawn
+
+    def __len__(self):
+
+        return len(self._children)
+
+    def children(self):
+
+        return self._children.values()
+
+    def register(self, child):
+
+        self._children[child.child_fd] = child
+        self._poller.register(child.child_fd, self._mask)
+
+    def unregister(self, child):
+
+        if self._children.get(child.child_fd) is child:
+            self._poller.unregister(child.child_fd)
+            del self._children[child.child_fd]
+
+    def close(self):
+
+        if self._epoll:
+            self._poller.close()
+
+    def poll(self, timeout=None, size=None):
+
+        """This waits up to timeout seconds (forever if None) until at least
+        one child is readable or hung up and returns a list of (child, event,
+        data) tuples. An empty list is returned on timeout. At most size
+        bytes (default BULK_READ_SIZE) are read per readable child. """
+
+        if size is None:
+            size = BULK_READ_SIZE
+        while True:
+            try:
+                if self._epoll:
+                    ready = self._poller.poll(-1 if timeout is None else timeout)
+                else:
+                    ready = self._poller.poll(None if timeout is None else int(timeout * 1000))
+                break
+            except (select.error, IOError), e:
+                if e[0] != errno.EINTR:
+                    raise
+        events = []
+        for fd, mask in ready:
+            child = self._children.get(fd)
+            if child is None:
+                continue
+            try:
+                s = os.read(fd, size)
+            except OSError, e: # Linux raises EIO if the slave side was closed
+                s = ''
+            if s:
+                if child.logfile is not None:
+                    child.logfile.write (s)
+                    child.logfile.flush()
+                if child.logfile_read is not None:
+                    child.logfile_read.write (s)
+                    child.logfile_read.flush()
+                events.append((child, self.READ, s))
+                continue
+            # The waitpid() is only done once the child hung up.
+            child.flag_eof = True
+            self.unregister(child)
+            events.append((child, self.EOF, None))
+            child.isalive()
+            events.append((child, self.EXIT, child.exitstatus))
+        return events
+
 class searcher_string (object):
 
     """This is a plain string search helper for the spawn.expect_any() method.
@@ -1611,6 +1791,9 @@ class searcher_string (object):
                 self.timeout_index = n
                 continue
             self._strings.append((n, s))
+        self._trie = None
+        if len(self._strings) >= STRING_TRIE_MIN_STRINGS and '' not in [s for n, s in self._strings]:
+            self._trie = _string_trie(self._strings)
 
     def __str__(self):
 
@@ -1639,9 +1822,22 @@ class searcher_string (object):
         If there is a match this returns the index of that string, and sets
         'start', 'end' and 'match'. Otherwise, this returns -1. """
 
+        if self._trie is not None:
+            if searchwindowsize is None:
+                offset = len(buffer) - freshlen - self._trie.maxlen
+            else:
+                offset = len(buffer) - searchwindowsize
+            found = self._trie.search(buffer, max(0, offset))
+            if found is None:
+                return -1
+            self.start, best_index, self.match = found
+            self.end = self.start + len(self.match)
+            return best_index
+
         absurd_match = len(buffer)
         first_match = absurd_match
 
+        # 'buffer' may be a str or a bytearray.
         # 'freshlen' helps a lot here. Further optimizations could
         # possibly include:
         #
@@ -1653,6 +1849,8 @@ class searcher_string (object):
         # rescanning until we've read three more bytes.
         #
         # Sadly, I don't know enough about this interesting topic. /grahn
+        #
+        # Many strings are searched at once with _string_trie, see above.
         
         for index, s in self._strings:
             if searchwindowsize is None:
@@ -1673,6 +1871,52 @@ class searcher_string (object):
         self.end = self.start + len(self.match)
         return best_index
 
+class _string_trie (object):
+
+    """This finds the earliest occurrence of any of a list of (index, string)
+    tuples in one pass over the buffer. The strings are merged into a prefix
+    tree which is compiled into one regular expression, so the scan runs in
+    the re module and its cost hardly depends on the number of strings. Of
+    matches with the same start the one with the lowest index is returned
+    like searcher_string does. """
+
+    def __init__(self, strings):
+
+        self.maxlen = max([len(s) for n, s in strings])
+        self._strings = strings
+        trie = {}
+        for n, s in strings:
+            node = trie
+            for c in s:
+                node = node.setdefault(c, {})
+            node[''] = None # end of a string
+        self._re = re.compile(self._pattern(trie))
+
+    def _pattern(self, node):
+
+        alternatives = [re.escape(c) + self._pattern(child) for c, child in sorted(node.items()) if c != '']
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and '' not in node:
+            return alternatives[0]
+        pattern = '(?:' + '|'.join(alternatives) + ')'
+        if '' in node:
+            pattern = pattern + '?'
+        return pattern
+
+    def search(self, buffer, offset):
+
+        """This returns (start, index, string) of the earliest match at or
+        after offset or None. """
+
+        match = self._re.search(buffer, offset)
+        if match is None:
+            return None
+        start = match.start()
+        for n, s in self._strings:
+            if buffer.startswith(s, start):
+                return (start, n, s)
+
 class searcher_re (object):
 
     """This is regular expression string search helper for the
@@ -1709,6 +1953,16 @@ class searcher_re (object):
                 self.timeout_index = n
                 continue
             self._searches.append((n, s))
+        # Number of bytes of already searched data which have to be searched
+        # again together with fresh data. None if a match can be arbitrarily
+        # long or depends on text outside of the match.
+        self._overlap = 0
+        for n, s in self._searches:
+            width = _max_match_width(s)
+            if width is None:
+                self._overlap = None
+                break
+            self._overlap = max(self._overlap, width - 1)
 
     def __str__(self):
 
@@ -1738,14 +1992,23 @@ class searcher_re (object):
 
         absurd_match = len(buffer)
         first_match = absurd_match
-        # 'freshlen' doesn't help here -- we cannot predict the
-        # length of a match, and the re module provides no help.
-        if searchwindowsize is None:
+        # 'freshlen' helps if the length of a match is bounded: a match can
+        # only start in the fresh data or in the overlap before it.
+        if searchwindowsize is not None:
+            searchstart = max(0, len(buffer)-searchwindowsize)
+        elif self._overlap is not None:
+            searchstart = max(0, len(buffer)-freshlen-self._overlap)
+        else:
             searchstart = 0
+        # The searched text is a str copy of the window. One byte before the
+        # window is kept for ^ and \b, patterns with lookbehind see the whole buffer.
+        if self._overlap is None:
+            base = 0
         else:
-            searchstart = max(0, len(buffer)-searchwindowsize)
+            base = max(0, searchstart-1)
+        text = str(buffer[base:])
         for index, s in self._searches:
-            match = s.search(buffer, searchstart)
+            match = s.search(text, searchstart-base)
             if match is None:
                 continue
             n = match.start()
@@ -1755,11 +2018,45 @@ class searcher_re (object):
                 best_index = index
         if first_match == absurd_match:
             return -1
-        self.start = first_match
+        self.start = base + first_match
         self.match = the_match
-        self.end = self.match.end()
+        self.end = base + self.match.end()
         return best_index
 
+_match_widths = {} # (pattern, flags) -> maximum match width
+
+def _max_match_width(pattern):
+
+    """This returns the maximum length of a match of the compiled regular
+    expression 'pattern' or None if the length is unbounded or if the pattern
+    looks at text outside of the match (lookahead, lookbehind, backreferences). """
+
+    key = (pattern.pattern, pattern.flags)
+    if key not in _match_widths:
+        try:
+            parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+            width = parsed.getwidth()[1]
+            if _has_context(parsed.data) or width >= sre_constants.MAXREPEAT:
+                width = None
+        except Exception:
+            width = None
+        _match_widths[key] = width
+    return _match_widths[key]
+
+def _has_context(data):
+
+    for item in data:
+        if isinstance(item, (tuple, list)):
+            if item and item[0] in (sre_constants.ASSERT, sre_constants.ASSERT_NOT,
+                                    sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS):
+                return True
+            if _has_context(item):
+                return True
+        elif isinstance(item, sre_parse.SubPattern):
+            if _has_context(item.data):
+                return True
+    return False
+
 def which (filename):
 
     """This takes a given filename; tries to find it in the environment path;